@@ -0,0 +1,62 @@
+"""
+Statements sent by one shortlisted-candidate search as the table grows; it
+stays at two (count + page).
+
+    python -m benchmarks.bench_job_applications [applications ...]
+"""
+
+import time
+
+from benchmarks.common import counts, seed, sqlite_engine
+from models import Candidate, Interviewer, JobApplication, JobPost
+from routers.job_applications import search_job_applications
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+
+def main() -> None:
+    for rows in counts([1_000, 10_000, 100_000]):
+        engine = sqlite_engine()
+        candidates, jobs = max(rows // 10, 1), max(rows // 20, 1)
+        with engine.begin() as connection:
+            seed(connection, Interviewer, 1)
+            seed(connection, Candidate, candidates)
+            seed(connection, JobPost, jobs, interviewer_id=1)
+            seed(
+                connection,
+                JobApplication,
+                rows,
+                candidate_email=lambda i: f"candidate{i % candidates + 1}@example.com",
+                candidate_id=lambda i: i % candidates + 1,
+                job_id=lambda i: i % jobs + 1,
+                interviewer_id=1,
+                status=lambda i: "Shortlisted" if i % 2 else "Applied",
+            )
+
+        statements = []
+        event.listen(
+            engine, "before_cursor_execute", lambda *args: statements.append(args[2])
+        )
+        with sessionmaker(bind=engine)() as db:
+            for search in (None, "Candidate 1"):
+                statements.clear()
+                began = time.perf_counter()
+                result = search_job_applications(
+                    search=search,
+                    status="Shortlisted",
+                    page=2,
+                    limit=10,
+                    cursor=None,
+                    db=db,
+                )
+                elapsed = (time.perf_counter() - began) * 1000
+                print(
+                    f"{rows} applications, search={search!r}: "
+                    f"{len(statements)} statements for {len(result.items)} of "
+                    f"{result.total} results, {elapsed:.1f} ms"
+                )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Page 1 and page 1000 of a seeded table, by keyset and by OFFSET.
+
+    python -m benchmarks.bench_pagination [rows] [page_size] [database_url]
+
+The database defaults to in-memory SQLite; a given one gets (and loses) a
+pagination_benchmark table.
+"""
+
+import sys
+from datetime import datetime, timedelta
+
+from benchmarks.common import best, insert_rows
+from pagination import DEFAULT_PAGE_SIZE, apply_keyset, encode_cursor
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    create_engine,
+    select,
+)
+
+TABLE = Table(
+    "pagination_benchmark",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("created_at", DateTime, nullable=False),
+    Index("ix_pagination_benchmark_created_at_id", "created_at", "id"),
+)
+KEY = (TABLE.c.created_at, TABLE.c.id)
+
+
+def seed_rows(connection, rows: int) -> None:
+    # Several rows share each timestamp, so the id breaks ties. SQLite gets
+    # the text CURRENT_TIMESTAMP defaults store, as in the app.
+    start = datetime(2020, 1, 1)
+    timestamps = (start + timedelta(seconds=i // 4) for i in range(1, rows + 1))
+    if connection.dialect.name == "sqlite":
+        target = Table(
+            TABLE.name, MetaData(), Column("id", Integer), Column("created_at", String)
+        )
+        timestamps = (t.strftime("%Y-%m-%d %H:%M:%S") for t in timestamps)
+    else:
+        target = TABLE
+    insert_rows(
+        connection,
+        target,
+        (
+            {"id": i, "created_at": created_at}
+            for i, created_at in enumerate(timestamps, start=1)
+        ),
+    )
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    page_size = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_PAGE_SIZE
+    engine = create_engine(sys.argv[3] if len(sys.argv) > 3 else "sqlite://")
+
+    with engine.begin() as connection:
+        TABLE.drop(connection, checkfirst=True)
+        TABLE.create(connection)
+        seed_rows(connection, rows)
+        for page in (1, 1000):
+            skipped = (page - 1) * page_size
+            if skipped >= rows:
+                print(f"page {page}: past the end of {rows} rows")
+                continue
+            cursor = None
+            if skipped:
+                last = connection.execute(
+                    select(*KEY)
+                    .order_by(*[column.desc() for column in KEY])
+                    .offset(skipped - 1)
+                    .limit(1)
+                ).one()
+                cursor = encode_cursor(list(last))
+            keyset_statement = apply_keyset(select(TABLE), KEY, cursor, page_size)
+            offset_statement = (
+                select(TABLE)
+                .order_by(*[column.desc() for column in KEY])
+                .offset(skipped)
+                .limit(page_size)
+            )
+            keyset_rows = connection.execute(keyset_statement).all()[:page_size]
+            assert keyset_rows == connection.execute(offset_statement).all()
+            keyset = best(lambda: connection.execute(keyset_statement).all())
+            offset = best(lambda: connection.execute(offset_statement).all())
+            print(
+                f"page {page} of {page_size} rows: keyset {keyset:.2f} ms, "
+                f"offset {offset:.2f} ms"
+            )
+        TABLE.drop(connection)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""
+bcrypt verification time per cost factor, which bounds the logins per
+second each core can serve.
+
+    python -m benchmarks.bench_security [rounds ...]
+"""
+
+import time
+
+from benchmarks.common import counts
+from passlib.context import CryptContext
+from security import PASSWORD_HASH_ROUNDS
+
+
+def main() -> None:
+    for rounds in counts([PASSWORD_HASH_ROUNDS]):
+        context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=rounds)
+        stored = context.hash("benchmark-password")
+        count, start = 0, time.perf_counter()
+        while time.perf_counter() - start < 2 or count < 3:
+            context.verify("benchmark-password", stored)
+            count += 1
+        elapsed = (time.perf_counter() - start) / count
+        print(
+            f"rounds={rounds}: {elapsed * 1000:.1f} ms per verification, "
+            f"{1 / elapsed:.1f} logins/s per core"
+        )
+
+
+if __name__ == "__main__":
+    main()
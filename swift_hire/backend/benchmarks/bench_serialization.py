@@ -0,0 +1,72 @@
+"""
+One page of each fast-path list, validated against its response model vs
+encoded straight from rows by the route's RowSerializer, with and without
+the query.
+
+    python -m benchmarks.bench_serialization [rows ...]
+"""
+
+from typing import List
+
+from benchmarks.common import best, counts, seed, sqlite_engine
+from pydantic import TypeAdapter
+from routers.admin_routes import USER_ROWS
+from routers.candidates import CANDIDATE_ROWS
+from routers.feedback import FEEDBACK_ROWS
+from routers.jobs import JOB_POST_ROWS
+from schemas import CandidateSummary, FeedbackResponse, JobPostResponse, UserResponse
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+LISTS = [
+    (JobPostResponse, JOB_POST_ROWS),
+    (CandidateSummary, CANDIDATE_ROWS),
+    (FeedbackResponse, FEEDBACK_ROWS),
+    (UserResponse, USER_ROWS),
+]
+
+
+def main() -> None:
+    for rows in counts([10_000]):
+        engine = sqlite_engine()
+        with engine.begin() as connection:
+            for _, serializer in LISTS:
+                seed(connection, serializer.model, rows)
+
+        with sessionmaker(bind=engine)() as db:
+            for schema, serializer in LISTS:
+                model = serializer.model
+                adapter = TypeAdapter(List[schema])
+                objects_query = select(model).order_by(model.id.desc())
+                rows_query = serializer.select().order_by(model.id.desc())
+
+                def validate(objects) -> bytes:
+                    return adapter.dump_json(
+                        adapter.validate_python(objects, from_attributes=True)
+                    )
+
+                def validated() -> bytes:
+                    db.expunge_all()
+                    return validate(db.scalars(objects_query).all())
+
+                def fast() -> bytes:
+                    return serializer.dumps(db.execute(rows_query).all())
+
+                objects = db.scalars(objects_query).all()
+                plain_rows = db.execute(rows_query).all()
+                query_timings = (best(validated), best(fast))
+                serialize_timings = (
+                    best(lambda: validate(objects)),
+                    best(lambda: serializer.dumps(plain_rows)),
+                )
+                print(
+                    f"{model.__tablename__:<12} {rows} rows: query + serialize "
+                    f"{query_timings[0]:.0f} ms vs {query_timings[1]:.0f} ms, "
+                    f"serialize only {serialize_timings[0]:.0f} ms vs "
+                    f"{serialize_timings[1]:.0f} ms"
+                )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
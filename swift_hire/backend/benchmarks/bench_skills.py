@@ -0,0 +1,50 @@
+"""
+Job recommendations through the job_skills index, over job posts with
+three of 500 skills each, against loading every post as the endpoint did
+before the index.
+
+    python -m benchmarks.bench_skills [jobs ...]
+"""
+
+import random
+
+from benchmarks.common import best, counts, insert_rows, seed, sqlite_engine
+from models import JobPost, JobSkill
+from skills import normalize_skills, random_jobs, recommend_jobs
+from sqlalchemy.orm import sessionmaker
+
+VOCABULARY = [f"skill {i}" for i in range(500)]
+
+
+def main() -> None:
+    candidate_skills = normalize_skills("Skill 7, skill 42, SKILL 99, skill 404")
+    for jobs in counts([100_000]):
+        engine = sqlite_engine()
+        rng = random.Random(jobs)
+        job_skills = {i: rng.sample(VOCABULARY, 3) for i in range(1, jobs + 1)}
+        with engine.begin() as connection:
+            seed(connection, JobPost, jobs, skills=lambda i: ", ".join(job_skills[i]))
+            insert_rows(
+                connection,
+                JobSkill,
+                (
+                    {"job_id": i, "skill": skill}
+                    for i, skills in job_skills.items()
+                    for skill in skills
+                ),
+            )
+
+        with sessionmaker(bind=engine)() as db:
+            recommended = best(lambda: recommend_jobs(db, candidate_skills, 3))
+            fallback = best(lambda: random_jobs(db, 3))
+            db.expunge_all()
+            everything = best(lambda: db.query(JobPost).all())
+        print(
+            f"{jobs} jobs: recommend_jobs {recommended:.2f} ms, "
+            f"random_jobs {fallback:.2f} ms, loading every post {everything:.0f} ms"
+        )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Seeding and timing shared by the benchmarks. Run them as modules from
+swift_hire/backend, e.g. python -m benchmarks.bench_job_applications
+"""
+
+import sys
+import time
+from typing import Callable, Dict, Iterable, List
+
+from database import Base
+from models import Candidate, Feedback, Interviewer, JobApplication, JobPost, User
+from sqlalchemy import create_engine, insert
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.pool import StaticPool
+
+INTERVIEWER_EMAIL = "interviewer@example.com"
+
+# Column values of the i-th seeded row of each model
+ROWS: Dict[type, Callable[[int], dict]] = {
+    Interviewer: lambda i: {
+        "name": f"Interviewer {i}",
+        "email": INTERVIEWER_EMAIL if i == 1 else f"interviewer{i}@example.com",
+        "expertise": "",
+        "availability": "",
+        "department": "",
+    },
+    User: lambda i: {
+        "name": f"User {i}",
+        "email": f"user{i}@example.com",
+        "password": "x" * 60,
+        "role": "Candidate",
+    },
+    Candidate: lambda i: {
+        "name": f"Candidate {i}",
+        "email": f"candidate{i}@example.com",
+        "skills": "Python, SQL, Docker",
+        "resume": f"uploads/resumes/{i}.pdf",
+        "bio": "Bio " * 50,
+    },
+    JobPost: lambda i: {
+        "title": f"Job {i}",
+        "company": "Company",
+        "location": "Remote",
+        "type": "Full-time",
+        "salary": "100000",
+        "description": "Description " * 50,
+        "skills": "Python, SQL",
+        "interviewer_email": INTERVIEWER_EMAIL,
+    },
+    JobApplication: lambda i: {
+        "candidate_email": f"candidate{i}@example.com",
+        "interviewer_email": INTERVIEWER_EMAIL,
+    },
+    Feedback: lambda i: {
+        "user_email": f"user{i}@example.com",
+        "user_name": f"User {i}",
+        "user_role": "Candidate",
+        "rating": i % 5 + 1,
+        "message": "Message " * 20,
+    },
+}
+
+
+def counts(defaults: List[int]) -> List[int]:
+    """
+    Sizes to run, from the command line or the defaults
+    """
+    return [int(arg) for arg in sys.argv[1:]] or defaults
+
+
+def sqlite_engine() -> Engine:
+    """
+    In-memory SQLite database with the application's tables
+    """
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def seed(connection: Connection, model, count: int, **columns) -> None:
+    """
+    Insert rows 1..count of a model, with ids 1..count. Columns override the
+    defaults in ROWS, given as values or as functions of the row number.
+    """
+    rows = []
+    for i in range(1, count + 1):
+        row = {"id": i, **ROWS[model](i)}
+        for name, value in columns.items():
+            row[name] = value(i) if callable(value) else value
+        rows.append(row)
+    insert_rows(connection, model, rows)
+
+
+def insert_rows(connection: Connection, target, rows: Iterable[dict]) -> None:
+    connection.execute(insert(target), list(rows))
+
+
+def best(run: Callable[[], object], repeat: int = 5) -> float:
+    """
+    Fastest of several runs, in milliseconds
+    """
+    timings = []
+    for _ in range(repeat):
+        began = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - began)
+    return min(timings) * 1000
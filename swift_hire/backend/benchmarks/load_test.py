@@ -0,0 +1,190 @@
+"""
+Closed-loop HTTP load test: each client sends its next request as soon as
+the previous one answers, picking uniformly among a few list and lookup
+reads and a login. Starts the API under uvicorn, seeds it through the API
+and reports throughput and latency for each number of clients.
+
+    python -m benchmarks.load_test --database-url postgresql://...
+
+The defaults are the setup the async session numbers were measured with:
+one uvicorn worker on Postgres, 20 and 200 clients, 20 s per run, with the
+client on the same host. Those predate password hashing; logins now cost
+a bcrypt verification, so set PASSWORD_HASH_ROUNDS=4 to compare with
+them. Pass --url to load a server that is already running and seeded
+instead.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import httpx
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+CANDIDATE_EMAIL = "load-candidate@example.com"
+PASSWORD = "load-password"
+JOB_POSTS = 50
+
+READS = [
+    "/job-posts?limit=20",
+    f"/candidates/{CANDIDATE_EMAIL}/recommended-jobs",
+    f"/saved-jobs/count/{CANDIDATE_EMAIL}",
+    "/api/admin/users?limit=20",
+]
+LOGIN = "LOGIN"
+
+
+def start_server(args: argparse.Namespace) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "DATABASE_URL": args.database_url,
+        "EMAIL_WORKERS": "0",
+        "SECRET_KEY": os.environ.get("SECRET_KEY", "load-test-secret-key"),
+    }
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "main:app",
+            "--app-dir",
+            str(BACKEND_DIR),
+            "--port",
+            str(args.port),
+            "--workers",
+            str(args.workers),
+            "--log-level",
+            "warning",
+        ],
+        # Uploads are written relative to the working directory
+        cwd=tempfile.mkdtemp(prefix="swift_hire_load_"),
+        env=env,
+    )
+
+
+async def wait_until_up(client: httpx.AsyncClient, base: str) -> None:
+    deadline = time.monotonic() + 60
+    while True:
+        try:
+            await client.get(base + "/health")
+            return
+        except httpx.TransportError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.5)
+
+
+async def seed(client: httpx.AsyncClient, base: str) -> None:
+    """
+    A candidate to log in as and look up, and job posts matching their skills
+    """
+    await client.post(
+        base + "/register/candidate",
+        data={
+            "name": "Load Candidate",
+            "email": CANDIDATE_EMAIL,
+            "password": PASSWORD,
+            "skills": "Python, SQL",
+        },
+        files={"resume": ("cv.pdf", b"%PDF load test", "application/pdf")},
+    )
+    for i in range(JOB_POSTS):
+        await client.post(
+            base + "/job-posts",
+            data={
+                "title": f"Load Job {i}",
+                "company": "Company",
+                "location": "Remote",
+                "type": "Full-time",
+                "salary": "100000",
+                "description": "Description " * 50,
+                "skills": "Python, SQL" if i % 2 else "Go",
+                "interviewer_email": "load-interviewer@example.com",
+            },
+        )
+
+
+async def run_clients(base: str, clients: int, seconds: float) -> Dict:
+    stats: Dict = {"ok": 0, "errors": 0, "latencies": []}
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+
+    async def client_loop(client: httpx.AsyncClient, stop: float) -> None:
+        while time.monotonic() < stop:
+            path = random.choice(READS + [LOGIN])
+            began = time.monotonic()
+            try:
+                if path == LOGIN:
+                    response = await client.post(
+                        base + "/login",
+                        data={"email": CANDIDATE_EMAIL, "password": PASSWORD},
+                    )
+                else:
+                    response = await client.get(base + path)
+                ok = response.status_code == 200
+            except httpx.HTTPError:
+                ok = False
+            stats["ok" if ok else "errors"] += 1
+            stats["latencies"].append(time.monotonic() - began)
+
+    async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+        stop = time.monotonic() + seconds
+        await asyncio.gather(*(client_loop(client, stop) for _ in range(clients)))
+    return stats
+
+
+def report(clients: int, seconds: float, stats: Dict) -> str:
+    latencies: List[float] = sorted(stats["latencies"]) or [0.0]
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000
+    return (
+        f"{clients} clients: {stats['ok'] / seconds:.0f} req/s, "
+        f"{stats['errors']} errors, p50 {p50:.0f} ms, p99 {p99:.0f} ms"
+    )
+
+
+async def load(args: argparse.Namespace) -> None:
+    base = args.url or f"http://127.0.0.1:{args.port}"
+    if not args.url:
+        async with httpx.AsyncClient(timeout=30) as client:
+            await wait_until_up(client, base)
+            await seed(client, base)
+    for clients in args.clients:
+        stats = await run_clients(base, clients, args.seconds)
+        print(report(clients, args.seconds, stats), flush=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", help="Load a running, seeded server instead")
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("DATABASE_URL"),
+        help="Database of the server started for the run; use a scratch one",
+    )
+    parser.add_argument("--clients", type=int, nargs="+", default=[20, 200])
+    parser.add_argument("--seconds", type=float, default=20)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    if not args.url and not args.database_url:
+        parser.error("--database-url or --url is required")
+
+    server = None if args.url else start_server(args)
+    try:
+        asyncio.run(load(args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
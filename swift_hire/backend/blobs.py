@@ -0,0 +1,242 @@
+import gzip
+import mimetypes
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import List, Optional, Tuple
+from uuid import uuid4
+
+from conditional import UPSERTS
+from database import SessionLocal
+from fastapi import UploadFile
+from models import Blob
+from sqlalchemy import event, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, sessionmaker
+from starlette.concurrency import run_in_threadpool
+from utils import MAX_FILE_SIZE, StoredUpload, save_upload_file
+
+UPLOAD_DIR = os.getenv("UPLOAD_DIR", "uploads")
+BLOB_DIR = Path(UPLOAD_DIR) / "blobs"
+BLOB_TMP_DIR = BLOB_DIR / "tmp"
+
+# Content types that get a pre-compressed <blob>.gz copy for serving
+UPLOAD_GZIP_TYPES = {
+    content_type.strip()
+    for content_type in os.getenv(
+        "UPLOAD_GZIP_TYPES",
+        "application/pdf,application/msword,application/rtf,text/plain,"
+        "image/svg+xml,image/bmp",
+    ).split(",")
+    if content_type.strip()
+}
+GZIP_SUFFIX = ".gz"
+# Compressed copies that do not save at least this fraction are discarded
+GZIP_MIN_SAVING = 0.1
+
+_EXTENSION = re.compile(r"^\.[a-z0-9]{1,10}$")
+# Session.info keys for blobs to remove when the transaction ends: those it
+# left unreferenced (on commit) and those it created (on rollback)
+_RELEASED_BLOBS = "released_blobs"
+_CREATED_BLOBS = "created_blobs"
+
+
+def blob_path(sha256: str, extension: str = "") -> str:
+    """
+    Sharded location of a blob: uploads/blobs/ab/cd/abcd...<ext>
+    """
+    return (BLOB_DIR / sha256[:2] / sha256[2:4] / f"{sha256}{extension}").as_posix()
+
+
+def _extension(filename: Optional[str]) -> str:
+    suffix = Path(filename or "").suffix.lower()
+    return suffix if _EXTENSION.match(suffix) else ""
+
+
+def _publish(source: Path, destination: str) -> None:
+    # os.replace is atomic, so readers only ever see complete files
+    Path(destination).parent.mkdir(parents=True, exist_ok=True)
+    os.replace(source, destination)
+
+
+def _write_gzip_variant(path: str) -> None:
+    gzip_path = Path(path + GZIP_SUFFIX)
+    temp_path = BLOB_TMP_DIR / uuid4().hex
+    try:
+        with open(path, "rb") as source, gzip.open(temp_path, "wb") as target:
+            shutil.copyfileobj(source, target)
+        if temp_path.stat().st_size <= Path(path).stat().st_size * (
+            1 - GZIP_MIN_SAVING
+        ):
+            os.replace(temp_path, gzip_path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def _blob_key(blob: Blob) -> Tuple[str, str, int]:
+    return blob.sha256, blob.path, blob.size
+
+
+def _insert_blob(db: Session, values: dict) -> bool:
+    """
+    Insert a blob row unless one with the same content exists. Returns
+    whether the row was inserted.
+    """
+    upsert = UPSERTS.get(db.connection().dialect.name)
+    if upsert is None:
+        try:
+            with db.begin_nested():
+                db.execute(insert(Blob).values(**values))
+            return True
+        except IntegrityError:
+            return False
+
+    result = db.execute(
+        upsert(Blob)
+        .values(**values)
+        .on_conflict_do_nothing(index_elements=[Blob.sha256])
+    )
+    return result.rowcount == 1
+
+
+def _reference_blob(
+    db: Session, stored: StoredUpload, filename: Optional[str], content_type: str
+) -> Tuple[Blob, bool]:
+    """
+    Take a reference to the blob row for stored content, creating it if
+    needed. Returns the blob and whether it was created.
+    """
+    values = {
+        "sha256": stored.sha256,
+        "path": blob_path(stored.sha256, _extension(filename)),
+        "size": stored.size,
+        "content_type": content_type or mimetypes.guess_type(filename or "")[0],
+        "refcount": 1,
+    }
+    for _ in range(3):
+        created = _insert_blob(db, values)
+        blob = db.query(Blob).filter(Blob.sha256 == stored.sha256).first()
+        if created:
+            db.info.setdefault(_CREATED_BLOBS, []).append(_blob_key(blob))
+            return blob, True
+        if blob is None:
+            # Removed since the insert found it
+            continue
+
+        # Waits while the blob is being removed, and then finds it gone
+        referenced = (
+            db.query(Blob)
+            .filter(Blob.id == blob.id)
+            .update({Blob.refcount: Blob.refcount + 1}, synchronize_session=False)
+        )
+        if referenced:
+            db.expire(blob, ["refcount"])
+            return blob, False
+        db.expunge(blob)
+
+    raise RuntimeError(f"Could not reference blob {stored.sha256}")
+
+
+async def store_upload(
+    db: AsyncSession, upload_file: UploadFile, max_size: int = MAX_FILE_SIZE
+) -> Blob:
+    """
+    Store an upload by content hash and take a reference to it. Identical
+    content is kept once on disk; the blob row is flushed but committed
+    with the caller's transaction.
+    """
+    temp_path = BLOB_TMP_DIR / uuid4().hex
+    stored = await save_upload_file(upload_file, temp_path.as_posix(), max_size)
+    try:
+        blob, created = await db.run_sync(
+            _reference_blob, stored, upload_file.filename, upload_file.content_type
+        )
+        # Re-publishing identical content is harmless and restores a blob
+        # whose file went missing
+        await run_in_threadpool(_publish, temp_path, blob.path)
+        if created and blob.content_type in UPLOAD_GZIP_TYPES:
+            await run_in_threadpool(_write_gzip_variant, blob.path)
+        return blob
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def release_blob(db: Session, blob_id: Optional[int]) -> None:
+    """
+    Drop a reference to a blob. Point the referencing row elsewhere first.
+    Blobs left unreferenced are removed once the transaction commits.
+    """
+    if blob_id is None:
+        return
+
+    # The session does not autoflush; write the new reference first so the
+    # blob is never removed while still referenced
+    db.flush()
+    db.query(Blob).filter(Blob.id == blob_id).update(
+        {Blob.refcount: Blob.refcount - 1}, synchronize_session=False
+    )
+    blob = db.query(Blob).filter(Blob.id == blob_id, Blob.refcount <= 0).first()
+    if blob is not None:
+        db.info.setdefault(_RELEASED_BLOBS, []).append(_blob_key(blob))
+
+
+def _unlink_blob_files(path: str) -> None:
+    path = Path(path)
+    path.unlink(missing_ok=True)
+    # Derived files (.gz copies, thumbnails) are named <blob>.<suffix>
+    for variant in path.parent.glob(f"{path.name}.*"):
+        variant.unlink(missing_ok=True)
+
+
+def remove_unreferenced_blobs(
+    blobs: List[Tuple[str, str, int]], session_factory: sessionmaker = SessionLocal
+) -> None:
+    """
+    Delete the given blobs' rows and files unless they are referenced. The
+    row is deleted (or, for content whose row was rolled back, held by a
+    placeholder) before the file is removed and committed after, so a
+    concurrent store_upload of the same content waits and publishes it again
+    rather than losing its file.
+    """
+    for sha256, path, size in blobs:
+        try:
+            with session_factory() as db:
+                removed = (
+                    db.query(Blob)
+                    .filter(Blob.sha256 == sha256, Blob.refcount <= 0)
+                    .delete(synchronize_session=False)
+                )
+                if not removed:
+                    placeholder = {
+                        "sha256": sha256,
+                        "path": path,
+                        "size": size,
+                        "refcount": 0,
+                    }
+                    if not _insert_blob(db, placeholder):
+                        # Referenced again
+                        continue
+                    db.query(Blob).filter(Blob.sha256 == sha256).delete(
+                        synchronize_session=False
+                    )
+                _unlink_blob_files(path)
+                db.commit()
+        except Exception as e:
+            print(f"Error removing blob {sha256}: {str(e)}")
+
+
+@event.listens_for(Session, "after_commit")
+def _remove_released_blobs(session: Session) -> None:
+    session.info.pop(_CREATED_BLOBS, None)
+    remove_unreferenced_blobs(session.info.pop(_RELEASED_BLOBS, []))
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _remove_created_blobs(session: Session, transaction) -> None:
+    # Savepoint rollbacks keep the outer transaction's records
+    if transaction.parent is not None:
+        return
+    session.info.pop(_RELEASED_BLOBS, None)
+    remove_unreferenced_blobs(session.info.pop(_CREATED_BLOBS, []))
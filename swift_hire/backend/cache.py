@@ -0,0 +1,161 @@
+import os
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# memory:// for a per-process cache, redis://host:port/db to share one
+# between workers
+CACHE_URL = os.getenv("CACHE_URL", "memory://")
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "1024"))
+CACHE_TTL_SECONDS = float(os.getenv("CACHE_TTL_SECONDS", "60"))
+CACHE_KEY_PREFIX = os.getenv("CACHE_KEY_PREFIX", "swift_hire:")
+
+
+class CacheBackend(ABC):
+    """
+    Byte-string cache used by the API. Errors never propagate: a cache that
+    cannot be reached behaves as if it were empty.
+    """
+
+    name = "none"
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]: ...
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None: ...
+
+    async def close(self) -> None:
+        pass
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+class MemoryCache(CacheBackend):
+    """
+    In-process LRU cache with per-entry expiry. Only accessed from the event
+    loop, so it needs no locking. Each worker process has its own copy.
+    """
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES):
+        super().__init__()
+        self.max_entries = max_entries
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> Dict:
+        return {
+            **super().stats(),
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+        }
+
+
+class RedisCache(CacheBackend):
+    """
+    Cache on a Redis-protocol server (Redis, Valkey, KeyDB, ...), shared by
+    all workers
+    """
+
+    name = "redis"
+
+    def __init__(self, url: str):
+        super().__init__()
+        # Imported here so the memory backend works without the package
+        import redis.asyncio as redis
+
+        self._errors = (redis.RedisError, OSError)
+        self._client = redis.Redis.from_url(
+            url, socket_timeout=0.25, socket_connect_timeout=0.25
+        )
+
+    async def get(self, key: str) -> Optional[bytes]:
+        try:
+            value = await self._client.get(CACHE_KEY_PREFIX + key)
+        except self._errors:
+            self.errors += 1
+            value = None
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        try:
+            await self._client.set(CACHE_KEY_PREFIX + key, value, px=int(ttl * 1000))
+        except self._errors:
+            self.errors += 1
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+def create_cache(url: str = CACHE_URL) -> CacheBackend:
+    if url.startswith("memory://"):
+        return MemoryCache()
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisCache(url)
+    raise ValueError(f"Unsupported CACHE_URL: {url}")
+
+
+cache = create_cache()
+
+
+class CacheNamespace:
+    """
+    Group of cache entries sharing a key prefix and TTL. Nothing is
+    invalidated: callers build keys from whatever the value depends on,
+    such as the table versions behind a response's ETag, so a write moves
+    readers to a new key and stale entries age out through their TTL or
+    LRU eviction.
+    """
+
+    def __init__(self, name: str, ttl: float = CACHE_TTL_SECONDS):
+        self.name = name
+        self.ttl = ttl
+
+    async def lookup(self, key: str) -> Optional[bytes]:
+        return await cache.get(f"{self.name}:{key}")
+
+    async def store(self, key: str, value: bytes) -> None:
+        await cache.set(f"{self.name}:{key}", value, self.ttl)
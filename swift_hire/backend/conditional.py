@@ -0,0 +1,204 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Iterable, Optional
+
+from database import get_async_db
+from fastapi import Depends, HTTPException, Request, Response
+from models import TableVersion
+from sqlalchemy import event, inspect, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+# Tables served behind ConditionalGet; writes to any other table do not
+# touch table_versions
+VERSIONED_TABLES = {
+    "candidates",
+    "feedback",
+    "job_applications",
+    "job_posts",
+    "saved_jobs",
+}
+
+UPSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+# Key in Session.info of the versioned tables written in the transaction
+WRITTEN_TABLES = "written_versioned_tables"
+
+
+def bump_table_versions(session: Session, tables: Iterable[str]) -> None:
+    """
+    Advance the version of tables written in the session's transaction
+    """
+    names = sorted(set(tables) & VERSIONED_TABLES)
+    if not names:
+        return
+
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    connection = session.connection()
+    upsert = UPSERTS.get(connection.dialect.name)
+    if upsert is None:
+        # Without an upsert, only tables that already have a row are bumped
+        connection.execute(
+            update(TableVersion)
+            .where(TableVersion.table_name.in_(names))
+            .values(version=TableVersion.version + 1, updated_at=now)
+        )
+        return
+
+    # Sorted rows keep concurrent writers locking them in the same order
+    statement = upsert(TableVersion).values(
+        [{"table_name": name, "version": 1, "updated_at": now} for name in names]
+    )
+    connection.execute(
+        statement.on_conflict_do_update(
+            index_elements=[TableVersion.table_name],
+            set_={
+                "version": TableVersion.version + 1,
+                "updated_at": statement.excluded.updated_at,
+            },
+        )
+    )
+
+
+def _record_written_tables(session: Session, tables: Iterable[str]) -> None:
+    written = set(tables) & VERSIONED_TABLES
+    if written:
+        session.info.setdefault(WRITTEN_TABLES, set()).update(written)
+
+
+@event.listens_for(Session, "after_flush")
+def _record_flushed_tables(session: Session, flush_context) -> None:
+    tables = set()
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if instance in session.dirty and not session.is_modified(instance):
+            continue
+        tables.update(table.name for table in inspect(instance).mapper.tables)
+    _record_written_tables(session, tables)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _record_bulk_written_tables(orm_execute_state) -> None:
+    # Bulk insert()/update()/delete() statements, including query.update()
+    # and query.delete(), do not go through the flush
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        table = orm_execute_state.statement.table
+        _record_written_tables(orm_execute_state.session, [table.name])
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_written_tables(session: Session) -> None:
+    # Versions are bumped once, in one sorted statement, at the end of the
+    # transaction, so their row locks are taken last and held briefly. The
+    # commit's own flush runs after this hook, so pending changes are
+    # flushed here first.
+    session.flush()
+    tables = session.info.pop(WRITTEN_TABLES, None)
+    if tables:
+        bump_table_versions(session, tables)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _forget_written_tables(session: Session, transaction) -> None:
+    # Rolling back a savepoint keeps the outer transaction's writes
+    if transaction.parent is None:
+        session.info.pop(WRITTEN_TABLES, None)
+
+
+def _http_date(value: datetime) -> str:
+    return format_datetime(value.replace(tzinfo=timezone.utc), usegmt=True)
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Whether If-None-Match lists the ETag. The comparison is weak, so any
+    W/ prefix is ignored.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in candidates
+
+
+def _not_modified_since(request: Request, last_modified: Optional[datetime]) -> bool:
+    if_modified_since = request.headers.get("if-modified-since")
+    if not if_modified_since or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    return last_modified.replace(microsecond=0, tzinfo=timezone.utc) <= since
+
+
+class ConditionalGet:
+    """
+    Dependency adding ETag and Last-Modified validators derived from the
+    versions of the tables a response is built from. When the client
+    already has the current representation it answers 304 before the
+    route runs, so nothing is queried or serialized.
+
+    The validators are set on the injected response and also returned,
+    for routes that build their own Response. The versions they derive from
+    are left in request.state.table_versions, for caches that must change
+    along with the ETag.
+    """
+
+    def __init__(self, *tables: str):
+        unversioned = set(tables) - VERSIONED_TABLES
+        if unversioned:
+            raise ValueError(f"Tables are not versioned: {sorted(unversioned)}")
+        self.tables = sorted(tables)
+
+    async def __call__(
+        self,
+        request: Request,
+        response: Response,
+        db: AsyncSession = Depends(get_async_db),
+    ) -> Dict[str, str]:
+        versions = {
+            table_name: (version, updated_at)
+            for table_name, version, updated_at in await db.execute(
+                select(
+                    TableVersion.table_name,
+                    TableVersion.version,
+                    TableVersion.updated_at,
+                ).where(TableVersion.table_name.in_(self.tables))
+            )
+        }
+        state = ";".join(
+            f"{name}={version}@{updated_at}"
+            for name, (version, updated_at) in sorted(versions.items())
+        )
+        request.state.table_versions = state
+        digest = hashlib.sha1(
+            f"{state}|{request.url.path}?{request.url.query}".encode()
+        ).hexdigest()
+        etag = f'"{digest[:32]}"'
+
+        last_modified = max(
+            (updated_at for _, updated_at in versions.values()), default=None
+        )
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if last_modified is not None:
+            headers["Last-Modified"] = _http_date(last_modified)
+
+        # If-Modified-Since only counts when no ETag was sent
+        if etag_matches(request, etag) or (
+            "if-none-match" not in request.headers
+            and _not_modified_since(request, last_modified)
+        ):
+            raise HTTPException(status_code=304, headers=headers)
+
+        response.headers.update(headers)
+        return headers
@@ -0,0 +1,95 @@
+from datetime import datetime, timezone
+from typing import Dict, Mapping, Optional
+
+from conditional import UPSERTS
+from models import Candidate, UserCounter
+from sqlalchemy import Select, case, func, select, update
+from sqlalchemy.orm import Session
+
+COUNTERS = ("applications", "saved_jobs")
+
+
+def counters_for(email: str) -> Select:
+    """
+    The candidate's id and counters, read by primary key in one statement.
+    No row means no candidate; counters are zero until first adjusted.
+    """
+    return (
+        select(
+            Candidate.id,
+            *(
+                func.coalesce(getattr(UserCounter, name), 0).label(name)
+                for name in COUNTERS
+            ),
+        )
+        .outerjoin(UserCounter, UserCounter.candidate_id == Candidate.id)
+        .where(Candidate.email == email)
+    )
+
+
+def _add(session: Session, counter: str, deltas: Dict[int, int], now) -> None:
+    column = getattr(UserCounter, counter)
+    session.connection().execute(
+        update(UserCounter)
+        .where(UserCounter.candidate_id.in_(sorted(deltas)))
+        .values(
+            {
+                counter: column + case(deltas, value=UserCounter.candidate_id),
+                "updated_at": now,
+            }
+        )
+    )
+
+
+def adjust_counters(
+    session: Session, counter: str, deltas: Mapping[Optional[int], int]
+) -> None:
+    """
+    Add each delta to a candidate's counter in the session's transaction.
+    Rows are created by the first increment; rows of unlinked (NULL)
+    candidates are not counted.
+    """
+    if counter not in COUNTERS:
+        raise ValueError(f"Unknown counter: {counter}")
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    deltas = {key: delta for key, delta in deltas.items() if key is not None}
+    increments = {key: delta for key, delta in deltas.items() if delta > 0}
+    decrements = {key: delta for key, delta in deltas.items() if delta < 0}
+
+    # A missing row has nothing to take away from
+    if decrements:
+        _add(session, counter, decrements, now)
+    if not increments:
+        return
+
+    connection = session.connection()
+    upsert = UPSERTS.get(connection.dialect.name)
+    if upsert is None:
+        # Without an upsert, only candidates that already have a row are
+        # counted
+        _add(session, counter, increments, now)
+        return
+
+    # Sorted rows keep concurrent writers locking them in the same order
+    statement = upsert(UserCounter).values(
+        [
+            {
+                "candidate_id": candidate_id,
+                "applications": 0,
+                "saved_jobs": 0,
+                counter: delta,
+                "updated_at": now,
+            }
+            for candidate_id, delta in sorted(increments.items())
+        ]
+    )
+    connection.execute(
+        statement.on_conflict_do_update(
+            index_elements=[UserCounter.candidate_id],
+            set_={
+                counter: getattr(UserCounter, counter)
+                + getattr(statement.excluded, counter),
+                "updated_at": statement.excluded.updated_at,
+            },
+        )
+    )
@@ -0,0 +1,74 @@
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from models import Candidate, JobApplication, JobPost
+from sqlalchemy.orm import Session, defer
+
+ApplicationBuilder = Callable[
+    [JobApplication, Optional[Candidate], Optional[JobPost]], dict
+]
+
+
+def load_application_relations(
+    db: Session,
+    applications: Sequence[JobApplication],
+    with_candidates: bool = True,
+    with_jobs: bool = True,
+) -> Tuple[Dict[int, Candidate], Dict[int, JobPost]]:
+    """
+    Fetch every candidate and job referenced by the given applications
+    with at most one IN (...) query per table, leaving out the candidates'
+    bios and the job descriptions
+    """
+    candidates: Dict[int, Candidate] = {}
+    jobs: Dict[int, JobPost] = {}
+
+    candidate_ids = {app.candidate_id for app in applications} - {None}
+    if with_candidates and candidate_ids:
+        candidates = {
+            candidate.id: candidate
+            for candidate in db.query(Candidate)
+            .options(defer(Candidate.bio, raiseload=True))
+            .filter(Candidate.id.in_(candidate_ids))
+            .all()
+        }
+
+    job_ids = {app.job_id for app in applications}
+    if with_jobs and job_ids:
+        jobs = {
+            job.id: job
+            for job in db.query(JobPost)
+            .options(defer(JobPost.description, raiseload=True))
+            .filter(JobPost.id.in_(job_ids))
+            .all()
+        }
+
+    return candidates, jobs
+
+
+def hydrate_applications(
+    db: Session,
+    applications: Sequence[JobApplication],
+    build: ApplicationBuilder,
+    with_candidates: bool = True,
+    with_jobs: bool = True,
+    skip_incomplete: bool = True,
+) -> List[dict]:
+    """
+    Build response dicts for a list of applications, batching the candidate
+    and job lookups. Rows whose candidate or job no longer exists are
+    dropped unless skip_incomplete is False.
+    """
+    candidates, jobs = load_application_relations(
+        db, applications, with_candidates=with_candidates, with_jobs=with_jobs
+    )
+
+    result = []
+    for app in applications:
+        candidate = candidates.get(app.candidate_id)
+        job = jobs.get(app.job_id)
+        if skip_incomplete and (
+            (with_candidates and candidate is None) or (with_jobs and job is None)
+        ):
+            continue
+        result.append(build(app, candidate, job))
+    return result
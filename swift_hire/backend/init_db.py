@@ -8,7 +8,7 @@ import os
 import sys
 from dotenv import load_dotenv
 from sqlalchemy import create_engine, text
-from models import Base
+from database import run_migrations
 
 def init_database():
     """Initialize the database with all required tables"""
@@ -39,9 +39,9 @@ def init_database():
             result = conn.execute(text("SELECT 1"))
             print("✅ Database connection successful")
         
-        # Create all tables
-        print("📋 Creating database tables...")
-        Base.metadata.create_all(bind=engine)
+        # Create all tables by applying the migrations
+        print("📋 Applying database migrations...")
+        run_migrations(DATABASE_URL)
         
         # Verify tables were created
         with engine.connect() as conn:
@@ -0,0 +1,51 @@
+from counters import adjust_counters
+from models import Candidate, Interviewer, JobApplication, JobPost, SavedJob
+from sqlalchemy import ScalarSelect, select, update
+from sqlalchemy.orm import Session
+
+
+def candidate_id_for(email: str) -> ScalarSelect:
+    """
+    Subquery resolving a candidate's email to its id, so routes keyed by
+    email can filter on the integer foreign key in a single statement
+    """
+    return select(Candidate.id).where(Candidate.email == email).scalar_subquery()
+
+
+def interviewer_id_for(email: str) -> ScalarSelect:
+    """
+    Subquery resolving an interviewer's email to its id
+    """
+    return select(Interviewer.id).where(Interviewer.email == email).scalar_subquery()
+
+
+def link_candidate_rows(db: Session, candidate: Candidate) -> None:
+    """
+    Attach applications and saved jobs recorded under the candidate's email
+    before the candidate row existed, and count them on its dashboard
+    """
+    for model, counter in ((JobApplication, "applications"), (SavedJob, "saved_jobs")):
+        linked = db.execute(
+            update(model)
+            .where(
+                model.candidate_email == candidate.email, model.candidate_id.is_(None)
+            )
+            .values(candidate_id=candidate.id)
+        ).rowcount
+        adjust_counters(db, counter, {candidate.id: linked})
+
+
+def link_interviewer_rows(db: Session, interviewer: Interviewer) -> None:
+    """
+    Attach job posts and applications recorded under the interviewer's
+    email before the interviewer row existed
+    """
+    for model in (JobPost, JobApplication):
+        db.execute(
+            update(model)
+            .where(
+                model.interviewer_email == interviewer.email,
+                model.interviewer_id.is_(None),
+            )
+            .values(interviewer_id=interviewer.id)
+        )
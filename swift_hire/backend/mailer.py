@@ -0,0 +1,153 @@
+import os
+import queue
+import smtplib
+import threading
+import time
+from contextlib import contextmanager
+from email.message import Message
+from typing import Iterator, Tuple, Union
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+EMAIL_SENDER = os.getenv("EMAIL_SENDER")
+EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD")
+SMTP_SERVER = os.getenv("SMTP_SERVER", "smtp.gmail.com")
+SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
+
+SMTP_POOL_SIZE = int(os.getenv("SMTP_POOL_SIZE", "4"))
+SMTP_TIMEOUT_SECONDS = float(os.getenv("SMTP_TIMEOUT_SECONDS", "30"))
+# Idle sessions are checked with NOOP before reuse, and dropped when older
+SMTP_NOOP_AFTER_SECONDS = float(os.getenv("SMTP_NOOP_AFTER_SECONDS", "30"))
+SMTP_MAX_IDLE_SECONDS = float(os.getenv("SMTP_MAX_IDLE_SECONDS", "240"))
+
+
+class SMTPConnectionPool:
+    """
+    A bounded pool of authenticated SMTP sessions. Sessions are kept open
+    between messages so TLS and login happen once per session rather than
+    once per email.
+    """
+
+    def __init__(
+        self,
+        host: str = SMTP_SERVER,
+        port: int = SMTP_PORT,
+        username: str = EMAIL_SENDER,
+        password: str = EMAIL_PASSWORD,
+        size: int = SMTP_POOL_SIZE,
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.size = size
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle: "queue.LifoQueue[Tuple[smtplib.SMTP, float]]" = queue.LifoQueue()
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.host, self.port, timeout=SMTP_TIMEOUT_SECONDS)
+        try:
+            server.starttls()
+            server.login(self.username, self.password)
+        except Exception:
+            _close(server)
+            raise
+        return server
+
+    def _checkout(self) -> smtplib.SMTP:
+        while True:
+            try:
+                server, last_used = self._idle.get_nowait()
+            except queue.Empty:
+                return self._connect()
+
+            idle_for = time.monotonic() - last_used
+            if idle_for > SMTP_MAX_IDLE_SECONDS:
+                _close(server)
+                continue
+            if idle_for > SMTP_NOOP_AFTER_SECONDS and not _is_alive(server):
+                _close(server)
+                continue
+            return server
+
+    @contextmanager
+    def connection(self, fresh: bool = False) -> Iterator[smtplib.SMTP]:
+        """
+        Borrow a session, or open a new one when fresh. It goes back to the
+        pool afterwards, also when the server rejected a message, unless
+        the connection itself failed.
+        """
+        if not self._slots.acquire(timeout=SMTP_TIMEOUT_SECONDS):
+            raise TimeoutError("Timed out waiting for an SMTP connection")
+        try:
+            server = self._connect() if fresh else self._checkout()
+            try:
+                yield server
+            except Exception as e:
+                if _is_broken(server, e):
+                    _close(server)
+                else:
+                    self._idle.put((server, time.monotonic()))
+                raise
+            self._idle.put((server, time.monotonic()))
+        finally:
+            self._slots.release()
+
+    def send(self, to_email: str, message: str) -> None:
+        try:
+            with self.connection() as server:
+                server.sendmail(self.username, to_email, message)
+        except (smtplib.SMTPServerDisconnected, ConnectionError):
+            # The server dropped an idle session. Other idle sessions are as
+            # old, so retry once on a new connection.
+            with self.connection(fresh=True) as server:
+                server.sendmail(self.username, to_email, message)
+
+    def close_all(self) -> None:
+        while True:
+            try:
+                server, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            _close(server)
+
+
+def _is_broken(server: smtplib.SMTP, error: Exception) -> bool:
+    """
+    Whether an error left the session unusable. Replies refusing a sender,
+    recipient or message leave it reset and ready for the next one; SMTP
+    errors subclass OSError, so only the others are socket failures.
+    """
+    if isinstance(error, smtplib.SMTPServerDisconnected) or server.sock is None:
+        return True
+    return isinstance(error, OSError) and not isinstance(
+        error, smtplib.SMTPException
+    )
+
+
+def _is_alive(server: smtplib.SMTP) -> bool:
+    try:
+        return server.noop()[0] == 250
+    except Exception:
+        return False
+
+
+def _close(server: smtplib.SMTP) -> None:
+    try:
+        server.quit()
+    except Exception:
+        server.close()
+
+
+pool = SMTPConnectionPool()
+
+
+def send_message(to_email: str, message: Union[str, Message]) -> None:
+    """
+    Send a rendered email through the shared SMTP pool
+    """
+    if isinstance(message, Message):
+        message = message.as_string()
+    pool.send(to_email, message)
@@ -1,11 +1,20 @@
 import os
+import threading
+import time
+from contextlib import asynccontextmanager
 from pathlib import Path
 from dotenv import load_dotenv
 
-from database import Base, engine
+from database import (
+    async_engine,
+    engine,
+    pool_status,
+    run_migrations,
+)
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import JSONResponse
+from sqlalchemy import text
 
 # Load environment variables
 load_dotenv()
@@ -18,13 +27,34 @@ from routers import (
     authentication,
     calendar,
     candidates,
+    dashboard,
     feedback,
     interviewers,
     job_applications,
     jobs,
+    uploads,
 )
+import mailer
+from cache import cache
+from outbox import worker_pool
+from pagination import NEXT_CURSOR_HEADER
+from resume_search import backfill_resume_index
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Drain the email outbox in the background while the app is running
+    worker_pool.start()
+    # Extract text of resumes uploaded before the search index existed
+    threading.Thread(target=backfill_resume_index, daemon=True).start()
+    yield
+    worker_pool.stop()
+    mailer.pool.close_all()
+    await cache.close()
+    await async_engine.dispose()
 
-app = FastAPI()
+
+app = FastAPI(lifespan=lifespan)
 
 # Add CORS middleware to handle cross-origin requests
 frontend_url = os.getenv("FRONTEND_URL", "http://localhost:3000")
@@ -40,19 +70,17 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
-# Create tables in the database
-Base.metadata.create_all(bind=engine)
+# Bring the database schema up to date
+run_migrations()
 
 # Create uploads directory if it doesn't exist
 upload_dir = os.getenv("UPLOAD_DIR", "uploads")
 uploads_dir = Path(upload_dir)
 uploads_dir.mkdir(exist_ok=True)
 
-# Mount the uploads directory
-app.mount("/uploads", StaticFiles(directory=upload_dir), name="uploads")
-
 # Add a simple root endpoint for testing
 @app.get("/")
 async def root():
@@ -62,6 +90,30 @@ async def root():
 async def health_check():
     return {"status": "healthy", "message": "API is working properly"}
 
+@app.get("/health/db")
+async def database_health_check():
+    start = time.perf_counter()
+    try:
+        async with async_engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+    except Exception as e:
+        return JSONResponse(
+            status_code=503,
+            content={"status": "unhealthy", "message": f"Database error: {str(e)}"},
+        )
+    return {
+        "status": "healthy",
+        "latency_ms": round((time.perf_counter() - start) * 1000, 2),
+        "pools": {
+            "sync": pool_status(engine),
+            "async": pool_status(async_engine.sync_engine),
+        },
+    }
+
+@app.get("/health/cache")
+async def cache_health_check():
+    return cache.stats()
+
 # Include routers
 app.include_router(authentication.router)
 app.include_router(jobs.router)
@@ -71,6 +123,8 @@ app.include_router(job_applications.router)
 app.include_router(feedback.router)  # Include the feedback router
 app.include_router(admin_routes.router)
 app.include_router(calendar.router)  # Add our new calendar routes
+app.include_router(uploads.router)  # Serve uploaded resumes and images
+app.include_router(dashboard.router)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,65 @@
+from logging.config import fileConfig
+
+import models  # noqa: F401  Register every table on Base.metadata
+from alembic import context
+from database import DATABASE_URL, Base
+from sqlalchemy import create_engine, pool
+
+config = context.config
+
+# Keep the application's logging setup when migrations run at startup
+if config.config_file_name is not None and config.attributes.get(
+    "configure_logger", True
+):
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+# Full-text search objects created by raw SQL in migration 0006
+SEARCH_INDEX_OBJECTS = {"search_vector", "ix_resume_documents_search_vector"}
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    if name in SEARCH_INDEX_OBJECTS or (name or "").startswith("resume_documents_fts"):
+        return False
+    return True
+
+
+# run_migrations() passes its URL through the config; the CLI uses DATABASE_URL
+url = config.get_main_option("sqlalchemy.url") or DATABASE_URL
+
+
+def run_migrations_offline() -> None:
+    context.configure(
+        url=url,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        render_as_batch=True,
+        include_object=include_object,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    connectable = create_engine(url, poolclass=pool.NullPool)
+
+    with connectable.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            # SQLite needs table rebuilds for most ALTER TABLE operations
+            render_as_batch=connection.dialect.name == "sqlite",
+            include_object=include_object,
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,82 @@
+"""
+Guards shared by the migrations. Databases created before migrations were
+introduced already have some of these tables and indexes (from
+Base.metadata.create_all), so creation is skipped when the object exists.
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+def has_table(name: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def has_index(table: str, name: str) -> bool:
+    if not has_table(table):
+        return False
+    return any(
+        index["name"] == name for index in sa.inspect(op.get_bind()).get_indexes(table)
+    )
+
+
+def has_column(table: str, name: str) -> bool:
+    if not has_table(table):
+        return False
+    return any(
+        column["name"] == name
+        for column in sa.inspect(op.get_bind()).get_columns(table)
+    )
+
+
+def has_foreign_key(table: str, name: str) -> bool:
+    if not has_table(table):
+        return False
+    return any(
+        foreign_key["name"] == name
+        for foreign_key in sa.inspect(op.get_bind()).get_foreign_keys(table)
+    )
+
+
+def create_table_if_missing(name: str, *columns, **kw) -> bool:
+    if has_table(name):
+        return False
+    op.create_table(name, *columns, **kw)
+    return True
+
+
+def create_index_if_missing(
+    name: str, table: str, columns: Sequence[str], **kw
+) -> None:
+    if not has_index(table, name):
+        op.create_index(name, table, list(columns), **kw)
+
+
+def drop_index_if_exists(name: str, table: str) -> None:
+    if has_index(table, name):
+        op.drop_index(name, table_name=table)
+
+
+def enum(*values: str, name: str) -> sa.Enum:
+    """
+    An enum column type. On PostgreSQL the type is created separately by
+    create_enum, since several tables share the same type.
+    """
+    return sa.Enum(*values, name=name).with_variant(
+        postgresql.ENUM(*values, name=name, create_type=False), "postgresql"
+    )
+
+
+def create_enum(*values: str, name: str) -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        postgresql.ENUM(*values, name=name).create(bind, checkfirst=True)
+
+
+def drop_enum(name: str) -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        postgresql.ENUM(name=name).drop(bind, checkfirst=True)
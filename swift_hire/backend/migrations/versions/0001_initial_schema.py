@@ -0,0 +1,176 @@
+"""initial schema
+
+Tables as created by Base.metadata.create_all before migrations were added.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 00:00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from migrations.helpers import (
+    create_enum,
+    create_index_if_missing,
+    create_table_if_missing,
+    drop_enum,
+    enum,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ROLES = ("Candidate", "Interviewer")
+EDUCATION = (
+    "Not Specified",
+    "MATRIC",
+    "INTERMEDIATE",
+    "Bachelor's",
+    "Master",
+    "PHD",
+)
+APPLICATION_STATUSES = ("Applied", "Shortlisted", "Rejected")
+
+
+def upgrade() -> None:
+    create_enum(*ROLES, name="roleenum")
+    create_enum(*EDUCATION, name="educationenum")
+    create_enum(*APPLICATION_STATUSES, name="application_status")
+
+    create_table_if_missing(
+        "users",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("email", sa.String(255), nullable=False, unique=True),
+        sa.Column("password", sa.String(255), nullable=False),
+        sa.Column("role", enum(*ROLES, name="roleenum"), nullable=False),
+    )
+
+    create_table_if_missing(
+        "interviewers",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("email", sa.String(255), nullable=False, unique=True),
+        sa.Column("expertise", sa.Text(), nullable=False),
+        sa.Column("availability", sa.Text(), nullable=False),
+        sa.Column("department", sa.String(255), nullable=False),
+        sa.Column("role", enum(*ROLES, name="roleenum"), nullable=False),
+        sa.Column("created_at", sa.TIMESTAMP(), server_default=sa.func.now()),
+    )
+
+    create_table_if_missing(
+        "job_posts",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("company", sa.String(255), nullable=False),
+        sa.Column("location", sa.String(255), nullable=False),
+        sa.Column("type", sa.String(50), nullable=False),
+        sa.Column("salary", sa.String(100), nullable=False),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.Column("skills", sa.Text(), nullable=False),
+        sa.Column("interviewer_email", sa.String(255), nullable=False),
+        sa.Column("created_at", sa.TIMESTAMP(), server_default=sa.func.now()),
+    )
+
+    create_table_if_missing(
+        "candidates",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("email", sa.String(255), nullable=False, unique=True),
+        sa.Column("skills", sa.Text(), nullable=False),
+        sa.Column("resume", sa.String(255), nullable=False),
+        sa.Column("profile_image", sa.String(255), nullable=True),
+        sa.Column("bio", sa.Text(), nullable=True),
+        sa.Column("education", enum(*EDUCATION, name="educationenum"), nullable=False),
+        sa.Column("years_of_experience", sa.Integer(), nullable=True),
+        sa.Column("role", enum(*ROLES, name="roleenum"), nullable=False),
+        sa.Column("created_at", sa.TIMESTAMP(), server_default=sa.func.now()),
+    )
+
+    create_table_if_missing(
+        "saved_jobs",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("candidate_email", sa.String(255), nullable=False),
+        sa.Column("job_id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.TIMESTAMP(), server_default=sa.func.now()),
+    )
+
+    create_table_if_missing(
+        "job_applications",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("candidate_email", sa.String(255), nullable=False),
+        sa.Column("job_id", sa.Integer(), nullable=False),
+        sa.Column("interviewer_email", sa.String(255), nullable=False),
+        sa.Column(
+            "status",
+            enum(*APPLICATION_STATUSES, name="application_status"),
+            nullable=True,
+        ),
+        sa.Column("interview_form_url", sa.String(255), nullable=True),
+        sa.Column("interview_schedule", sa.TIMESTAMP(), nullable=True),
+        sa.Column("interview_duration", sa.Integer(), nullable=True),
+        sa.Column("interview_title", sa.String(255), nullable=True),
+        sa.Column("interview_description", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.TIMESTAMP(), server_default=sa.func.now()),
+    )
+
+    create_table_if_missing(
+        "feedback",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_email", sa.String(255), nullable=False),
+        sa.Column("user_name", sa.String(255), nullable=False),
+        sa.Column("user_role", sa.String(50), nullable=False),
+        sa.Column("rating", sa.Integer(), nullable=False),
+        sa.Column("message", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.TIMESTAMP(), server_default=sa.func.now()),
+    )
+
+    create_table_if_missing(
+        "notes",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "application_id",
+            sa.Integer(),
+            sa.ForeignKey("job_applications.id"),
+            nullable=False,
+        ),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("created_by", sa.String(255), nullable=False),
+        sa.Column("created_at", sa.TIMESTAMP(), server_default=sa.func.now()),
+    )
+
+    for table in (
+        "users",
+        "interviewers",
+        "job_posts",
+        "candidates",
+        "saved_jobs",
+        "job_applications",
+        "feedback",
+        "notes",
+    ):
+        create_index_if_missing(f"ix_{table}_id", table, ["id"])
+
+
+def downgrade() -> None:
+    for table in (
+        "notes",
+        "feedback",
+        "job_applications",
+        "saved_jobs",
+        "candidates",
+        "job_posts",
+        "interviewers",
+        "users",
+    ):
+        op.drop_table(table)
+
+    drop_enum("application_status")
+    drop_enum("educationenum")
+    drop_enum("roleenum")
@@ -0,0 +1,128 @@
+"""skill index and email outbox tables
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from migrations.helpers import (
+    create_enum,
+    create_index_if_missing,
+    create_table_if_missing,
+    drop_enum,
+    enum,
+)
+from skills import normalize_skills
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+OUTBOX_STATUSES = ("Pending", "Sending", "Sent", "Failed")
+
+# (indexed table, skill table, skill table's key column)
+SKILL_INDEXES = [
+    ("job_posts", "job_skills", "job_id"),
+    ("candidates", "candidate_skills", "candidate_id"),
+]
+
+
+def _backfill_skill_index(table: str, skill_table: str, key: str) -> None:
+    """
+    Index the skills of rows created before the index existed. The API keeps
+    the index up to date from then on.
+    """
+    rows = sa.table(table, sa.column("id", sa.Integer), sa.column("skills", sa.Text))
+    skills = sa.table(
+        skill_table, sa.column(key, sa.Integer), sa.column("skill", sa.String)
+    )
+    bind = op.get_bind()
+    unindexed = bind.execute(
+        sa.select(rows.c.id, rows.c.skills).where(
+            ~sa.exists().where(skills.c[key] == rows.c.id)
+        )
+    )
+    values = [
+        {key: row_id, "skill": skill}
+        for row_id, raw in unindexed
+        for skill in normalize_skills(raw)
+    ]
+    if values:
+        bind.execute(skills.insert(), values)
+
+
+def upgrade() -> None:
+    create_table_if_missing(
+        "job_skills",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "job_id", sa.Integer(), sa.ForeignKey("job_posts.id"), nullable=False
+        ),
+        sa.Column("skill", sa.String(100), nullable=False),
+    )
+    create_index_if_missing("ix_job_skills_id", "job_skills", ["id"])
+    create_index_if_missing("ix_job_skills_job_id", "job_skills", ["job_id"])
+    create_index_if_missing(
+        "ix_job_skills_skill_job_id", "job_skills", ["skill", "job_id"]
+    )
+
+    create_table_if_missing(
+        "candidate_skills",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "candidate_id",
+            sa.Integer(),
+            sa.ForeignKey("candidates.id"),
+            nullable=False,
+        ),
+        sa.Column("skill", sa.String(100), nullable=False),
+    )
+    create_index_if_missing("ix_candidate_skills_id", "candidate_skills", ["id"])
+    create_index_if_missing(
+        "ix_candidate_skills_candidate_id", "candidate_skills", ["candidate_id"]
+    )
+    create_index_if_missing(
+        "ix_candidate_skills_skill_candidate_id",
+        "candidate_skills",
+        ["skill", "candidate_id"],
+    )
+
+    for table, skill_table, key in SKILL_INDEXES:
+        _backfill_skill_index(table, skill_table, key)
+
+    create_enum(*OUTBOX_STATUSES, name="outbox_status")
+    create_table_if_missing(
+        "email_outbox",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("to_email", sa.String(255), nullable=False),
+        sa.Column("subject", sa.String(255), nullable=False),
+        sa.Column("message", sa.Text(), nullable=False),
+        sa.Column(
+            "status", enum(*OUTBOX_STATUSES, name="outbox_status"), nullable=False
+        ),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("next_attempt_at", sa.TIMESTAMP(), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("sent_at", sa.TIMESTAMP(), nullable=True),
+        sa.Column("created_at", sa.TIMESTAMP(), server_default=sa.func.now()),
+    )
+    create_index_if_missing("ix_email_outbox_id", "email_outbox", ["id"])
+    create_index_if_missing(
+        "ix_email_outbox_status_next_attempt_at",
+        "email_outbox",
+        ["status", "next_attempt_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("email_outbox")
+    drop_enum("outbox_status")
+    op.drop_table("candidate_skills")
+    op.drop_table("job_skills")
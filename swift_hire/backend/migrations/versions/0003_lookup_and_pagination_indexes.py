@@ -0,0 +1,87 @@
+"""secondary indexes for hot lookups and keyset pagination
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 00:00:00
+
+"""
+
+from typing import Sequence, Union
+
+from migrations.helpers import create_index_if_missing, drop_index_if_exists
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    # Keyset pagination on (created_at, id), optionally behind a filter column
+    ("ix_job_posts_created_at_id", "job_posts", ["created_at", "id"]),
+    (
+        "ix_job_posts_interviewer_email_created_at_id",
+        "job_posts",
+        ["interviewer_email", "created_at", "id"],
+    ),
+    ("ix_candidates_created_at_id", "candidates", ["created_at", "id"]),
+    (
+        "ix_saved_jobs_candidate_email_created_at_id",
+        "saved_jobs",
+        ["candidate_email", "created_at", "id"],
+    ),
+    ("ix_job_applications_created_at_id", "job_applications", ["created_at", "id"]),
+    (
+        "ix_job_applications_interviewer_email_created_at_id",
+        "job_applications",
+        ["interviewer_email", "created_at", "id"],
+    ),
+    (
+        "ix_job_applications_candidate_email_created_at_id",
+        "job_applications",
+        ["candidate_email", "created_at", "id"],
+    ),
+    (
+        "ix_job_applications_status_created_at_id",
+        "job_applications",
+        ["status", "created_at", "id"],
+    ),
+    ("ix_feedback_created_at_id", "feedback", ["created_at", "id"]),
+    (
+        "ix_feedback_user_email_created_at_id",
+        "feedback",
+        ["user_email", "created_at", "id"],
+    ),
+    # Point lookups used by the routers
+    (
+        "ix_job_applications_interviewer_email_status",
+        "job_applications",
+        ["interviewer_email", "status"],
+    ),
+    (
+        "ix_job_applications_candidate_email_job_id",
+        "job_applications",
+        ["candidate_email", "job_id"],
+    ),
+    ("ix_job_applications_job_id", "job_applications", ["job_id"]),
+    (
+        "ix_saved_jobs_candidate_email_job_id",
+        "saved_jobs",
+        ["candidate_email", "job_id"],
+    ),
+    (
+        "ix_notes_application_id_created_at",
+        "notes",
+        ["application_id", "created_at"],
+    ),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        create_index_if_missing(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        drop_index_if_exists(name, table)
@@ -0,0 +1,56 @@
+"""content-addressed blob store for uploads
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 00:00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from migrations.helpers import (
+    create_index_if_missing,
+    create_table_if_missing,
+    has_column,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BLOB_COLUMNS = ("resume_blob_id", "profile_image_blob_id")
+
+
+def upgrade() -> None:
+    create_table_if_missing(
+        "blobs",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("sha256", sa.String(64), nullable=False, unique=True),
+        sa.Column("path", sa.String(255), nullable=False),
+        sa.Column("size", sa.Integer(), nullable=False),
+        sa.Column("content_type", sa.String(255), nullable=True),
+        sa.Column("refcount", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.TIMESTAMP(), server_default=sa.func.now()),
+    )
+    create_index_if_missing("ix_blobs_id", "blobs", ["id"])
+
+    missing = [name for name in BLOB_COLUMNS if not has_column("candidates", name)]
+    if missing:
+        with op.batch_alter_table("candidates") as batch_op:
+            for name in missing:
+                batch_op.add_column(sa.Column(name, sa.Integer(), nullable=True))
+                batch_op.create_foreign_key(
+                    f"fk_candidates_{name}_blobs", "blobs", [name], ["id"]
+                )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("candidates") as batch_op:
+        for name in BLOB_COLUMNS:
+            batch_op.drop_constraint(f"fk_candidates_{name}_blobs", type_="foreignkey")
+            batch_op.drop_column(name)
+    op.drop_table("blobs")
@@ -0,0 +1,32 @@
+"""profile image thumbnails
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 00:00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from migrations.helpers import has_column
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if not has_column("candidates", "profile_thumbnail"):
+        op.add_column(
+            "candidates",
+            sa.Column("profile_thumbnail", sa.String(255), nullable=True),
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("candidates") as batch_op:
+        batch_op.drop_column("profile_thumbnail")
@@ -0,0 +1,91 @@
+"""resume text and full-text search index
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 00:00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from migrations.helpers import create_table_if_missing
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Kept in sync with resume_documents by triggers
+SQLITE_FTS_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS resume_documents_fts_insert
+    AFTER INSERT ON resume_documents BEGIN
+        INSERT INTO resume_documents_fts(rowid, content)
+        VALUES (new.candidate_id, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS resume_documents_fts_delete
+    AFTER DELETE ON resume_documents BEGIN
+        INSERT INTO resume_documents_fts(resume_documents_fts, rowid, content)
+        VALUES ('delete', old.candidate_id, old.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS resume_documents_fts_update
+    AFTER UPDATE ON resume_documents BEGIN
+        INSERT INTO resume_documents_fts(resume_documents_fts, rowid, content)
+        VALUES ('delete', old.candidate_id, old.content);
+        INSERT INTO resume_documents_fts(rowid, content)
+        VALUES (new.candidate_id, new.content);
+    END
+    """,
+]
+
+
+def upgrade() -> None:
+    create_table_if_missing(
+        "resume_documents",
+        sa.Column(
+            "candidate_id",
+            sa.Integer(),
+            sa.ForeignKey("candidates.id"),
+            primary_key=True,
+        ),
+        sa.Column("source", sa.String(255), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("extracted_at", sa.TIMESTAMP(), server_default=sa.func.now()),
+    )
+
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute(
+            "ALTER TABLE resume_documents ADD COLUMN IF NOT EXISTS search_vector "
+            "tsvector GENERATED ALWAYS AS (to_tsvector('english', content)) STORED"
+        )
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_resume_documents_search_vector "
+            "ON resume_documents USING gin (search_vector)"
+        )
+    elif dialect == "sqlite":
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS resume_documents_fts USING fts5("
+            "content, content='resume_documents', content_rowid='candidate_id', "
+            "tokenize='porter unicode61')"
+        )
+        for trigger in SQLITE_FTS_TRIGGERS:
+            op.execute(trigger)
+        op.execute(
+            "INSERT INTO resume_documents_fts(resume_documents_fts) VALUES ('rebuild')"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        for action in ("insert", "delete", "update"):
+            op.execute(f"DROP TRIGGER IF EXISTS resume_documents_fts_{action}")
+        op.execute("DROP TABLE IF EXISTS resume_documents_fts")
+    op.drop_table("resume_documents")
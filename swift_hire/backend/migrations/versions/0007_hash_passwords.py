@@ -0,0 +1,61 @@
+"""hash plaintext passwords
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 00:00:00
+
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from security import PASSWORD_HASH_WORKERS, hash_password_sync, pwd_context
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+users = sa.table(
+    "users",
+    sa.column("id", sa.Integer),
+    sa.column("password", sa.String),
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    plaintext = [
+        (user_id, password)
+        for user_id, password in bind.execute(sa.select(users.c.id, users.c.password))
+        if password is not None and pwd_context.identify(password) is None
+    ]
+    if not plaintext:
+        return
+
+    # bcrypt releases the GIL, so hashing scales across cores
+    with ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS) as executor:
+        hashes = executor.map(hash_password_sync, [pw for _, pw in plaintext])
+        rows = [
+            {"user_id": user_id, "old_password": password, "new_password": hashed}
+            for (user_id, password), hashed in zip(plaintext, hashes)
+        ]
+
+    # Skip rows whose password changed while hashing
+    bind.execute(
+        users.update()
+        .where(
+            users.c.id == sa.bindparam("user_id"),
+            users.c.password == sa.bindparam("old_password"),
+        )
+        .values(password=sa.bindparam("new_password")),
+        rows,
+    )
+
+
+def downgrade() -> None:
+    # Hashes cannot be turned back into plaintext
+    pass
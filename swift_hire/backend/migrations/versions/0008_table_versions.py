@@ -0,0 +1,32 @@
+"""per-table version counters for conditional GET
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 00:00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from migrations.helpers import create_table_if_missing
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    create_table_if_missing(
+        "table_versions",
+        sa.Column("table_name", sa.String(64), primary_key=True),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.TIMESTAMP(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("table_versions")
@@ -0,0 +1,232 @@
+"""integer foreign keys in place of email links
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18 00:00:00
+
+"""
+
+import logging
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from migrations.helpers import (
+    create_index_if_missing,
+    drop_index_if_exists,
+    has_column,
+    has_foreign_key,
+    has_table,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "0009"
+down_revision: Union[str, None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+# (table, column, referenced table); the email column each id replaces as
+# the link is kept for the API
+FOREIGN_KEYS = [
+    ("job_posts", "interviewer_id", "interviewers"),
+    ("saved_jobs", "candidate_id", "candidates"),
+    ("saved_jobs", "job_id", "job_posts"),
+    ("job_applications", "candidate_id", "candidates"),
+    ("job_applications", "interviewer_id", "interviewers"),
+    ("job_applications", "job_id", "job_posts"),
+]
+
+# (table, id column, email column, referenced table)
+BACKFILLS = [
+    ("job_posts", "interviewer_id", "interviewer_email", "interviewers"),
+    ("saved_jobs", "candidate_id", "candidate_email", "candidates"),
+    ("job_applications", "candidate_id", "candidate_email", "candidates"),
+    ("job_applications", "interviewer_id", "interviewer_email", "interviewers"),
+]
+
+EMAIL_INDEXES = [
+    (
+        "ix_job_posts_interviewer_email_created_at_id",
+        "job_posts",
+        ["interviewer_email", "created_at", "id"],
+    ),
+    (
+        "ix_saved_jobs_candidate_email_created_at_id",
+        "saved_jobs",
+        ["candidate_email", "created_at", "id"],
+    ),
+    (
+        "ix_saved_jobs_candidate_email_job_id",
+        "saved_jobs",
+        ["candidate_email", "job_id"],
+    ),
+    (
+        "ix_job_applications_interviewer_email_created_at_id",
+        "job_applications",
+        ["interviewer_email", "created_at", "id"],
+    ),
+    (
+        "ix_job_applications_candidate_email_created_at_id",
+        "job_applications",
+        ["candidate_email", "created_at", "id"],
+    ),
+    (
+        "ix_job_applications_interviewer_email_status",
+        "job_applications",
+        ["interviewer_email", "status"],
+    ),
+    (
+        "ix_job_applications_candidate_email_job_id",
+        "job_applications",
+        ["candidate_email", "job_id"],
+    ),
+]
+
+ID_INDEXES = [
+    (
+        "ix_job_posts_interviewer_id_created_at_id",
+        "job_posts",
+        ["interviewer_id", "created_at", "id"],
+    ),
+    (
+        "ix_saved_jobs_candidate_id_created_at_id",
+        "saved_jobs",
+        ["candidate_id", "created_at", "id"],
+    ),
+    ("ix_saved_jobs_candidate_id_job_id", "saved_jobs", ["candidate_id", "job_id"]),
+    ("ix_saved_jobs_job_id", "saved_jobs", ["job_id"]),
+    (
+        "ix_job_applications_interviewer_id_created_at_id",
+        "job_applications",
+        ["interviewer_id", "created_at", "id"],
+    ),
+    (
+        "ix_job_applications_candidate_id_created_at_id",
+        "job_applications",
+        ["candidate_id", "created_at", "id"],
+    ),
+    (
+        "ix_job_applications_interviewer_id_status",
+        "job_applications",
+        ["interviewer_id", "status"],
+    ),
+    (
+        "ix_job_applications_candidate_id_job_id",
+        "job_applications",
+        ["candidate_id", "job_id"],
+    ),
+]
+
+
+def _foreign_key_name(table: str, column: str, referenced: str) -> str:
+    return f"fk_{table}_{column}_{referenced}"
+
+
+# Saved jobs and applications outlive their job post only through manual
+# deletes, and would violate the job_id constraint. They are moved to
+# archived_<table> rather than dropped, and moved back on downgrade;
+# parents come first.
+ARCHIVED_TABLES = ["job_applications", "notes", "saved_jobs"]
+
+
+def _orphan_filter(table: str) -> str:
+    deleted_job = "job_id NOT IN (SELECT id FROM job_posts)"
+    if table == "notes":
+        return (
+            f"application_id IN (SELECT id FROM job_applications WHERE {deleted_job})"
+        )
+    return deleted_job
+
+
+def _archive_rows_of_deleted_jobs() -> None:
+    bind = op.get_bind()
+    # Children first: notes are matched through their application
+    for table in reversed(ARCHIVED_TABLES):
+        where = _orphan_filter(table)
+        count = bind.execute(
+            sa.text(f"SELECT count(*) FROM {table} WHERE {where}")
+        ).scalar()
+        if not count:
+            continue
+        op.execute(
+            f"CREATE TABLE archived_{table} AS SELECT * FROM {table} WHERE {where}"
+        )
+        op.execute(f"DELETE FROM {table} WHERE {where}")
+        logger.info(
+            "Archived %d %s of deleted job posts into archived_%s", count, table, table
+        )
+
+
+def _restore_rows_of_deleted_jobs() -> None:
+    for table in ARCHIVED_TABLES:
+        archive = f"archived_{table}"
+        if not has_table(archive):
+            continue
+        # By name: batch operations may have rebuilt the table with its
+        # columns in another order
+        columns = ", ".join(
+            column["name"] for column in sa.inspect(op.get_bind()).get_columns(table)
+        )
+        op.execute(f"INSERT INTO {table} ({columns}) SELECT {columns} FROM {archive}")
+        op.drop_table(archive)
+
+
+def upgrade() -> None:
+    _archive_rows_of_deleted_jobs()
+
+    for name, table, _ in EMAIL_INDEXES:
+        drop_index_if_exists(name, table)
+
+    for table in ("job_posts", "saved_jobs", "job_applications"):
+        with op.batch_alter_table(table) as batch_op:
+            for fk_table, column, referenced in FOREIGN_KEYS:
+                if fk_table != table:
+                    continue
+                if not has_column(table, column):
+                    batch_op.add_column(sa.Column(column, sa.Integer(), nullable=True))
+                name = _foreign_key_name(table, column, referenced)
+                if not has_foreign_key(table, name):
+                    batch_op.create_foreign_key(name, referenced, [column], ["id"])
+
+    # Link existing rows through their email; rows whose email matches no
+    # candidate or interviewer keep a NULL id
+    for table, id_column, email_column, referenced in BACKFILLS:
+        target = sa.table(table, sa.column(id_column), sa.column(email_column))
+        source = sa.table(referenced, sa.column("id"), sa.column("email"))
+        op.execute(
+            target.update()
+            .where(target.c[id_column].is_(None))
+            .values(
+                {
+                    id_column: sa.select(source.c.id)
+                    .where(source.c.email == target.c[email_column])
+                    .scalar_subquery()
+                }
+            )
+        )
+
+    for name, table, columns in ID_INDEXES:
+        create_index_if_missing(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(ID_INDEXES):
+        drop_index_if_exists(name, table)
+
+    for table in ("job_applications", "saved_jobs", "job_posts"):
+        with op.batch_alter_table(table) as batch_op:
+            for fk_table, column, referenced in reversed(FOREIGN_KEYS):
+                if fk_table != table:
+                    continue
+                batch_op.drop_constraint(
+                    _foreign_key_name(table, column, referenced), type_="foreignkey"
+                )
+                if column != "job_id":
+                    batch_op.drop_column(column)
+
+    for name, table, columns in EMAIL_INDEXES:
+        create_index_if_missing(name, table, columns)
+
+    _restore_rows_of_deleted_jobs()
@@ -0,0 +1,71 @@
+"""materialized per-candidate dashboard counters
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18 00:00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from migrations.helpers import create_table_if_missing
+
+# revision identifiers, used by Alembic.
+revision: str = "0010"
+down_revision: Union[str, None] = "0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _count(table: str, candidates: sa.TableClause) -> sa.ScalarSelect:
+    rows = sa.table(table, sa.column("candidate_id"))
+    return (
+        sa.select(sa.func.count())
+        .select_from(rows)
+        .where(rows.c.candidate_id == candidates.c.id)
+        .scalar_subquery()
+    )
+
+
+def upgrade() -> None:
+    create_table_if_missing(
+        "user_counters",
+        sa.Column("candidate_id", sa.Integer(), primary_key=True),
+        sa.Column("applications", sa.Integer(), nullable=False),
+        sa.Column("saved_jobs", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.TIMESTAMP(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["candidate_id"],
+            ["candidates.id"],
+            name="fk_user_counters_candidate_id_candidates",
+        ),
+    )
+
+    # Recount from scratch, so rows written before the migration ran (the
+    # table may come from create_all) are corrected too
+    counters = sa.table(
+        "user_counters",
+        sa.column("candidate_id"),
+        sa.column("applications"),
+        sa.column("saved_jobs"),
+        sa.column("updated_at"),
+    )
+    candidates = sa.table("candidates", sa.column("id"))
+    op.execute(counters.delete())
+    op.execute(
+        counters.insert().from_select(
+            ["candidate_id", "applications", "saved_jobs", "updated_at"],
+            sa.select(
+                candidates.c.id,
+                _count("job_applications", candidates),
+                _count("saved_jobs", candidates),
+                sa.func.current_timestamp(),
+            ),
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_counters")
@@ -0,0 +1,46 @@
+"""indexes for the interviewer dashboard
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-18 00:00:00
+
+"""
+
+from typing import Sequence, Union
+
+from migrations.helpers import create_index_if_missing, drop_index_if_exists
+
+# revision identifiers, used by Alembic.
+revision: str = "0011"
+down_revision: Union[str, None] = "0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (replaced index, its columns, replacement, its columns); each replacement
+# starts with the replaced index's columns, so it serves the same lookups
+REPLACEMENTS = [
+    (
+        "ix_job_applications_interviewer_id_status",
+        ["interviewer_id", "status"],
+        "ix_job_applications_interviewer_id_status_interview_schedule",
+        ["interviewer_id", "status", "interview_schedule"],
+    ),
+    (
+        "ix_job_applications_job_id",
+        ["job_id"],
+        "ix_job_applications_job_id_status",
+        ["job_id", "status"],
+    ),
+]
+
+
+def upgrade() -> None:
+    for old_name, _, new_name, new_columns in REPLACEMENTS:
+        create_index_if_missing(new_name, "job_applications", new_columns)
+        drop_index_if_exists(old_name, "job_applications")
+
+
+def downgrade() -> None:
+    for old_name, old_columns, new_name, _ in reversed(REPLACEMENTS):
+        create_index_if_missing(old_name, "job_applications", old_columns)
+        drop_index_if_exists(new_name, "job_applications")
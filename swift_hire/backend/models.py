@@ -4,10 +4,12 @@ from sqlalchemy import (
     Column,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
 )
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.sql import func
 from database import Base
 
@@ -52,6 +54,39 @@ class JobPost(Base):
     description = Column(Text, nullable=False)
     skills = Column(Text, nullable=False)
     interviewer_email = Column(String(255), nullable=False)
+    interviewer_id = Column(Integer, ForeignKey("interviewers.id"), nullable=True)
+    created_at = Column(TIMESTAMP, server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_job_posts_created_at_id", "created_at", "id"),
+        Index(
+            "ix_job_posts_interviewer_id_created_at_id",
+            "interviewer_id",
+            "created_at",
+            "id",
+        ),
+    )
+
+
+class JobSkill(Base):
+    __tablename__ = "job_skills"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(Integer, ForeignKey("job_posts.id"), nullable=False, index=True)
+    skill = Column(String(100), nullable=False)  # Normalized (lower-cased) skill
+
+    __table_args__ = (Index("ix_job_skills_skill_job_id", "skill", "job_id"),)
+
+
+class Blob(Base):
+    __tablename__ = "blobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    sha256 = Column(String(64), unique=True, nullable=False)
+    path = Column(String(255), nullable=False)  # Relative to the working directory
+    size = Column(Integer, nullable=False)
+    content_type = Column(String(255), nullable=True)
+    refcount = Column(Integer, nullable=False, default=0)
     created_at = Column(TIMESTAMP, server_default=func.now())
 
 
@@ -64,6 +99,11 @@ class Candidate(Base):
     skills = Column(Text, nullable=False)
     resume = Column(String(255), nullable=False)
     profile_image = Column(String(255), nullable=True, default="/images/user.jpg")
+    # Stored content behind resume / profile_image when they were uploaded
+    resume_blob_id = Column(Integer, ForeignKey("blobs.id"), nullable=True)
+    profile_image_blob_id = Column(Integer, ForeignKey("blobs.id"), nullable=True)
+    # Small avatar variant of profile_image, filled in by a background task
+    profile_thumbnail = Column(String(255), nullable=True)
     bio = Column(Text, nullable=True)
     education = Column(
         Enum(
@@ -86,23 +126,75 @@ class Candidate(Base):
     )
     created_at = Column(TIMESTAMP, server_default=func.now())
 
+    __table_args__ = (Index("ix_candidates_created_at_id", "created_at", "id"),)
+
+    @hybrid_property
+    def list_image(self):
+        """
+        Image shown in candidate lists: the thumbnail once it has been
+        generated, the original profile image until then
+        """
+        return self.profile_thumbnail or self.profile_image
+
+    @list_image.expression
+    def list_image(cls):
+        return func.coalesce(cls.profile_thumbnail, cls.profile_image)
+
+
+class CandidateSkill(Base):
+    __tablename__ = "candidate_skills"
+
+    id = Column(Integer, primary_key=True, index=True)
+    candidate_id = Column(
+        Integer, ForeignKey("candidates.id"), nullable=False, index=True
+    )
+    skill = Column(String(100), nullable=False)  # Normalized (lower-cased) skill
+
+    __table_args__ = (
+        Index("ix_candidate_skills_skill_candidate_id", "skill", "candidate_id"),
+    )
+
+
+class ResumeDocument(Base):
+    __tablename__ = "resume_documents"
+
+    candidate_id = Column(Integer, ForeignKey("candidates.id"), primary_key=True)
+    source = Column(String(255), nullable=False)  # Candidate.resume it came from
+    content = Column(Text, nullable=False)  # Extracted plain text
+    extracted_at = Column(TIMESTAMP, server_default=func.now())
+    # Full-text index columns/tables live outside the ORM, see resume_search.py
+
 
 class SavedJob(Base):
     __tablename__ = "saved_jobs"
 
     id = Column(Integer, primary_key=True, index=True)
     candidate_email = Column(String(255), nullable=False)
-    job_id = Column(Integer, nullable=False)
+    candidate_id = Column(Integer, ForeignKey("candidates.id"), nullable=True)
+    job_id = Column(Integer, ForeignKey("job_posts.id"), nullable=False)
     created_at = Column(TIMESTAMP, server_default=func.now())
 
+    __table_args__ = (
+        Index(
+            "ix_saved_jobs_candidate_id_created_at_id",
+            "candidate_id",
+            "created_at",
+            "id",
+        ),
+        Index("ix_saved_jobs_candidate_id_job_id", "candidate_id", "job_id"),
+        Index("ix_saved_jobs_job_id", "job_id"),
+    )
+
 
 class JobApplication(Base):
     __tablename__ = "job_applications"
 
     id = Column(Integer, primary_key=True, index=True)
     candidate_email = Column(String(255), nullable=False)
-    job_id = Column(Integer, nullable=False)
+    candidate_id = Column(Integer, ForeignKey("candidates.id"), nullable=True)
+    job_id = Column(Integer, ForeignKey("job_posts.id"), nullable=False)
     interviewer_email = Column(String(255), nullable=False)
+    interviewer_id = Column(Integer, ForeignKey("interviewers.id"), nullable=True)
     status = Column(
         Enum("Applied", "Shortlisted", "Rejected", name="application_status"),
         default="Applied",
@@ -114,6 +206,31 @@ class JobApplication(Base):
     interview_description = Column(Text, nullable=True)  # Meeting description
     created_at = Column(TIMESTAMP, server_default=func.now())
 
+    __table_args__ = (
+        Index("ix_job_applications_created_at_id", "created_at", "id"),
+        Index(
+            "ix_job_applications_interviewer_id_created_at_id",
+            "interviewer_id",
+            "created_at",
+            "id",
+        ),
+        Index(
+            "ix_job_applications_candidate_id_created_at_id",
+            "candidate_id",
+            "created_at",
+            "id",
+        ),
+        Index("ix_job_applications_status_created_at_id", "status", "created_at", "id"),
+        Index(
+            "ix_job_applications_interviewer_id_status_interview_schedule",
+            "interviewer_id",
+            "status",
+            "interview_schedule",
+        ),
+        Index("ix_job_applications_candidate_id_job_id", "candidate_id", "job_id"),
+        Index("ix_job_applications_job_id_status", "job_id", "status"),
+    )
+
 
 class Feedback(Base):
     __tablename__ = "feedback"
@@ -130,6 +247,11 @@ class Feedback(Base):
     message = Column(Text, nullable=False)  # Feedback message
     created_at = Column(TIMESTAMP, server_default=func.now())
 
+    __table_args__ = (
+        Index("ix_feedback_created_at_id", "created_at", "id"),
+        Index("ix_feedback_user_email_created_at_id", "user_email", "created_at", "id"),
+    )
+
 
 class Note(Base):
     __tablename__ = "notes"
@@ -141,3 +263,51 @@ class Note(Base):
         String(255), nullable=False
     )  # Email of user who created the note
     created_at = Column(TIMESTAMP, server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_notes_application_id_created_at", "application_id", "created_at"),
+    )
+
+
+class EmailOutbox(Base):
+    __tablename__ = "email_outbox"
+
+    id = Column(Integer, primary_key=True, index=True)
+    to_email = Column(String(255), nullable=False)
+    subject = Column(String(255), nullable=False)
+    message = Column(Text, nullable=False)  # Fully rendered MIME message
+    status = Column(
+        Enum("Pending", "Sending", "Sent", "Failed", name="outbox_status"),
+        nullable=False,
+        default="Pending",
+    )
+    attempts = Column(Integer, nullable=False, default=0)
+    # When the row may next be claimed; doubles as the lease expiry while Sending
+    next_attempt_at = Column(TIMESTAMP, nullable=False)
+    last_error = Column(Text, nullable=True)
+    sent_at = Column(TIMESTAMP, nullable=True)
+    created_at = Column(TIMESTAMP, server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+
+class TableVersion(Base):
+    __tablename__ = "table_versions"
+
+    # Bumped in the same transaction as every ORM write to the table
+    table_name = Column(String(64), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(TIMESTAMP, nullable=False)
+
+
+class UserCounter(Base):
+    __tablename__ = "user_counters"
+
+    # Dashboard badge counts, adjusted in the same transaction as the rows
+    # they count
+    candidate_id = Column(Integer, ForeignKey("candidates.id"), primary_key=True)
+    applications = Column(Integer, nullable=False, default=0)
+    saved_jobs = Column(Integer, nullable=False, default=0)
+    updated_at = Column(TIMESTAMP, nullable=False)
@@ -0,0 +1,189 @@
+import os
+import random
+import threading
+from datetime import datetime, timedelta, timezone
+from email.message import Message
+from typing import Callable, List, Optional
+
+from database import SessionLocal
+from dotenv import load_dotenv
+from mailer import send_message
+from models import EmailOutbox
+from sqlalchemy.orm import Session, sessionmaker
+
+load_dotenv()
+
+EMAIL_WORKERS = int(os.getenv("EMAIL_WORKERS", "2"))
+EMAIL_MAX_ATTEMPTS = int(os.getenv("EMAIL_MAX_ATTEMPTS", "5"))
+EMAIL_RETRY_BASE_SECONDS = float(os.getenv("EMAIL_RETRY_BASE_SECONDS", "30"))
+EMAIL_RETRY_MAX_SECONDS = float(os.getenv("EMAIL_RETRY_MAX_SECONDS", "3600"))
+EMAIL_POLL_SECONDS = float(os.getenv("EMAIL_POLL_SECONDS", "5"))
+# A row stuck in Sending longer than this (e.g. the worker died) is retried
+EMAIL_SEND_LEASE_SECONDS = float(os.getenv("EMAIL_SEND_LEASE_SECONDS", "300"))
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def enqueue_email(db: Session, to_email: str, msg: Message) -> EmailOutbox:
+    """
+    Add a message to the outbox. It is sent once the caller's transaction
+    commits, so the email and the change that triggered it succeed or fail
+    together.
+    """
+    entry = EmailOutbox(
+        to_email=to_email,
+        subject=str(msg["Subject"] or ""),
+        message=msg.as_string(),
+        status="Pending",
+        attempts=0,
+        next_attempt_at=_utcnow(),
+    )
+    db.add(entry)
+    return entry
+
+
+def retry_delay(attempts: int) -> float:
+    """
+    Exponential backoff with jitter for the given number of failed attempts
+    """
+    delay = min(
+        EMAIL_RETRY_BASE_SECONDS * (2 ** max(attempts - 1, 0)), EMAIL_RETRY_MAX_SECONDS
+    )
+    return delay * random.uniform(0.8, 1.2)
+
+
+class OutboxWorkerPool:
+    """
+    Background threads that drain the email outbox. Rows are claimed with a
+    conditional UPDATE, so several workers (or processes) can share a table.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker,
+        deliver: Callable[[str, str], None] = send_message,
+        workers: int = EMAIL_WORKERS,
+        poll_seconds: float = EMAIL_POLL_SECONDS,
+    ):
+        self.session_factory = session_factory
+        self.deliver = deliver
+        self.workers = workers
+        self.poll_seconds = poll_seconds
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> None:
+        if self._threads:
+            return
+        self._stopping.clear()
+        for index in range(self.workers):
+            thread = threading.Thread(
+                target=self._run, name=f"email-outbox-{index}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float = 10) -> None:
+        self._stopping.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def notify(self) -> None:
+        """
+        Wake idle workers after committing new outbox rows
+        """
+        self._wakeup.set()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            # Clear before polling so a notify() during processing is not lost
+            self._wakeup.clear()
+            try:
+                processed = self.process_one()
+            except Exception as e:
+                print(f"Email outbox worker error: {str(e)}")
+                processed = False
+
+            if not processed:
+                self._wakeup.wait(self.poll_seconds)
+
+    def process_one(self) -> bool:
+        """
+        Claim and deliver a single due message. Returns False when nothing
+        was due.
+        """
+        with self.session_factory() as db:
+            entry = self._claim(db)
+            if entry is None:
+                return False
+
+            try:
+                self.deliver(entry.to_email, entry.message)
+            except Exception as e:
+                entry.last_error = str(e)
+                if entry.attempts >= EMAIL_MAX_ATTEMPTS:
+                    entry.status = "Failed"
+                    print(f"Giving up on email to {entry.to_email}: {str(e)}")
+                else:
+                    entry.status = "Pending"
+                    entry.next_attempt_at = _utcnow() + timedelta(
+                        seconds=retry_delay(entry.attempts)
+                    )
+                    print(f"Failed to send email to {entry.to_email}: {str(e)}")
+            else:
+                entry.status = "Sent"
+                entry.sent_at = _utcnow()
+                entry.last_error = None
+                print(f"Email sent successfully to {entry.to_email}")
+
+            db.commit()
+            return True
+
+    def _claim(self, db: Session) -> Optional[EmailOutbox]:
+        now = _utcnow()
+        for _ in range(3):
+            candidate = (
+                db.query(
+                    EmailOutbox.id, EmailOutbox.status, EmailOutbox.next_attempt_at
+                )
+                .filter(
+                    EmailOutbox.status.in_(["Pending", "Sending"]),
+                    EmailOutbox.next_attempt_at <= now,
+                )
+                .order_by(EmailOutbox.next_attempt_at)
+                .first()
+            )
+            if candidate is None:
+                return None
+
+            claimed = (
+                db.query(EmailOutbox)
+                .filter(
+                    EmailOutbox.id == candidate.id,
+                    EmailOutbox.status == candidate.status,
+                    EmailOutbox.next_attempt_at == candidate.next_attempt_at,
+                )
+                .update(
+                    {
+                        EmailOutbox.status: "Sending",
+                        EmailOutbox.attempts: EmailOutbox.attempts + 1,
+                        EmailOutbox.next_attempt_at: now
+                        + timedelta(seconds=EMAIL_SEND_LEASE_SECONDS),
+                    },
+                    synchronize_session=False,
+                )
+            )
+            db.commit()
+            if claimed:
+                return (
+                    db.query(EmailOutbox).filter(EmailOutbox.id == candidate.id).one()
+                )
+        return None
+
+
+worker_pool = OutboxWorkerPool(SessionLocal)
@@ -0,0 +1,134 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, Query
+from sqlalchemy import DateTime, String, bindparam, tuple_
+from sqlalchemy.types import TypeDecorator
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+class CursorDateTime(TypeDecorator):
+    """
+    Binds datetime cursor values. SQLite stores CURRENT_TIMESTAMP defaults as
+    text without fractional seconds, so the value must be rendered the same
+    way for the text comparison to line up.
+    """
+
+    impl = DateTime
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "sqlite":
+            return dialect.type_descriptor(String())
+        return dialect.type_descriptor(DateTime())
+
+    def process_bind_param(self, value, dialect):
+        if dialect.name == "sqlite" and value is not None:
+            if value.microsecond:
+                return value.strftime("%Y-%m-%d %H:%M:%S.%f")
+            return value.strftime("%Y-%m-%d %H:%M:%S")
+        return value
+
+
+class CursorParams:
+    """
+    Query parameters shared by every cursor-paginated list endpoint
+    """
+
+    def __init__(
+        self,
+        cursor: Optional[str] = Query(
+            None, description="Opaque cursor from the previous page's X-Next-Cursor"
+        ),
+        limit: int = Query(
+            DEFAULT_PAGE_SIZE,
+            ge=1,
+            le=MAX_PAGE_SIZE,
+            description="Number of records per page",
+        ),
+    ):
+        self.cursor = cursor
+        self.limit = limit
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    payload = [
+        value.isoformat() if isinstance(value, datetime) else value for value in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str, columns: Sequence) -> List[Any]:
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, list) or len(payload) != len(columns):
+            raise ValueError("cursor does not match this listing")
+        return [
+            (
+                datetime.fromisoformat(value)
+                if isinstance(column.type, DateTime) and value is not None
+                else value
+            )
+            for column, value in zip(columns, payload)
+        ]
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+
+def apply_keyset(query, columns: Sequence, cursor: Optional[str], limit: int):
+    """
+    Order a query newest-first by `columns` (e.g. created_at, id), continue
+    after `cursor` and fetch one extra row to detect whether a next page
+    exists. Works on both ORM queries and select() statements.
+    """
+    if cursor:
+        values = [
+            (
+                bindparam(None, value, type_=CursorDateTime())
+                if isinstance(value, datetime)
+                else value
+            )
+            for value in decode_cursor(cursor, columns)
+        ]
+        query = query.filter(tuple_(*columns) < tuple_(*values))
+    return query.order_by(*[column.desc() for column in columns]).limit(limit + 1)
+
+
+def keyset_page(
+    rows: Sequence,
+    columns: Sequence,
+    limit: int,
+    entity: Callable[[Any], Any] = lambda row: row,
+) -> Tuple[List, Optional[str]]:
+    """
+    Trim the extra row fetched by apply_keyset and build the cursor for the
+    next page, or None on the last page. `entity` picks the object holding
+    the key columns out of each row.
+    """
+    rows = list(rows)
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = entity(rows[-1])
+    return rows, encode_cursor([getattr(last, column.key) for column in columns])
+
+
+def created_key(model) -> Tuple:
+    """
+    The (created_at, id) pagination key of a model
+    """
+    return (model.created_at, model.id)
+
+
+def set_next_cursor(response, next_cursor: Optional[str]) -> None:
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
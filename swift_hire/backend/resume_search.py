@@ -0,0 +1,174 @@
+import os
+import re
+from pathlib import Path
+from typing import List, Tuple
+
+import docx
+from database import SessionLocal
+from models import Candidate, ResumeDocument
+from pypdf import PdfReader
+from sqlalchemy import cast, column, func, literal_column, or_, table
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, sessionmaker
+
+# Text search configuration of the Postgres search_vector column
+SEARCH_CONFIG = "english"
+# Extracted text beyond this is not indexed
+RESUME_TEXT_MAX_CHARS = int(os.getenv("RESUME_TEXT_MAX_CHARS", "200000"))
+
+# Maintained outside the ORM by migration 0006: a generated tsvector column
+# on Postgres and an external-content FTS5 table on SQLite
+SEARCH_VECTOR = literal_column("resume_documents.search_vector")
+RESUME_FTS = table("resume_documents_fts", column("rowid"))
+
+
+def _pdf_text(path: str) -> str:
+    pages = []
+    for page in PdfReader(path).pages:
+        try:
+            pages.append(page.extract_text() or "")
+        except Exception:
+            continue  # Skip pages pypdf cannot decode
+    return "\n".join(pages)
+
+
+def _docx_text(path: str) -> str:
+    document = docx.Document(path)
+    parts = [paragraph.text for paragraph in document.paragraphs]
+    for doc_table in document.tables:
+        for row in doc_table.rows:
+            parts.extend(cell.text for cell in row.cells)
+    return "\n".join(parts)
+
+
+def _plain_text(path: str) -> str:
+    with open(path, encoding="utf-8", errors="ignore") as source:
+        return source.read(RESUME_TEXT_MAX_CHARS)
+
+
+EXTRACTORS = {
+    ".pdf": _pdf_text,
+    ".docx": _docx_text,
+    ".txt": _plain_text,
+}
+
+
+def extract_text(path: str) -> str:
+    """
+    Plain text of a PDF, DOCX or TXT resume; empty for other formats
+    """
+    extractor = EXTRACTORS.get(Path(path).suffix.lower())
+    if extractor is None:
+        return ""
+    text = extractor(path).replace("\x00", "")
+    return re.sub(r"\s+", " ", text).strip()[:RESUME_TEXT_MAX_CHARS]
+
+
+def index_resume(
+    candidate_id: int, session_factory: sessionmaker = SessionLocal
+) -> None:
+    """
+    Background task run after a resume upload. Extracts the text of the
+    candidate's current resume into the search index.
+    """
+    with session_factory() as db:
+        candidate = db.get(Candidate, candidate_id)
+        if candidate is None:
+            return
+        source = candidate.resume
+
+        try:
+            content = extract_text(source)
+        except Exception as e:
+            print(f"Error extracting text from {source}: {str(e)}")
+            content = ""  # Index as empty so it is not retried on every start
+
+        # Skip if the resume was replaced while the text was being extracted
+        db.refresh(candidate)
+        if candidate.resume != source:
+            return
+
+        document = db.get(ResumeDocument, candidate_id)
+        if document is None:
+            document = ResumeDocument(candidate_id=candidate_id)
+            db.add(document)
+        document.source = source
+        document.content = content
+        document.extracted_at = func.now()
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()  # Indexed concurrently by another task
+
+
+def backfill_resume_index(session_factory: sessionmaker = SessionLocal) -> int:
+    """
+    Index candidates whose resume has no (or outdated) extracted text, e.g.
+    uploaded before the index existed. Returns the number of resumes indexed.
+    """
+    with session_factory() as db:
+        candidate_ids = [
+            candidate_id
+            for (candidate_id,) in db.query(Candidate.id)
+            .outerjoin(ResumeDocument, ResumeDocument.candidate_id == Candidate.id)
+            .filter(
+                or_(
+                    ResumeDocument.candidate_id.is_(None),
+                    ResumeDocument.source != Candidate.resume,
+                )
+            )
+            .all()
+        ]
+
+    for candidate_id in candidate_ids:
+        index_resume(candidate_id, session_factory)
+    return len(candidate_ids)
+
+
+def _fts5_query(q: str) -> str:
+    # Quote every word so user input is never parsed as FTS5 syntax
+    return " ".join(f'"{word}"' for word in re.findall(r"\w+", q))
+
+
+def search_resumes(
+    db: Session, q: str, offset: int, limit: int
+) -> Tuple[List[Tuple[Candidate, float]], int]:
+    """
+    Candidates whose resume matches the query, best match first, with the
+    total number of matches. Only the index is read, never the files.
+    """
+    dialect = db.get_bind().dialect.name
+    query = db.query(Candidate).join(
+        ResumeDocument, ResumeDocument.candidate_id == Candidate.id
+    )
+
+    if dialect == "postgresql":
+        ts_query = func.websearch_to_tsquery(cast(SEARCH_CONFIG, REGCONFIG), q)
+        rank = func.ts_rank_cd(SEARCH_VECTOR, ts_query)
+        query = query.filter(SEARCH_VECTOR.op("@@")(ts_query))
+        order_by = rank.desc()
+    elif dialect == "sqlite":
+        fts_query = _fts5_query(q)
+        if not fts_query:
+            return [], 0
+        # bm25() is lower for better matches
+        rank = -func.bm25(literal_column("resume_documents_fts"))
+        query = query.join(RESUME_FTS, RESUME_FTS.c.rowid == Candidate.id).filter(
+            literal_column("resume_documents_fts").op("MATCH")(fts_query)
+        )
+        order_by = rank.desc()
+    else:
+        rank = literal_column("0")
+        query = query.filter(ResumeDocument.content.ilike(f"%{q}%"))
+        order_by = Candidate.created_at.desc()
+
+    total = query.count()
+    rows = (
+        query.add_columns(rank.label("rank"))
+        .order_by(order_by, Candidate.id)
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
+    return [(candidate, float(score or 0)) for candidate, score in rows], total
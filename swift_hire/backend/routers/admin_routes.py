@@ -1,35 +1,57 @@
 from typing import List, Optional
 
-from database import get_db
-from fastapi import APIRouter, Depends, HTTPException, Query
+from database import get_async_db
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from lookups import link_candidate_rows, link_interviewer_rows
 from models import Candidate, Interviewer, User
+from pagination import CursorParams, apply_keyset, keyset_page, set_next_cursor
 from schemas import UserCreate, UserResponse, UserUpdate
-from sqlalchemy.orm import Session
+from security import hash_password
+from serialization import FAST_QUERY, RowSerializer
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
 
+# The users table has no created_at column, so it is paginated by id alone
+USER_KEY = (User.id,)
+USER_ROWS = RowSerializer(UserResponse, User, USER_KEY)
+
 
 # Get all users with optional filtering
 @router.get("/users", response_model=List[UserResponse])
 async def get_all_users(
+    response: Response,
     name: Optional[str] = Query(None, description="Filter by name (partial match)"),
     role: Optional[str] = Query(
         None, description="Filter by role (Candidate or Interviewer)"
     ),
-    db: Session = Depends(get_db),
+    page: CursorParams = Depends(),
+    fast: bool = FAST_QUERY,
+    db: AsyncSession = Depends(get_async_db),
 ):
     try:
-        query = db.query(User)
+        query = USER_ROWS.select() if fast else select(User)
 
         # Apply name filter if provided (case insensitive partial match)
         if name:
-            query = query.filter(User.name.ilike(f"%{name}%"))
+            query = query.where(User.name.ilike(f"%{name}%"))
 
         # Apply role filter if provided
         if role and role.lower() in ["candidate", "interviewer"]:
-            query = query.filter(User.role == role.capitalize())
+            query = query.where(User.role == role.capitalize())
+
+        query = apply_keyset(query, USER_KEY, page.cursor, page.limit)
+        if fast:
+            rows, next_cursor = keyset_page(
+                (await db.execute(query)).all(), USER_KEY, page.limit
+            )
+            return USER_ROWS.response(rows, next_cursor)
 
-        users = query.all()
+        users, next_cursor = keyset_page(
+            (await db.scalars(query)).all(), USER_KEY, page.limit
+        )
+        set_next_cursor(response, next_cursor)
 
         # Convert users to UserResponse format
         user_responses = [
@@ -37,15 +59,17 @@ async def get_all_users(
             for user in users
         ]
         return user_responses
+    except HTTPException as e:
+        raise e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving users: {str(e)}")
 
 
 # Get user by ID
 @router.get("/users/{user_id}", response_model=UserResponse)
-async def get_user(user_id: int, db: Session = Depends(get_db)):
+async def get_user(user_id: int, db: AsyncSession = Depends(get_async_db)):
     try:
-        user = db.query(User).filter(User.id == user_id).first()
+        user = await db.get(User, user_id)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
@@ -60,10 +84,10 @@ async def get_user(user_id: int, db: Session = Depends(get_db)):
 
 # Create new user (updated code for admin.py)
 @router.post("/users", response_model=UserResponse)
-async def create_user(user: UserCreate, db: Session = Depends(get_db)):
+async def create_user(user: UserCreate, db: AsyncSession = Depends(get_async_db)):
     try:
         # Check if email already exists
-        existing_user = db.query(User).filter(User.email == user.email).first()
+        existing_user = await db.scalar(select(User).where(User.email == user.email))
         if existing_user:
             raise HTTPException(status_code=400, detail="Email already registered")
 
@@ -78,7 +102,7 @@ async def create_user(user: UserCreate, db: Session = Depends(get_db)):
         new_user = User(
             name=user.name,
             email=user.email,
-            password=user.password,  # In production, you should hash this
+            password=await hash_password(user.password),
             role=user.role,
         )
 
@@ -97,6 +121,8 @@ async def create_user(user: UserCreate, db: Session = Depends(get_db)):
                 role="Candidate",
             )
             db.add(new_candidate)
+            await db.flush()
+            await db.run_sync(link_candidate_rows, new_candidate)
 
         # If role is Interviewer, also create entry in interviewers table
         elif user.role == "Interviewer":
@@ -110,9 +136,11 @@ async def create_user(user: UserCreate, db: Session = Depends(get_db)):
                 role="Interviewer",
             )
             db.add(new_interviewer)
+            await db.flush()
+            await db.run_sync(link_interviewer_rows, new_interviewer)
 
-        db.commit()
-        db.refresh(new_user)
+        await db.commit()
+        await db.refresh(new_user)
 
         return UserResponse(
             id=new_user.id, name=new_user.name, email=new_user.email, role=new_user.role
@@ -120,25 +148,25 @@ async def create_user(user: UserCreate, db: Session = Depends(get_db)):
     except HTTPException as e:
         raise e
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"Error creating user: {str(e)}")
 
 
 # Update user
 @router.put("/users/{user_id}", response_model=UserResponse)
 async def update_user(
-    user_id: int, user_update: UserUpdate, db: Session = Depends(get_db)
+    user_id: int, user_update: UserUpdate, db: AsyncSession = Depends(get_async_db)
 ):
     try:
         # Find user
-        user = db.query(User).filter(User.id == user_id).first()
+        user = await db.get(User, user_id)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
         # Check if email already exists (if changing email)
         if user_update.email != user.email:
-            existing_user = (
-                db.query(User).filter(User.email == user_update.email).first()
+            existing_user = await db.scalar(
+                select(User).where(User.email == user_update.email)
             )
             if existing_user:
                 raise HTTPException(status_code=400, detail="Email already registered")
@@ -156,8 +184,8 @@ async def update_user(
         user.role = user_update.role
 
         # Commit changes
-        db.commit()
-        db.refresh(user)
+        await db.commit()
+        await db.refresh(user)
 
         return UserResponse(
             id=user.id, name=user.name, email=user.email, role=user.role
@@ -165,26 +193,26 @@ async def update_user(
     except HTTPException as e:
         raise e
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"Error updating user: {str(e)}")
 
 
 # Delete user
 @router.delete("/users/{user_id}")
-async def delete_user(user_id: int, db: Session = Depends(get_db)):
+async def delete_user(user_id: int, db: AsyncSession = Depends(get_async_db)):
     try:
         # Find user
-        user = db.query(User).filter(User.id == user_id).first()
+        user = await db.get(User, user_id)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
         # Delete user
-        db.delete(user)
-        db.commit()
+        await db.delete(user)
+        await db.commit()
 
         return {"message": "User deleted successfully"}
     except HTTPException as e:
         raise e
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"Error deleting user: {str(e)}")
@@ -1,8 +1,10 @@
-from database import get_db
+from database import get_async_db
 from fastapi import APIRouter, Depends, Form, HTTPException
 from models import User
 from schemas import LoginUserResponse
-from sqlalchemy.orm import Session
+from security import create_access_token, verify_password
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter(tags=["authentication"])
 
@@ -12,17 +14,29 @@ router = APIRouter(tags=["authentication"])
 async def login(
     email: str = Form(...),
     password: str = Form(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     try:
         # Find user by email
-        user = db.query(User).filter(User.email == email).first()
+        user = await db.scalar(select(User).where(User.email == email))
 
         # Check if user exists and password matches
-        if not user or user.password != password:
+        valid, new_hash = await verify_password(password, user and user.password)
+        if not valid:
             raise HTTPException(status_code=401, detail="Invalid email or password")
 
-        return LoginUserResponse(name=user.name, email=user.email, role=user.role)
+        # Upgrade plaintext or outdated hashes while the password is known
+        if new_hash:
+            user.password = new_hash
+            await db.commit()
+
+        return LoginUserResponse(
+            name=user.name,
+            email=user.email,
+            role=user.role,
+            access_token=create_access_token(user.email, user.role, user.name),
+            token_type="bearer",
+        )
 
     except Exception as e:
         if isinstance(e, HTTPException):
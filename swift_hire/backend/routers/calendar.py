@@ -1,4 +1,3 @@
-import os
 import smtplib
 from datetime import datetime
 from email.mime.multipart import MIMEMultipart
@@ -9,6 +8,7 @@ import models
 from database import get_db
 from dotenv import load_dotenv
 from fastapi import APIRouter, Depends, HTTPException, status
+from mailer import EMAIL_SENDER, send_message
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
@@ -20,12 +20,6 @@ router = APIRouter(
     tags=["calendar"],
 )
 
-# Email configuration
-EMAIL_SENDER = os.getenv("EMAIL_SENDER")
-EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD")
-SMTP_SERVER = "smtp.gmail.com"
-SMTP_PORT = 587
-
 
 class CalendarInviteRequest(BaseModel):
     candidate_email: str
@@ -164,15 +158,8 @@ Recruitment Team
         msg.attach(cal_attachment)
 
         try:
-            # Connect to Gmail's SMTP server
-            server = smtplib.SMTP(SMTP_SERVER, SMTP_PORT)
-            server.starttls()  # Enable TLS
-            server.login(EMAIL_SENDER, EMAIL_PASSWORD)
-            # Send email
-            server.sendmail(
-                EMAIL_SENDER, invite_request.candidate_email, msg.as_string()
-            )
-            server.quit()
+            # Send through the shared, already-authenticated SMTP pool
+            send_message(invite_request.candidate_email, msg)
             print(
                 f"Calendar invite sent successfully to {invite_request.candidate_email}"
             )
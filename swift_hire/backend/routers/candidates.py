@@ -1,23 +1,73 @@
-import random
 from typing import List, Optional
 
-from database import get_db
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+from blobs import release_blob, store_upload
+from conditional import ConditionalGet
+from counters import adjust_counters, counters_for
+from database import get_async_db
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+)
+from lookups import candidate_id_for, link_candidate_rows
 from models import Candidate, JobPost, SavedJob, User
+from pagination import (
+    CursorParams,
+    apply_keyset,
+    created_key,
+    keyset_page,
+    set_next_cursor,
+)
+from resume_search import index_resume, search_resumes
 from schemas import (
     CandidateResponse,
-    JobPostResponse,
+    CandidateSearchResult,
+    CandidateSummary,
+    JobPostSummary,
     LoginUserResponse,
+    PaginatedCandidateSearch,
     SavedJobResponse,
 )
-from sqlalchemy.orm import Session
+from security import hash_password
+from serialization import FAST_QUERY, RowSerializer, SparseFields
+from skills import (
+    candidates_with_skills,
+    normalize_skills,
+    random_jobs,
+    recommend_jobs,
+    sync_candidate_skills,
+)
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
+from thumbnails import generate_profile_thumbnail
 
 router = APIRouter(tags=["candidates"])
 
+CANDIDATE_KEY = created_key(Candidate)
+SAVED_JOB_KEY = created_key(SavedJob)
+# List routes return CandidateSummary unless other fields are requested, with
+# the thumbnail as profile_image like CandidateSummary
+CANDIDATE_ROWS = RowSerializer(
+    CandidateResponse,
+    Candidate,
+    CANDIDATE_KEY,
+    CandidateSummary.model_fields,
+    sources={"profile_image": Candidate.list_image},
+)
+CANDIDATE_FIELDS = SparseFields(CandidateResponse)
+
 
 # Register a candidate
 @router.post("/register/candidate", response_model=LoginUserResponse)
 async def register_candidate(
+    background_tasks: BackgroundTasks,
     name: str = Form(...),
     email: str = Form(...),
     password: str = Form(...),
@@ -25,56 +75,39 @@ async def register_candidate(
     bio: Optional[str] = Form(None),
     resume: UploadFile = File(...),
     profile_image: Optional[UploadFile] = File(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     try:
         # Check if the email already exists in users table
-        if db.query(User).filter(User.email == email).first():
+        if await db.scalar(select(User).where(User.email == email)):
             raise HTTPException(status_code=400, detail="Email already exists")
 
         # Check if email exists in candidates table
-        if db.query(Candidate).filter(Candidate.email == email).first():
+        if await db.scalar(select(Candidate).where(Candidate.email == email)):
             raise HTTPException(status_code=400, detail="Email already exists")
 
         # Save the resume file
-        safe_filename = f"{email}_resume_{resume.filename}".replace(" ", "_")
-        resume_filename = f"uploads/{safe_filename}"
-
-        try:
-            with open(resume_filename, "wb") as buffer:
-                buffer.write(await resume.read())
-        except Exception as e:
-            raise HTTPException(
-                status_code=500, detail=f"Error saving resume: {str(e)}"
-            )
+        resume_blob = await store_upload(db, resume)
 
         # Default profile image path
         profile_image_filename = "/images/user.jpg"
+        profile_image_blob_id = None
 
         # If profile image is uploaded, save it
         if profile_image:
-            safe_filename = f"{email}_profile_{profile_image.filename}".replace(
-                " ", "_"
-            )
-            profile_image_filename = f"uploads/{safe_filename}"
-
-            try:
-                with open(profile_image_filename, "wb") as buffer:
-                    buffer.write(await profile_image.read())
-            except Exception as e:
-                raise HTTPException(
-                    status_code=500, detail=f"Error saving profile image: {str(e)}"
-                )
+            profile_image_blob = await store_upload(db, profile_image)
+            profile_image_filename = profile_image_blob.path
+            profile_image_blob_id = profile_image_blob.id
 
         # Create user record - no created_at field
         user = User(
             name=name,
             email=email,
-            password=password,
+            password=await hash_password(password),
             role="Candidate",
         )
         db.add(user)
-        db.flush()  # Flush changes to DB to get user ID but don't commit yet
+        await db.flush()  # Flush changes to DB to get user ID but don't commit yet
 
         # Create candidate record with new fields
         candidate = Candidate(
@@ -82,17 +115,28 @@ async def register_candidate(
             email=email,
             skills=skills,
             bio=bio,
-            resume=resume_filename,
+            resume=resume_blob.path,
+            resume_blob_id=resume_blob.id,
             profile_image=profile_image_filename,
+            profile_image_blob_id=profile_image_blob_id,
             role="Candidate",
         )
         db.add(candidate)
-        db.commit()  # Commit both records
+        await db.flush()  # Assign the candidate ID before indexing skills
+        await db.run_sync(sync_candidate_skills, candidate)
+        await db.run_sync(link_candidate_rows, candidate)
+        await db.commit()  # Commit both records
+
+        background_tasks.add_task(index_resume, candidate.id)
+        if profile_image_blob_id is not None:
+            background_tasks.add_task(
+                generate_profile_thumbnail, candidate.id, profile_image_blob_id
+            )
 
         return LoginUserResponse(name=user.name, email=user.email, role=user.role)
 
     except Exception as e:
-        db.rollback()  # Roll back any changes if error occurs
+        await db.rollback()  # Roll back any changes if error occurs
         if isinstance(e, HTTPException):
             raise e
         raise HTTPException(
@@ -100,11 +144,97 @@ async def register_candidate(
         )
 
 
+# Filter candidates by skills
+@router.get("/candidates/filter", response_model=List[CandidateSummary])
+async def filter_candidates_by_skills(
+    response: Response,
+    skills: str = "",  # Comma-separated skills
+    match: str = Query(
+        "any", pattern="^(any|all)$", description="Match any or all of the skills"
+    ),
+    page: CursorParams = Depends(),
+    fields: Optional[List[str]] = Depends(CANDIDATE_FIELDS),
+    db: AsyncSession = Depends(get_async_db),
+):
+    try:
+        skill_list = normalize_skills(skills)
+        if not skill_list:
+            query = select(Candidate)
+        else:
+            query = candidates_with_skills(skill_list, match == "all")
+
+        if fields is not None:
+            serializer = CANDIDATE_ROWS.only(fields)
+            query = apply_keyset(
+                query.with_only_columns(*serializer.columns),
+                CANDIDATE_KEY,
+                page.cursor,
+                page.limit,
+            )
+            rows, next_cursor = keyset_page(
+                (await db.execute(query)).all(), CANDIDATE_KEY, page.limit
+            )
+            return serializer.response(rows, next_cursor)
+
+        query = apply_keyset(
+            query.options(defer(Candidate.bio, raiseload=True)),
+            CANDIDATE_KEY,
+            page.cursor,
+            page.limit,
+        )
+        candidates, next_cursor = keyset_page(
+            (await db.scalars(query)).all(), CANDIDATE_KEY, page.limit
+        )
+        set_next_cursor(response, next_cursor)
+        return candidates
+    except Exception as e:
+        if isinstance(e, HTTPException):
+            raise e
+        raise HTTPException(
+            status_code=500, detail=f"Error filtering candidates: {str(e)}"
+        )
+
+
+# Search candidates by the text of their resume
+@router.get("/candidates/search", response_model=PaginatedCandidateSearch)
+async def search_candidates_by_resume(
+    q: str = Query(..., min_length=1, description="Words to find in resumes"),
+    page: int = Query(1, ge=1, description="Page number"),
+    limit: int = Query(10, ge=1, le=100, description="Number of records per page"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    try:
+        results, total = await db.run_sync(search_resumes, q, (page - 1) * limit, limit)
+        items = [
+            CandidateSearchResult(
+                **{
+                    **CandidateResponse.model_validate(candidate).model_dump(),
+                    "profile_image": candidate.list_image,
+                },
+                rank=rank,
+            )
+            for candidate, rank in results
+        ]
+        return PaginatedCandidateSearch(
+            items=items,
+            total=total,
+            page=page,
+            size=limit,
+            pages=(total + limit - 1) // limit if total > 0 else 1,
+        )
+    except Exception as e:
+        if isinstance(e, HTTPException):
+            raise e
+        raise HTTPException(
+            status_code=500, detail=f"Error searching candidates: {str(e)}"
+        )
+
+
 # Get candidate profile by email
 @router.get("/candidates/{email}", response_model=CandidateResponse)
-async def get_candidate(email: str, db: Session = Depends(get_db)):
+async def get_candidate(email: str, db: AsyncSession = Depends(get_async_db)):
     try:
-        candidate = db.query(Candidate).filter(Candidate.email == email).first()
+        candidate = await db.scalar(select(Candidate).where(Candidate.email == email))
         if not candidate:
             raise HTTPException(status_code=404, detail="Candidate not found")
         return candidate
@@ -120,6 +250,7 @@ async def get_candidate(email: str, db: Session = Depends(get_db)):
 @router.put("/candidates/{email}", response_model=CandidateResponse)
 async def update_candidate(
     email: str,
+    background_tasks: BackgroundTasks,
     name: str = Form(...),
     skills: str = Form(...),
     bio: Optional[str] = Form(None),
@@ -127,17 +258,18 @@ async def update_candidate(
     years_of_experience: Optional[int] = Form(0),
     resume: Optional[UploadFile] = File(None),
     profile_image: Optional[UploadFile] = File(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     try:
         # Find candidate by email
-        candidate = db.query(Candidate).filter(Candidate.email == email).first()
+        candidate = await db.scalar(select(Candidate).where(Candidate.email == email))
         if not candidate:
             raise HTTPException(status_code=404, detail="Candidate not found")
 
         # Update candidate information
         candidate.name = name
         candidate.skills = skills
+        await db.run_sync(sync_candidate_skills, candidate)
         candidate.education = education
         candidate.years_of_experience = years_of_experience
 
@@ -145,43 +277,36 @@ async def update_candidate(
         if bio is not None:
             candidate.bio = bio
         # Also update user info
-        user = db.query(User).filter(User.email == email).first()
+        user = await db.scalar(select(User).where(User.email == email))
         if user:
             user.name = name
 
         # If new resume is uploaded, save it
         if resume:
-            # Keep the original filename but ensure it's unique
-            resume_filename = f"uploads/{email}_resume_{resume.filename}"
-
-            try:
-                with open(resume_filename, "wb") as buffer:
-                    buffer.write(await resume.read())
-                candidate.resume = resume_filename
-            except Exception as e:
-                raise HTTPException(
-                    status_code=500, detail=f"Error saving resume: {str(e)}"
-                )
+            resume_blob = await store_upload(db, resume)
+            previous_blob_id = candidate.resume_blob_id
+            candidate.resume = resume_blob.path
+            candidate.resume_blob_id = resume_blob.id
+            await db.run_sync(release_blob, previous_blob_id)
+            background_tasks.add_task(index_resume, candidate.id)
 
         # If new profile image is uploaded, save it
         if profile_image:
-            # Keep the original filename but ensure it's unique
-            profile_image_filename = f"uploads/{profile_image.filename}"
-
-            try:
-                with open(profile_image_filename, "wb") as buffer:
-                    buffer.write(await profile_image.read())
-                candidate.profile_image = profile_image_filename
-            except Exception as e:
-                raise HTTPException(
-                    status_code=500, detail=f"Error saving profile image: {str(e)}"
-                )
-
-        db.commit()
-        db.refresh(candidate)
+            profile_image_blob = await store_upload(db, profile_image)
+            previous_blob_id = candidate.profile_image_blob_id
+            candidate.profile_image = profile_image_blob.path
+            candidate.profile_image_blob_id = profile_image_blob.id
+            candidate.profile_thumbnail = None
+            await db.run_sync(release_blob, previous_blob_id)
+            background_tasks.add_task(
+                generate_profile_thumbnail, candidate.id, profile_image_blob.id
+            )
+
+        await db.commit()
+        await db.refresh(candidate)
         return candidate
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         if isinstance(e, HTTPException):
             raise e
         raise HTTPException(
@@ -190,49 +315,27 @@ async def update_candidate(
 
 
 # Get recommended jobs for a candidate
-@router.get(
-    "/candidates/{email}/recommended-jobs", response_model=List[JobPostResponse]
-)
-async def get_recommended_jobs(email: str, db: Session = Depends(get_db)):
+@router.get("/candidates/{email}/recommended-jobs", response_model=List[JobPostSummary])
+async def get_recommended_jobs(
+    email: str,
+    limit: int = Query(3, ge=1, le=50, description="Number of jobs to return"),
+    db: AsyncSession = Depends(get_async_db),
+):
     try:
         # First get the candidate to check their skills
-        candidate = db.query(Candidate).filter(Candidate.email == email).first()
+        candidate = await db.scalar(select(Candidate).where(Candidate.email == email))
         if not candidate:
             raise HTTPException(status_code=404, detail="Candidate not found")
 
-        # Get all jobs
-        all_jobs = db.query(JobPost).order_by(JobPost.created_at.desc()).all()
-
-        # If no jobs exist, return empty list
-        if not all_jobs:
-            return []
-
-        # Parse the candidate's skills
-        candidate_skills = [s.strip().lower() for s in candidate.skills.split(",")]
-
-        # Calculate job matches based on skills
-        matching_jobs = []
-        for job in all_jobs:
-            job_skills = [s.strip().lower() for s in job.skills.split(",")]
-            # Check for any skill match
-            matches = False
-            for c_skill in candidate_skills:
-                for j_skill in job_skills:
-                    if c_skill in j_skill or j_skill in c_skill:
-                        matches = True
-                        break
-                if matches:
-                    break
-
-            if matches:
-                matching_jobs.append(job)
-
-        # If we have matching jobs, return them (up to 3)
+        # Rank jobs by skill overlap using the job_skills index
+        matching_jobs = await db.run_sync(
+            recommend_jobs, normalize_skills(candidate.skills), limit
+        )
         if matching_jobs:
-            return matching_jobs[:3]
+            return matching_jobs
 
-        # If no matches, return 3 random jobs
-        return random.sample(all_jobs, min(3, len(all_jobs)))
+        # If no matches, return random jobs
+        return await db.run_sync(random_jobs, limit)
 
     except Exception as e:
         if isinstance(e, HTTPException):
@@ -247,28 +350,38 @@ async def get_recommended_jobs(email: str, db: Session = Depends(get_db)):
 async def save_job(
     candidate_email: str = Form(...),
     job_id: int = Form(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     try:
+        candidate = await db.scalar(
+            select(Candidate).where(Candidate.email == candidate_email)
+        )
+        if not candidate:
+            raise HTTPException(status_code=404, detail="Candidate not found")
+
+        if not await db.get(JobPost, job_id):
+            raise HTTPException(status_code=404, detail="Job post not found")
+
         # Check if job is already saved
-        existing = (
-            db.query(SavedJob)
-            .filter(
-                SavedJob.candidate_email == candidate_email, SavedJob.job_id == job_id
+        existing = await db.scalar(
+            select(SavedJob).where(
+                SavedJob.candidate_id == candidate.id, SavedJob.job_id == job_id
             )
-            .first()
         )
 
         if existing:
             raise HTTPException(status_code=400, detail="Job already saved")
 
-        saved_job = SavedJob(candidate_email=candidate_email, job_id=job_id)
+        saved_job = SavedJob(
+            candidate_email=candidate_email, candidate_id=candidate.id, job_id=job_id
+        )
         db.add(saved_job)
-        db.commit()
-        db.refresh(saved_job)
+        await db.run_sync(adjust_counters, "saved_jobs", {candidate.id: 1})
+        await db.commit()
+        await db.refresh(saved_job)
         return saved_job
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         if isinstance(e, HTTPException):
             raise e
         raise HTTPException(status_code=500, detail=f"Error saving job: {str(e)}")
@@ -276,48 +389,68 @@ async def save_job(
 
 # Remove a job from wishlist
 @router.delete("/saved-jobs/{candidate_email}/{job_id}")
-async def unsave_job(candidate_email: str, job_id: int, db: Session = Depends(get_db)):
+async def unsave_job(
+    candidate_email: str, job_id: int, db: AsyncSession = Depends(get_async_db)
+):
     try:
         # Find the saved job record
-        saved_job = (
-            db.query(SavedJob)
-            .filter(
-                SavedJob.candidate_email == candidate_email, SavedJob.job_id == job_id
+        saved_job = await db.scalar(
+            select(SavedJob).where(
+                SavedJob.candidate_id == candidate_id_for(candidate_email),
+                SavedJob.job_id == job_id,
             )
-            .first()
         )
 
         if not saved_job:
             raise HTTPException(status_code=404, detail="Saved job not found")
 
         # Delete the record
-        db.delete(saved_job)
-        db.commit()
+        await db.delete(saved_job)
+        await db.run_sync(adjust_counters, "saved_jobs", {saved_job.candidate_id: -1})
+        await db.commit()
 
         return {"message": "Job unsaved successfully"}
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         if isinstance(e, HTTPException):
             raise e
         raise HTTPException(status_code=500, detail=f"Error unsaving job: {str(e)}")
 
 
 # Get all saved jobs for a candidate
-@router.get("/saved-jobs/{email}", response_model=List[JobPostResponse])
-async def get_saved_jobs(email: str, db: Session = Depends(get_db)):
+@router.get(
+    "/saved-jobs/{email}",
+    response_model=List[JobPostSummary],
+    dependencies=[Depends(ConditionalGet("saved_jobs", "job_posts"))],
+)
+async def get_saved_jobs(
+    email: str,
+    response: Response,
+    page: CursorParams = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+):
     try:
-        # Get all saved job IDs for the candidate
-        saved_job_records = (
-            db.query(SavedJob).filter(SavedJob.candidate_email == email).all()
+        # Get a page of the candidate's saved jobs, most recently saved first
+        query = apply_keyset(
+            select(SavedJob, JobPost)
+            .join(JobPost, JobPost.id == SavedJob.job_id)
+            .where(SavedJob.candidate_id == candidate_id_for(email))
+            .options(defer(JobPost.description, raiseload=True)),
+            SAVED_JOB_KEY,
+            page.cursor,
+            page.limit,
         )
-        job_ids = [record.job_id for record in saved_job_records]
-
-        # Get job details for all saved jobs
-        if job_ids:
-            saved_jobs = db.query(JobPost).filter(JobPost.id.in_(job_ids)).all()
-            return saved_jobs
-        return []
+        rows, next_cursor = keyset_page(
+            (await db.execute(query)).all(),
+            SAVED_JOB_KEY,
+            page.limit,
+            entity=lambda row: row[0],
+        )
+        set_next_cursor(response, next_cursor)
+        return [job for _, job in rows]
     except Exception as e:
+        if isinstance(e, HTTPException):
+            raise e
         raise HTTPException(
             status_code=500, detail=f"Error fetching saved jobs: {str(e)}"
         )
@@ -325,10 +458,10 @@ async def get_saved_jobs(email: str, db: Session = Depends(get_db)):
 
 # Count saved jobs for a candidate
 @router.get("/saved-jobs/count/{email}")
-async def count_saved_jobs(email: str, db: Session = Depends(get_db)):
+async def count_saved_jobs(email: str, db: AsyncSession = Depends(get_async_db)):
     try:
-        count = db.query(SavedJob).filter(SavedJob.candidate_email == email).count()
-        return {"count": count}
+        counts = (await db.execute(counters_for(email))).first()
+        return {"count": counts.saved_jobs if counts else 0}
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Error counting saved jobs: {str(e)}"
@@ -336,41 +469,39 @@ async def count_saved_jobs(email: str, db: Session = Depends(get_db)):
 
 
 # Get all candidates
-@router.get("/candidates", response_model=List[CandidateResponse])
+@router.get("/candidates", response_model=List[CandidateSummary])
 async def get_all_candidates(
-    skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
+    response: Response,
+    page: CursorParams = Depends(),
+    fast: bool = FAST_QUERY,
+    fields: Optional[List[str]] = Depends(CANDIDATE_FIELDS),
+    db: AsyncSession = Depends(get_async_db),
 ):
     try:
-        candidates = db.query(Candidate).offset(skip).limit(limit).all()
+        if fast or fields is not None:
+            serializer = CANDIDATE_ROWS.only(fields)
+            query = apply_keyset(
+                serializer.select(), CANDIDATE_KEY, page.cursor, page.limit
+            )
+            rows, next_cursor = keyset_page(
+                (await db.execute(query)).all(), CANDIDATE_KEY, page.limit
+            )
+            return serializer.response(rows, next_cursor)
+
+        query = apply_keyset(
+            select(Candidate).options(defer(Candidate.bio, raiseload=True)),
+            CANDIDATE_KEY,
+            page.cursor,
+            page.limit,
+        )
+        candidates, next_cursor = keyset_page(
+            (await db.scalars(query)).all(), CANDIDATE_KEY, page.limit
+        )
+        set_next_cursor(response, next_cursor)
         return candidates
     except Exception as e:
+        if isinstance(e, HTTPException):
+            raise e
         raise HTTPException(
             status_code=500, detail=f"Error fetching candidates: {str(e)}"
         )
-
-
-# Filter candidates by skills
-@router.get("/candidates/filter", response_model=List[CandidateResponse])
-async def filter_candidates_by_skills(
-    skills: str,  # Comma-separated skills
-    db: Session = Depends(get_db),
-):
-    try:
-        if not skills:
-            candidates = db.query(Candidate).all()
-            return candidates
-
-        skill_list = [skill.strip().lower() for skill in skills.split(",")]
-        filtered_candidates = []
-        all_candidates = db.query(Candidate).all()
-
-        for candidate in all_candidates:
-            candidate_skills = candidate.skills.lower()
-            if any(skill in candidate_skills for skill in skill_list):
-                filtered_candidates.append(candidate)
-
-        return filtered_candidates
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Error filtering candidates: {str(e)}"
-        )
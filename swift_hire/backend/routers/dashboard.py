@@ -0,0 +1,151 @@
+import os
+from collections import defaultdict
+from datetime import datetime
+from typing import Optional
+
+from cache import CacheNamespace
+from counters import counters_for
+from database import get_async_db
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from models import Candidate, Interviewer, JobApplication, JobPost
+from pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from schemas import (
+    DashboardCounts,
+    DashboardJob,
+    InterviewerDashboard,
+    JobPostSummary,
+    UpcomingInterview,
+)
+from security import TokenUser, authorize, get_token_user
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+
+DASHBOARD_CACHE_TTL_SECONDS = float(os.getenv("DASHBOARD_CACHE_TTL_SECONDS", "10"))
+
+# Serialized interviewer dashboards. Nothing invalidates them: applications
+# and interviews change too often, so they are only kept for a short TTL.
+INTERVIEWER_DASHBOARD_CACHE = CacheNamespace(
+    "interviewer-dashboard", ttl=DASHBOARD_CACHE_TTL_SECONDS
+)
+
+JOB_SUMMARY_COLUMNS = [getattr(JobPost, name) for name in JobPostSummary.model_fields]
+
+
+@router.get("/counts/{email}", response_model=DashboardCounts)
+async def get_dashboard_counts(email: str, db: AsyncSession = Depends(get_async_db)):
+    """
+    Every badge count of a candidate's dashboard, from its counters row
+    """
+    row = (await db.execute(counters_for(email))).first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Candidate not found")
+    return DashboardCounts(applications=row.applications, saved_jobs=row.saved_jobs)
+
+
+async def _build_interviewer_dashboard(
+    db: AsyncSession, interviewer_id: int, jobs: int, upcoming: int
+) -> InterviewerDashboard:
+    job_rows = (
+        await db.execute(
+            select(*JOB_SUMMARY_COLUMNS)
+            .where(JobPost.interviewer_id == interviewer_id)
+            .order_by(JobPost.created_at.desc(), JobPost.id.desc())
+            .limit(jobs)
+        )
+    ).all()
+
+    # One grouped pass over the applications of the returned jobs, read from
+    # the (job_id, status) index
+    counts_by_job = defaultdict(dict)
+    if job_rows:
+        for job_id, status, count in await db.execute(
+            select(JobApplication.job_id, JobApplication.status, func.count())
+            .where(JobApplication.job_id.in_([row.id for row in job_rows]))
+            .group_by(JobApplication.job_id, JobApplication.status)
+        ):
+            counts_by_job[job_id][status] = count
+
+    # Interviews are scheduled when shortlisting; schedules are stored as
+    # sent by the browser, without a time zone, like calendar invites
+    interviews = await db.execute(
+        select(
+            JobApplication.id.label("application_id"),
+            JobApplication.job_id,
+            JobPost.title.label("job_title"),
+            JobApplication.candidate_email,
+            Candidate.name.label("candidate_name"),
+            JobApplication.interview_schedule,
+            JobApplication.interview_duration,
+            JobApplication.interview_title,
+            JobApplication.interview_form_url,
+        )
+        .join(JobPost, JobPost.id == JobApplication.job_id)
+        .outerjoin(Candidate, Candidate.id == JobApplication.candidate_id)
+        .where(
+            JobApplication.interviewer_id == interviewer_id,
+            JobApplication.status == "Shortlisted",
+            JobApplication.interview_schedule >= datetime.now(),
+        )
+        .order_by(JobApplication.interview_schedule, JobApplication.id)
+        .limit(upcoming)
+    )
+
+    return InterviewerDashboard(
+        jobs=[
+            DashboardJob(**row._mapping, application_counts=counts_by_job[row.id])
+            for row in job_rows
+        ],
+        upcoming_interviews=[UpcomingInterview(**row._mapping) for row in interviews],
+    )
+
+
+@router.get("/interviewer/{email}", response_model=InterviewerDashboard)
+async def get_interviewer_dashboard(
+    email: str,
+    jobs: int = Query(
+        DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Number of most recent job posts to return",
+    ),
+    upcoming: int = Query(
+        10, ge=1, le=100, description="Number of upcoming interviews to return"
+    ),
+    db: AsyncSession = Depends(get_async_db),
+    user: Optional[TokenUser] = Depends(get_token_user),
+):
+    """
+    An interviewer's job posts with their application counts by status, and
+    their next scheduled interviews, in one response
+    """
+    authorize(user, email=email, detail="Not allowed to view this dashboard")
+    try:
+        cache_key = f"{email}:{jobs}:{upcoming}"
+        cached = await INTERVIEWER_DASHBOARD_CACHE.lookup(cache_key)
+        cache_status = "HIT"
+        if cached is None:
+            cache_status = "MISS"
+            interviewer_id = await db.scalar(
+                select(Interviewer.id).where(Interviewer.email == email)
+            )
+            if interviewer_id is None:
+                raise HTTPException(status_code=404, detail="Interviewer not found")
+            dashboard = await _build_interviewer_dashboard(
+                db, interviewer_id, jobs, upcoming
+            )
+            cached = dashboard.model_dump_json().encode()
+            await INTERVIEWER_DASHBOARD_CACHE.store(cache_key, cached)
+
+        return Response(
+            content=cached,
+            media_type="application/json",
+            headers={"X-Cache": cache_status},
+        )
+    except Exception as e:
+        if isinstance(e, HTTPException):
+            raise e
+        raise HTTPException(
+            status_code=500, detail=f"Error building interviewer dashboard: {str(e)}"
+        )
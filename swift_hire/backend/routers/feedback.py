@@ -1,13 +1,27 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from database import get_db
-from fastapi import APIRouter, Depends, Form, HTTPException, status
+from conditional import ConditionalGet
+from database import get_async_db, get_db
+from fastapi import APIRouter, Depends, Form, HTTPException, Response, status
 from models import Feedback
+from pagination import (
+    CursorParams,
+    apply_keyset,
+    created_key,
+    keyset_page,
+    set_next_cursor,
+)
 from schemas import FeedbackCreate, FeedbackResponse
+from serialization import FAST_QUERY, RowSerializer
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 router = APIRouter(tags=["feedback"])
 
+FEEDBACK_KEY = created_key(Feedback)
+FEEDBACK_ROWS = RowSerializer(FeedbackResponse, Feedback, FEEDBACK_KEY)
+FEEDBACK_VALIDATORS = ConditionalGet("feedback")
+
 
 @router.post(
     "/feedback", response_model=FeedbackResponse, status_code=status.HTTP_201_CREATED
@@ -21,7 +35,7 @@ async def create_feedback(
     user_email: Optional[str] = Form(None),
     user_name: Optional[str] = Form(None),
     user_role: Optional[str] = Form(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Create a new feedback entry - supports both JSON and form data
@@ -72,17 +86,35 @@ async def create_feedback(
         )
 
     db.add(db_feedback)
-    db.commit()
-    db.refresh(db_feedback)
+    await db.commit()
+    await db.refresh(db_feedback)
     return db_feedback
 
 
 @router.get("/feedback", response_model=List[FeedbackResponse])
-def get_all_feedback(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def get_all_feedback(
+    response: Response,
+    page: CursorParams = Depends(),
+    fast: bool = FAST_QUERY,
+    validators: Dict[str, str] = Depends(FEEDBACK_VALIDATORS),
+    db: Session = Depends(get_db),
+):
     """
-    Retrieve all feedback entries
+    Retrieve feedback entries, newest first
     """
-    return db.query(Feedback).offset(skip).limit(limit).all()
+    if fast:
+        query = apply_keyset(
+            FEEDBACK_ROWS.select(), FEEDBACK_KEY, page.cursor, page.limit
+        )
+        rows, next_cursor = keyset_page(
+            db.execute(query).all(), FEEDBACK_KEY, page.limit
+        )
+        return FEEDBACK_ROWS.response(rows, next_cursor, headers=validators)
+
+    query = apply_keyset(db.query(Feedback), FEEDBACK_KEY, page.cursor, page.limit)
+    feedback_list, next_cursor = keyset_page(query.all(), FEEDBACK_KEY, page.limit)
+    set_next_cursor(response, next_cursor)
+    return feedback_list
 
 
 @router.get("/feedback/{feedback_id}", response_model=FeedbackResponse)
@@ -97,11 +129,23 @@ def get_feedback(feedback_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/feedback/{user_email}", response_model=List[FeedbackResponse])
-def get_user_feedback(user_email: str, db: Session = Depends(get_db)):
+def get_user_feedback(
+    user_email: str,
+    response: Response,
+    page: CursorParams = Depends(),
+    db: Session = Depends(get_db),
+):
     """
-    Retrieve all feedback from a specific user
+    Retrieve feedback from a specific user, newest first
     """
-    feedback_list = db.query(Feedback).filter(Feedback.user_email == user_email).all()
+    query = apply_keyset(
+        db.query(Feedback).filter(Feedback.user_email == user_email),
+        FEEDBACK_KEY,
+        page.cursor,
+        page.limit,
+    )
+    feedback_list, next_cursor = keyset_page(query.all(), FEEDBACK_KEY, page.limit)
+    set_next_cursor(response, next_cursor)
     return feedback_list
 
 
@@ -1,8 +1,11 @@
-from database import get_db
+from database import get_async_db
 from fastapi import APIRouter, Depends, Form, HTTPException
+from lookups import link_interviewer_rows
 from models import Interviewer, User
 from schemas import LoginUserResponse
-from sqlalchemy.orm import Session
+from security import hash_password
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter(tags=["interviewers"])
 
@@ -16,26 +19,26 @@ async def register_interviewer(
     expertise: str = Form(...),
     availability: str = Form(...),
     department: str = Form(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     try:
         # Check if email already exists in users table
-        if db.query(User).filter(User.email == email).first():
+        if await db.scalar(select(User).where(User.email == email)):
             raise HTTPException(status_code=400, detail="Email already exists")
 
         # Check if email exists in interviewers table
-        if db.query(Interviewer).filter(Interviewer.email == email).first():
+        if await db.scalar(select(Interviewer).where(Interviewer.email == email)):
             raise HTTPException(status_code=400, detail="Email already exists")
 
         # Create user record - no created_at field
         user = User(
             name=name,
             email=email,
-            password=password,
+            password=await hash_password(password),
             role="Interviewer",
         )
         db.add(user)
-        db.flush()  # Flush to get user ID without committing
+        await db.flush()  # Flush to get user ID without committing
 
         # Create interviewer record
         interviewer = Interviewer(
@@ -47,12 +50,14 @@ async def register_interviewer(
             role="Interviewer",
         )
         db.add(interviewer)
-        db.commit()
+        await db.flush()  # Assign the interviewer ID before linking rows to it
+        await db.run_sync(link_interviewer_rows, interviewer)
+        await db.commit()
 
         return LoginUserResponse(name=user.name, email=user.email, role=user.role)
 
     except Exception as e:
-        db.rollback()  # Roll back any changes if error occurs
+        await db.rollback()  # Roll back any changes if error occurs
         if isinstance(e, HTTPException):
             raise e
         raise HTTPException(
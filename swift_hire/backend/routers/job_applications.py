@@ -1,15 +1,28 @@
-import os
-import smtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from typing import List, Optional
 
 import models
 import schemas
+from conditional import ConditionalGet
+from counters import adjust_counters, counters_for
 from database import get_db
 from dotenv import load_dotenv
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from hydration import hydrate_applications, load_application_relations
+from lookups import candidate_id_for, interviewer_id_for
+from mailer import EMAIL_SENDER
+from outbox import enqueue_email, worker_pool
+from pagination import (
+    CursorParams,
+    apply_keyset,
+    created_key,
+    keyset_page,
+    set_next_cursor,
+)
+from security import TokenUser, authorize, get_token_user, require_token_user
+from sqlalchemy import or_
+from sqlalchemy.orm import Session, defer
 
 load_dotenv()
 
@@ -18,15 +31,17 @@ router = APIRouter(
     tags=["job-applications"],
 )
 
-EMAIL_SENDER = os.getenv("EMAIL_SENDER")
-EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD")
-SMTP_SERVER = "smtp.gmail.com"
-SMTP_PORT = 587
+APPLICATION_KEY = created_key(models.JobApplication)
+# Application lists leave out the interview description; the detail
+# endpoint returns it
+WITHOUT_INTERVIEW_DESCRIPTION = defer(
+    models.JobApplication.interview_description, raiseload=True
+)
 
 
-def send_email(
+def build_status_email(
     to_email: str, candidate_name: str, job_title: str, company: str, status: str
-):
+) -> MIMEMultipart:
     msg = MIMEMultipart("alternative")
     msg["From"] = EMAIL_SENDER
     msg["To"] = to_email
@@ -109,23 +124,47 @@ Recruitment Team
 
     msg.attach(MIMEText(plain_text, "plain"))
     msg.attach(MIMEText(html_content, "html"))
+    return msg
+
+
+def _interviewer_application_dict(app, candidate, job):
+    return {
+        "application_id": app.id,
+        "job_id": job.id,
+        "job_title": job.title,
+        "company": job.company,
+        "candidate_id": candidate.id,
+        "candidate_name": candidate.name,
+        "candidate_email": candidate.email,
+        "education": candidate.education,
+        "years_of_experience": candidate.years_of_experience,
+        "skills": candidate.skills,
+        "resume": candidate.resume,
+        "profile_image": candidate.list_image,
+        "status": app.status,
+        "interview_form_url": app.interview_form_url,
+        "interview_schedule": app.interview_schedule,
+        "interview_duration": app.interview_duration,
+        "interview_title": app.interview_title,
+        "created_at": app.created_at,
+    }
 
-    try:
-        server = smtplib.SMTP(SMTP_SERVER, SMTP_PORT)
-        server.starttls()
-        server.login(EMAIL_SENDER, EMAIL_PASSWORD)
-        server.sendmail(EMAIL_SENDER, to_email, msg.as_string())
-        server.quit()
-        print(f"Email sent successfully to {to_email}")
-    except smtplib.SMTPAuthenticationError as e:
-        print(f"SMTP Authentication Error: {str(e)}")
-        raise HTTPException(
-            status_code=500,
-            detail="Failed to authenticate with SMTP server. Check email credentials.",
-        )
-    except Exception as e:
-        print(f"Failed to send email to {to_email}: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to send email: {str(e)}")
+
+def _candidate_application_dict(app, candidate, job):
+    return {
+        "application_id": app.id,
+        "job_id": job.id,
+        "job_title": job.title,
+        "company": job.company,
+        "location": job.location,
+        "type": job.type,
+        "status": app.status,
+        "interview_form_url": app.interview_form_url,
+        "interview_schedule": app.interview_schedule,
+        "interview_duration": app.interview_duration,
+        "interview_title": app.interview_title,
+        "applied_date": app.created_at,
+    }
 
 
 @router.post(
@@ -134,8 +173,16 @@ Recruitment Team
     response_model=schemas.JobApplicationResponse,
 )
 def create_job_application(
-    application: schemas.JobApplicationCreate, db: Session = Depends(get_db)
+    application: schemas.JobApplicationCreate,
+    db: Session = Depends(get_db),
+    user: Optional[TokenUser] = Depends(get_token_user),
 ):
+    authorize(
+        user,
+        email=application.candidate_email,
+        role="Candidate",
+        detail="Candidates can only apply on their own behalf",
+    )
     candidate = (
         db.query(models.Candidate)
         .filter(models.Candidate.email == application.candidate_email)
@@ -157,7 +204,7 @@ def create_job_application(
     existing_application = (
         db.query(models.JobApplication)
         .filter(
-            models.JobApplication.candidate_email == application.candidate_email,
+            models.JobApplication.candidate_id == candidate.id,
             models.JobApplication.job_id == application.job_id,
         )
         .first()
@@ -169,8 +216,13 @@ def create_job_application(
             detail="You have already applied for this job",
         )
 
-    db_application = models.JobApplication(**application.dict())
+    db_application = models.JobApplication(
+        **application.dict(),
+        candidate_id=candidate.id,
+        interviewer_id=interviewer_id_for(application.interviewer_email),
+    )
     db.add(db_application)
+    adjust_counters(db, "applications", {candidate.id: 1})
     db.commit()
     db.refresh(db_application)
     return db_application
@@ -178,25 +230,30 @@ def create_job_application(
 
 @router.get("/count/{email}", response_model=dict)
 def get_application_count(email: str, db: Session = Depends(get_db)):
-    candidate = (
-        db.query(models.Candidate).filter(models.Candidate.email == email).first()
-    )
-    if not candidate:
+    counts = db.execute(counters_for(email)).first()
+    if counts is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Candidate not found"
         )
 
-    count = (
-        db.query(models.JobApplication)
-        .filter(models.JobApplication.candidate_email == email)
-        .count()
-    )
-
-    return {"count": count}
+    return {"count": counts.applications}
 
 
-@router.get("/interviewer/{email}", response_model=List[dict])
-def get_interviewer_applications(email: str, db: Session = Depends(get_db)):
+@router.get(
+    "/interviewer/{email}",
+    response_model=List[dict],
+    dependencies=[
+        Depends(ConditionalGet("job_applications", "candidates", "job_posts"))
+    ],
+)
+def get_interviewer_applications(
+    email: str,
+    response: Response,
+    page: CursorParams = Depends(),
+    db: Session = Depends(get_db),
+    user: Optional[TokenUser] = Depends(get_token_user),
+):
+    authorize(user, email=email, detail="Not allowed to view these applications")
     interviewer = (
         db.query(models.Interviewer).filter(models.Interviewer.email == email).first()
     )
@@ -205,47 +262,18 @@ def get_interviewer_applications(email: str, db: Session = Depends(get_db)):
             status_code=status.HTTP_404_NOT_FOUND, detail="Interviewer not found"
         )
 
-    applications = (
+    query = apply_keyset(
         db.query(models.JobApplication)
-        .filter(models.JobApplication.interviewer_email == email)
-        .all()
+        .options(WITHOUT_INTERVIEW_DESCRIPTION)
+        .filter(models.JobApplication.interviewer_id == interviewer.id),
+        APPLICATION_KEY,
+        page.cursor,
+        page.limit,
     )
+    applications, next_cursor = keyset_page(query.all(), APPLICATION_KEY, page.limit)
+    set_next_cursor(response, next_cursor)
 
-    result = []
-    for app in applications:
-        candidate = (
-            db.query(models.Candidate)
-            .filter(models.Candidate.email == app.candidate_email)
-            .first()
-        )
-        job = db.query(models.JobPost).filter(models.JobPost.id == app.job_id).first()
-
-        if candidate and job:
-            result.append(
-                {
-                    "application_id": app.id,
-                    "job_id": job.id,
-                    "job_title": job.title,
-                    "company": job.company,
-                    "candidate_id": candidate.id,
-                    "candidate_name": candidate.name,
-                    "candidate_email": candidate.email,
-                    "education": candidate.education,
-                    "years_of_experience": candidate.years_of_experience,
-                    "skills": candidate.skills,
-                    "resume": candidate.resume,
-                    "profile_image": candidate.profile_image,
-                    "status": app.status,
-                    "interview_form_url": app.interview_form_url,
-                    "interview_schedule": app.interview_schedule,
-                    "interview_duration": app.interview_duration,
-                    "interview_title": app.interview_title,
-                    "interview_description": app.interview_description,
-                    "created_at": app.created_at,
-                }
-            )
-
-    return result
+    return hydrate_applications(db, applications, _interviewer_application_dict)
 
 
 @router.get("/shortlisted-candidate", response_model=schemas.PaginatedJobApplications)
@@ -258,9 +286,23 @@ def search_job_applications(
     ),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(10, ge=1, le=100, description="Number of records per page"),
+    cursor: Optional[str] = Query(
+        None, description="Opaque cursor from next_cursor; takes precedence over page"
+    ),
     db: Session = Depends(get_db),
 ):
-    query = db.query(models.JobApplication)
+    query = (
+        db.query(models.JobApplication, models.Candidate, models.JobPost)
+        .options(
+            defer(models.Candidate.bio, raiseload=True),
+            defer(models.JobPost.description, raiseload=True),
+        )
+        .join(
+            models.Candidate,
+            models.Candidate.id == models.JobApplication.candidate_id,
+        )
+        .join(models.JobPost, models.JobPost.id == models.JobApplication.job_id)
+    )
 
     if status:
         if status not in ["Applied", "Shortlisted"]:
@@ -270,100 +312,54 @@ def search_job_applications(
             )
         query = query.filter(models.JobApplication.status == status)
 
-    total_count = query.count()
-
-    filtered_applications = []
-
-    search_provided = search is not None and search.strip() != ""
-
-    if search_provided:
-        all_applications = query.all()
-        search_term = search.lower()
-
-        for app in all_applications:
-            candidate = (
-                db.query(models.Candidate)
-                .filter(models.Candidate.email == app.candidate_email)
-                .first()
-            )
-            job = (
-                db.query(models.JobPost).filter(models.JobPost.id == app.job_id).first()
+    if search is not None and search.strip() != "":
+        # ILIKE is rendered as lower() LIKE lower() on backends without it
+        pattern = f"%{search.strip()}%"
+        query = query.filter(
+            or_(
+                models.Candidate.name.ilike(pattern),
+                models.JobPost.title.ilike(pattern),
+                models.JobPost.company.ilike(pattern),
             )
+        )
 
-            if candidate and job:
-                if (
-                    search_term in candidate.name.lower()
-                    or search_term in job.title.lower()
-                    or search_term in job.company.lower()
-                ):
-                    filtered_applications.append(
-                        schemas.JobApplicationSearchResult(
-                            application_id=app.id,
-                            job_id=job.id,
-                            job_title=job.title,
-                            company=job.company,
-                            candidate_name=candidate.name,
-                            candidate_email=candidate.email,
-                            interviewer_email=app.interviewer_email,
-                            status=app.status,
-                            interview_form_url=app.interview_form_url,
-                            interview_schedule=app.interview_schedule,
-                            interview_duration=app.interview_duration,
-                            interview_title=app.interview_title,
-                            interview_description=app.interview_description,
-                            created_at=app.created_at,
-                        )
-                    )
-    else:
-        paginated_apps = query.offset((page - 1) * limit).limit(limit).all()
+    total_count = query.with_entities(models.JobApplication.id).order_by(None).count()
+    total_pages = (total_count + limit - 1) // limit if total_count > 0 else 1
 
-        for app in paginated_apps:
-            candidate = (
-                db.query(models.Candidate)
-                .filter(models.Candidate.email == app.candidate_email)
-                .first()
-            )
-            job = (
-                db.query(models.JobPost).filter(models.JobPost.id == app.job_id).first()
-            )
+    page_query = apply_keyset(query, APPLICATION_KEY, cursor, limit)
+    if not cursor:
+        page_query = page_query.offset((page - 1) * limit)
+    rows, next_cursor = keyset_page(
+        page_query.all(), APPLICATION_KEY, limit, entity=lambda row: row[0]
+    )
 
-            if candidate and job:
-                filtered_applications.append(
-                    schemas.JobApplicationSearchResult(
-                        application_id=app.id,
-                        job_id=job.id,
-                        job_title=job.title,
-                        company=job.company,
-                        candidate_name=candidate.name,
-                        candidate_email=candidate.email,
-                        interviewer_email=app.interviewer_email,
-                        status=app.status,
-                        interview_form_url=app.interview_form_url,
-                        interview_schedule=app.interview_schedule,
-                        interview_duration=app.interview_duration,
-                        interview_title=app.interview_title,
-                        interview_description=app.interview_description,
-                        created_at=app.created_at,
-                    )
-                )
-
-    if search_provided:
-        total_filtered = len(filtered_applications)
-        start_idx = (page - 1) * limit
-        end_idx = min(start_idx + limit, total_filtered)
-        paginated_results = filtered_applications[start_idx:end_idx]
-        total_count = total_filtered
-        total_pages = (total_filtered + limit - 1) // limit if total_filtered > 0 else 1
-    else:
-        paginated_results = filtered_applications
-        total_pages = (total_count + limit - 1) // limit if total_count > 0 else 1
+    items = [
+        schemas.JobApplicationSearchResult(
+            application_id=app.id,
+            job_id=job.id,
+            job_title=job.title,
+            company=job.company,
+            candidate_name=candidate.name,
+            candidate_email=candidate.email,
+            interviewer_email=app.interviewer_email,
+            status=app.status,
+            interview_form_url=app.interview_form_url,
+            interview_schedule=app.interview_schedule,
+            interview_duration=app.interview_duration,
+            interview_title=app.interview_title,
+            interview_description=app.interview_description,
+            created_at=app.created_at,
+        )
+        for app, candidate, job in rows
+    ]
 
     return schemas.PaginatedJobApplications(
-        items=paginated_results,
+        items=items,
         total=total_count,
         page=page,
         size=limit,
         pages=total_pages,
+        next_cursor=next_cursor,
     )
 
 
@@ -380,15 +376,9 @@ def get_application(application_id: int, db: Session = Depends(get_db)):
             status_code=status.HTTP_404_NOT_FOUND, detail="Application not found"
         )
 
-    candidate = (
-        db.query(models.Candidate)
-        .filter(models.Candidate.email == application.candidate_email)
-        .first()
-    )
-
-    job = (
-        db.query(models.JobPost).filter(models.JobPost.id == application.job_id).first()
-    )
+    candidates, jobs = load_application_relations(db, [application])
+    candidate = candidates.get(application.candidate_id)
+    job = jobs.get(application.job_id)
 
     notes = (
         db.query(models.Note)
@@ -429,11 +419,105 @@ def get_application(application_id: int, db: Session = Depends(get_db)):
     return response
 
 
+@router.patch("/bulk", response_model=schemas.JobApplicationBulkUpdateResponse)
+def bulk_update_application_status(
+    bulk_update: schemas.JobApplicationBulkUpdate,
+    db: Session = Depends(get_db),
+    user: Optional[TokenUser] = Depends(get_token_user),
+):
+    authorize(
+        user,
+        role="Interviewer",
+        detail="Only interviewers can update applications",
+    )
+    if bulk_update.status not in ["Applied", "Shortlisted", "Rejected"]:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid status"
+        )
+
+    application_ids = list(dict.fromkeys(bulk_update.application_ids))
+    applications = (
+        db.query(models.JobApplication)
+        .filter(models.JobApplication.id.in_(application_ids))
+        .all()
+    )
+    forbidden_ids = set()
+    if user is not None:
+        forbidden_ids = {
+            app.id for app in applications if app.interviewer_email != user.email
+        }
+        applications = [app for app in applications if app.id not in forbidden_ids]
+    found_ids = {app.id for app in applications}
+
+    if found_ids:
+        db.query(models.JobApplication).filter(
+            models.JobApplication.id.in_(found_ids)
+        ).update(
+            {models.JobApplication.status: bulk_update.status},
+            synchronize_session=False,
+        )
+
+    unnotified = set()
+    if bulk_update.status in ["Shortlisted", "Rejected"]:
+        candidates, jobs = load_application_relations(db, applications)
+        for app in applications:
+            candidate = candidates.get(app.candidate_id)
+            job = jobs.get(app.job_id)
+            if not (candidate and job):
+                unnotified.add(app.id)
+                continue
+            enqueue_email(
+                db,
+                candidate.email,
+                build_status_email(
+                    to_email=candidate.email,
+                    candidate_name=candidate.name,
+                    job_title=job.title,
+                    company=job.company,
+                    status=bulk_update.status,
+                ),
+            )
+
+    db.commit()
+    worker_pool.notify()
+
+    results = []
+    for application_id in application_ids:
+        if application_id in forbidden_ids:
+            result = schemas.JobApplicationBulkResult(
+                application_id=application_id,
+                success=False,
+                detail="Only the assigned interviewer can update this application",
+            )
+        elif application_id not in found_ids:
+            result = schemas.JobApplicationBulkResult(
+                application_id=application_id,
+                success=False,
+                detail="Application not found",
+            )
+        elif application_id in unnotified:
+            result = schemas.JobApplicationBulkResult(
+                application_id=application_id,
+                success=True,
+                detail="Status updated; candidate or job missing, no email sent",
+            )
+        else:
+            result = schemas.JobApplicationBulkResult(
+                application_id=application_id, success=True
+            )
+        results.append(result)
+
+    return schemas.JobApplicationBulkUpdateResponse(
+        status=bulk_update.status, updated=len(found_ids), results=results
+    )
+
+
 @router.patch("/{application_id}", response_model=schemas.JobApplicationResponse)
 def update_application_status(
     application_id: int,
     status_update: schemas.JobApplicationUpdate,
     db: Session = Depends(get_db),
+    user: Optional[TokenUser] = Depends(get_token_user),
 ):
     application = (
         db.query(models.JobApplication)
@@ -444,6 +528,12 @@ def update_application_status(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Application not found"
         )
+    authorize(
+        user,
+        email=application.interviewer_email,
+        role="Interviewer",
+        detail="Only the assigned interviewer can update this application",
+    )
 
     if status_update.status not in ["Applied", "Shortlisted", "Rejected"]:
         raise HTTPException(
@@ -453,7 +543,7 @@ def update_application_status(
     if status_update.status in ["Shortlisted", "Rejected"]:
         candidate = (
             db.query(models.Candidate)
-            .filter(models.Candidate.email == application.candidate_email)
+            .filter(models.Candidate.id == application.candidate_id)
             .first()
         )
         job = (
@@ -462,12 +552,17 @@ def update_application_status(
             .first()
         )
         if candidate and job:
-            send_email(
-                to_email=candidate.email,
-                candidate_name=candidate.name,
-                job_title=job.title,
-                company=job.company,
-                status=status_update.status,
+            # Queued in this transaction and delivered by the outbox workers
+            enqueue_email(
+                db,
+                candidate.email,
+                build_status_email(
+                    to_email=candidate.email,
+                    candidate_name=candidate.name,
+                    job_title=job.title,
+                    company=job.company,
+                    status=status_update.status,
+                ),
             )
 
     application.status = status_update.status
@@ -483,14 +578,33 @@ def update_application_status(
         application.interview_description = status_update.interview_description
 
     db.commit()
+    worker_pool.notify()
     db.refresh(application)
     return application
 
 
+def _note_author(user: TokenUser, created_by: Optional[str]) -> str:
+    """
+    Email of the interviewer acting on a note: the token's user. A
+    created_by in the request must name the same user.
+    """
+    authorize(
+        user,
+        email=created_by or user.email,
+        role="Interviewer",
+        detail="Only interviewers can manage notes as themselves",
+    )
+    return user.email
+
+
 @router.post("/{application_id}/notes", response_model=schemas.NoteResponse)
 def create_note(
-    application_id: int, note: schemas.NoteCreate, db: Session = Depends(get_db)
+    application_id: int,
+    note: schemas.NoteCreate,
+    db: Session = Depends(get_db),
+    user: TokenUser = Depends(require_token_user),
 ):
+    author = _note_author(user, note.created_by)
     application = (
         db.query(models.JobApplication)
         .filter(models.JobApplication.id == application_id)
@@ -502,7 +616,7 @@ def create_note(
         )
 
     # Validate that the note creator is the assigned interviewer
-    if note.created_by != application.interviewer_email:
+    if author != application.interviewer_email:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only the assigned interviewer can add notes for this application",
@@ -522,7 +636,7 @@ def create_note(
 
     print(f"Received note payload: {note.dict()}")  # Debug log
     db_note = models.Note(
-        application_id=application_id, content=note.content, created_by=note.created_by
+        application_id=application_id, content=note.content, created_by=author
     )
     db.add(db_note)
     db.commit()
@@ -532,8 +646,12 @@ def create_note(
 
 @router.patch("/notes/{note_id}", response_model=schemas.NoteResponse)
 def update_note(
-    note_id: int, note_update: schemas.NoteUpdate, db: Session = Depends(get_db)
+    note_id: int,
+    note_update: schemas.NoteUpdate,
+    db: Session = Depends(get_db),
+    user: TokenUser = Depends(require_token_user),
 ):
+    author = _note_author(user, note_update.created_by)
     db_note = db.query(models.Note).filter(models.Note.id == note_id).first()
     if not db_note:
         raise HTTPException(
@@ -550,7 +668,7 @@ def update_note(
             status_code=status.HTTP_404_NOT_FOUND, detail="Application not found"
         )
 
-    if note_update.created_by != application.interviewer_email:
+    if author != application.interviewer_email:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only the assigned interviewer can update this note",
@@ -576,8 +694,12 @@ def update_note(
 
 @router.delete("/notes/{note_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_note(
-    note_id: int, note_delete: schemas.NoteDelete, db: Session = Depends(get_db)
+    note_id: int,
+    note_delete: schemas.NoteDelete,
+    db: Session = Depends(get_db),
+    user: TokenUser = Depends(require_token_user),
 ):
+    author = _note_author(user, note_delete.created_by)
     db_note = db.query(models.Note).filter(models.Note.id == note_id).first()
     if not db_note:
         raise HTTPException(
@@ -594,7 +716,7 @@ def delete_note(
             status_code=status.HTTP_404_NOT_FOUND, detail="Application not found"
         )
 
-    if note_delete.created_by != application.interviewer_email:
+    if author != application.interviewer_email:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only the assigned interviewer can delete this note",
@@ -609,7 +731,7 @@ def check_application(candidate_email: str, job_id: int, db: Session = Depends(g
     application = (
         db.query(models.JobApplication)
         .filter(
-            models.JobApplication.candidate_email == candidate_email,
+            models.JobApplication.candidate_id == candidate_id_for(candidate_email),
             models.JobApplication.job_id == job_id,
         )
         .first()
@@ -621,7 +743,14 @@ def check_application(candidate_email: str, job_id: int, db: Session = Depends(g
 
 
 @router.get("/candidate/{email}", response_model=List[dict])
-def get_candidate_applications(email: str, db: Session = Depends(get_db)):
+def get_candidate_applications(
+    email: str,
+    response: Response,
+    page: CursorParams = Depends(),
+    db: Session = Depends(get_db),
+    user: Optional[TokenUser] = Depends(get_token_user),
+):
+    authorize(user, email=email, detail="Not allowed to view these applications")
     candidate = (
         db.query(models.Candidate).filter(models.Candidate.email == email).first()
     )
@@ -630,33 +759,17 @@ def get_candidate_applications(email: str, db: Session = Depends(get_db)):
             status_code=status.HTTP_404_NOT_FOUND, detail="Candidate not found"
         )
 
-    applications = (
+    query = apply_keyset(
         db.query(models.JobApplication)
-        .filter(models.JobApplication.candidate_email == email)
-        .all()
+        .options(WITHOUT_INTERVIEW_DESCRIPTION)
+        .filter(models.JobApplication.candidate_id == candidate.id),
+        APPLICATION_KEY,
+        page.cursor,
+        page.limit,
     )
+    applications, next_cursor = keyset_page(query.all(), APPLICATION_KEY, page.limit)
+    set_next_cursor(response, next_cursor)
 
-    result = []
-    for app in applications:
-        job = db.query(models.JobPost).filter(models.JobPost.id == app.job_id).first()
-
-        if job:
-            result.append(
-                {
-                    "application_id": app.id,
-                    "job_id": job.id,
-                    "job_title": job.title,
-                    "company": job.company,
-                    "location": job.location,
-                    "type": job.type,
-                    "status": app.status,
-                    "interview_form_url": app.interview_form_url,
-                    "interview_schedule": app.interview_schedule,
-                    "interview_duration": app.interview_duration,
-                    "interview_title": app.interview_title,
-                    "interview_description": app.interview_description,
-                    "applied_date": app.created_at,
-                }
-            )
-
-    return result
+    return hydrate_applications(
+        db, applications, _candidate_application_dict, with_candidates=False
+    )
@@ -1,13 +1,39 @@
-from typing import List
+from collections import Counter
+from typing import Dict, List, Optional
 
-from database import get_db
-from fastapi import APIRouter, Depends, Form, HTTPException
-from models import JobApplication, JobPost
-from schemas import JobPostResponse
-from sqlalchemy.orm import Session
+from cache import CacheNamespace
+from conditional import ConditionalGet
+from counters import adjust_counters
+from database import get_async_db, get_db
+from fastapi import APIRouter, Depends, Form, HTTPException, Request, Response
+from lookups import interviewer_id_for
+from models import JobApplication, JobPost, Note, SavedJob
+from pagination import (
+    CursorParams,
+    apply_keyset,
+    created_key,
+    keyset_page,
+    set_next_cursor,
+)
+from pydantic import TypeAdapter
+from schemas import JobPostResponse, JobPostSummary
+from serialization import FAST_QUERY, RowSerializer, SparseFields
+from skills import delete_job_skills, sync_job_skills
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, defer
 
 router = APIRouter(tags=["jobs"])
 
+JOB_POST_KEY = created_key(JobPost)
+# Serialized pages of GET /job-posts, keyed on the job_posts version their
+# ETag is derived from, so every write moves both to a new entry
+JOB_POSTS_CACHE = CacheNamespace("job-posts")
+JOB_POST_LIST = TypeAdapter(List[JobPostResponse])
+JOB_POST_ROWS = RowSerializer(JobPostResponse, JobPost, JOB_POST_KEY)
+JOB_POST_FIELDS = SparseFields(JobPostResponse)
+JOB_POSTS_VALIDATORS = ConditionalGet("job_posts")
+
 
 # Create a job post
 @router.post("/job-posts", response_model=JobPostResponse)
@@ -20,7 +46,7 @@ async def create_job_post(
     description: str = Form(...),
     skills: str = Form(...),
     interviewer_email: str = Form(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     try:
         job_post = JobPost(
@@ -32,13 +58,16 @@ async def create_job_post(
             description=description,
             skills=skills,
             interviewer_email=interviewer_email,
+            interviewer_id=interviewer_id_for(interviewer_email),
         )
         db.add(job_post)
-        db.commit()
-        db.refresh(job_post)
+        await db.flush()  # Assign the job ID before indexing its skills
+        await db.run_sync(sync_job_skills, job_post)
+        await db.commit()
+        await db.refresh(job_post)
         return job_post
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=500, detail=f"Error creating job post: {str(e)}"
         )
@@ -46,11 +75,56 @@ async def create_job_post(
 
 # Get all job posts
 @router.get("/job-posts", response_model=List[JobPostResponse])
-async def get_job_posts(db: Session = Depends(get_db)):
+async def get_job_posts(
+    request: Request,
+    page: CursorParams = Depends(),
+    fast: bool = FAST_QUERY,
+    fields: Optional[List[str]] = Depends(JOB_POST_FIELDS),
+    validators: Dict[str, str] = Depends(JOB_POSTS_VALIDATORS),
+    db: AsyncSession = Depends(get_async_db),
+):
     try:
-        job_posts = db.query(JobPost).order_by(JobPost.created_at.desc()).all()
-        return job_posts
+        serializer = JOB_POST_ROWS.only(fields)
+        cache_key = f"{request.state.table_versions}:{page.cursor}:{page.limit}"
+        if fields is not None:
+            cache_key += ":" + ",".join(serializer.fields)
+        cached = await JOB_POSTS_CACHE.lookup(cache_key)
+        cache_status = "HIT"
+        if cached is None:
+            cache_status = "MISS"
+            # Without fields, both paths produce the same JSON and share
+            # cache entries
+            if fast or fields is not None:
+                query = apply_keyset(
+                    serializer.select(), JOB_POST_KEY, page.cursor, page.limit
+                )
+                rows, next_cursor = keyset_page(
+                    (await db.execute(query)).all(), JOB_POST_KEY, page.limit
+                )
+                body = serializer.dumps(rows)
+            else:
+                query = apply_keyset(
+                    select(JobPost), JOB_POST_KEY, page.cursor, page.limit
+                )
+                job_posts, next_cursor = keyset_page(
+                    (await db.scalars(query)).all(), JOB_POST_KEY, page.limit
+                )
+                body = JOB_POST_LIST.dump_json(
+                    JOB_POST_LIST.validate_python(job_posts, from_attributes=True)
+                )
+            # Stored as <next cursor>\n<JSON body>; cursors are base64
+            cached = (next_cursor or "").encode() + b"\n" + body
+            await JOB_POSTS_CACHE.store(cache_key, cached)
+
+        next_cursor, _, body = cached.partition(b"\n")
+        response = Response(content=body, media_type="application/json")
+        response.headers.update(validators)
+        response.headers["X-Cache"] = cache_status
+        set_next_cursor(response, next_cursor.decode() or None)
+        return response
     except Exception as e:
+        if isinstance(e, HTTPException):
+            raise e
         raise HTTPException(
             status_code=500, detail=f"Error fetching job posts: {str(e)}"
         )
@@ -58,9 +132,9 @@ async def get_job_posts(db: Session = Depends(get_db)):
 
 # Get a specific job post by ID
 @router.get("/job-posts/{job_id}", response_model=JobPostResponse)
-async def get_job_post(job_id: int, db: Session = Depends(get_db)):
+async def get_job_post(job_id: int, db: AsyncSession = Depends(get_async_db)):
     try:
-        job_post = db.query(JobPost).filter(JobPost.id == job_id).first()
+        job_post = await db.get(JobPost, job_id)
         if not job_post:
             raise HTTPException(status_code=404, detail="Job post not found")
         return job_post
@@ -74,52 +148,134 @@ async def get_job_post(job_id: int, db: Session = Depends(get_db)):
 
 # Add a new endpoint to get jobs by interviewer email
 @router.get("/job-posts/interviewer/{email}", response_model=List[JobPostResponse])
-async def get_interviewer_job_posts(email: str, db: Session = Depends(get_db)):
+async def get_interviewer_job_posts(
+    email: str,
+    response: Response,
+    page: CursorParams = Depends(),
+    fields: Optional[List[str]] = Depends(JOB_POST_FIELDS),
+    db: AsyncSession = Depends(get_async_db),
+):
     try:
-        job_posts = (
-            db.query(JobPost)
-            .filter(JobPost.interviewer_email == email)
-            .order_by(JobPost.created_at.desc())
-            .all()
+        interviewer_id = interviewer_id_for(email)
+        if fields is not None:
+            serializer = JOB_POST_ROWS.only(fields)
+            query = apply_keyset(
+                serializer.select().where(JobPost.interviewer_id == interviewer_id),
+                JOB_POST_KEY,
+                page.cursor,
+                page.limit,
+            )
+            rows, next_cursor = keyset_page(
+                (await db.execute(query)).all(), JOB_POST_KEY, page.limit
+            )
+            return serializer.response(rows, next_cursor)
+
+        query = apply_keyset(
+            select(JobPost).where(JobPost.interviewer_id == interviewer_id),
+            JOB_POST_KEY,
+            page.cursor,
+            page.limit,
+        )
+        job_posts, next_cursor = keyset_page(
+            (await db.scalars(query)).all(), JOB_POST_KEY, page.limit
         )
+        set_next_cursor(response, next_cursor)
         return job_posts
     except Exception as e:
+        if isinstance(e, HTTPException):
+            raise e
         raise HTTPException(
             status_code=500, detail=f"Error fetching job posts: {str(e)}"
         )
 
 
-@router.get("/interviewer/{email}")
-def get_interviewer_jobs(email: str, db: Session = Depends(get_db)):
+@router.get("/interviewer/{email}", response_model=List[JobPostSummary])
+def get_interviewer_jobs(
+    email: str,
+    response: Response,
+    page: CursorParams = Depends(),
+    fields: Optional[List[str]] = Depends(JOB_POST_FIELDS),
+    db: Session = Depends(get_db),
+):
     """
-    Get all job posts created by a specific interviewer
+    Get the job posts created by a specific interviewer, newest first,
+    without their descriptions unless requested through fields
     """
-    jobs = db.query(JobPost).filter(JobPost.interviewer_email == email).all()
+    interviewer_id = interviewer_id_for(email)
+    if fields is not None:
+        serializer = JOB_POST_ROWS.only(fields)
+        query = apply_keyset(
+            serializer.select().where(JobPost.interviewer_id == interviewer_id),
+            JOB_POST_KEY,
+            page.cursor,
+            page.limit,
+        )
+        rows, next_cursor = keyset_page(
+            db.execute(query).all(), JOB_POST_KEY, page.limit
+        )
+        return serializer.response(rows, next_cursor)
+
+    query = apply_keyset(
+        db.query(JobPost)
+        .filter(JobPost.interviewer_id == interviewer_id)
+        .options(defer(JobPost.description, raiseload=True)),
+        JOB_POST_KEY,
+        page.cursor,
+        page.limit,
+    )
+    jobs, next_cursor = keyset_page(query.all(), JOB_POST_KEY, page.limit)
+    set_next_cursor(response, next_cursor)
     return jobs
 
 
 @router.delete("/job-posts/{job_id}", response_model=dict)
-def delete_job_post(job_id: int, db: Session = Depends(get_db)):
+async def delete_job_post(job_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     Delete a job post by its ID and remove any associated job applications
+    with their notes, and saved jobs
     """
     # Check if job exists
-    job = db.query(JobPost).filter(JobPost.id == job_id).first()
+    job = await db.get(JobPost, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job post not found")
 
     # Find all applications for this job to delete them
     applications = (
-        db.query(JobApplication).filter(JobApplication.job_id == job_id).all()
-    )
+        await db.scalars(select(JobApplication).where(JobApplication.job_id == job_id))
+    ).all()
 
-    # Delete all applications for this job
+    # Delete all applications for this job, after the notes referencing them
+    await db.execute(
+        delete(Note).where(
+            Note.application_id.in_(
+                select(JobApplication.id).where(JobApplication.job_id == job_id)
+            )
+        )
+    )
     for application in applications:
-        db.delete(application)
+        await db.delete(application)
+    applied_by = Counter(application.candidate_id for application in applications)
+    await db.run_sync(
+        adjust_counters,
+        "applications",
+        {candidate_id: -count for candidate_id, count in applied_by.items()},
+    )
+
+    # Unsave it for every candidate; saved jobs reference the post
+    saved_by = Counter(
+        await db.scalars(select(SavedJob.candidate_id).where(SavedJob.job_id == job_id))
+    )
+    await db.execute(delete(SavedJob).where(SavedJob.job_id == job_id))
+    await db.run_sync(
+        adjust_counters,
+        "saved_jobs",
+        {candidate_id: -count for candidate_id, count in saved_by.items()},
+    )
 
-    # Delete the job
-    db.delete(job)
-    db.commit()
+    # Delete the job and its indexed skills
+    await db.run_sync(delete_job_skills, job_id)
+    await db.delete(job)
+    await db.commit()
 
     return {
         "message": f"Job post and {len(applications)} associated applications deleted successfully"
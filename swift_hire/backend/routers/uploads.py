@@ -0,0 +1,105 @@
+import mimetypes
+import os
+from pathlib import Path
+from typing import Optional
+
+from blobs import BLOB_DIR, BLOB_TMP_DIR, GZIP_SUFFIX, UPLOAD_DIR
+from conditional import etag_matches
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import FileResponse
+from starlette.concurrency import run_in_threadpool
+
+router = APIRouter(tags=["uploads"])
+
+UPLOAD_ROOT = Path(UPLOAD_DIR).resolve()
+# Blob names are content hashes, so a URL always refers to the same bytes
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Other uploads can be overwritten in place and must be revalidated
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+# When set (e.g. "/protected-uploads/"), file bodies are handed to nginx via
+# X-Accel-Redirect so it can send them with sendfile
+UPLOAD_ACCEL_REDIRECT = os.getenv("UPLOAD_ACCEL_REDIRECT", "")
+
+
+def _resolve(file_path: str) -> Path:
+    path = (UPLOAD_ROOT / file_path).resolve()
+    if not path.is_relative_to(UPLOAD_ROOT) or path.is_relative_to(
+        BLOB_TMP_DIR.resolve()
+    ):
+        raise HTTPException(status_code=404, detail="File not found")
+    return path
+
+
+def _is_blob(path: Path) -> bool:
+    return path.is_relative_to(BLOB_DIR.resolve())
+
+
+def _etag(path: Path, stat_result: os.stat_result, encoding: Optional[str]) -> str:
+    if _is_blob(path):
+        tag = path.name  # Starts with the SHA-256 of the original content
+    else:
+        tag = f"{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"
+    if encoding:
+        tag = f"{tag}-{encoding}"
+    return f'"{tag}"'
+
+
+def _accepts_gzip(request: Request) -> bool:
+    for coding in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip().lower() in ("gzip", "*"):
+            return params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00")
+    return False
+
+
+def _stat(path: Path) -> Optional[os.stat_result]:
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return None
+    return stat_result if path.is_file() else None
+
+
+# Serve uploaded resumes and images
+@router.api_route("/uploads/{file_path:path}", methods=["GET", "HEAD"])
+async def get_upload(file_path: str, request: Request):
+    path = _resolve(file_path)
+    stat_result = await run_in_threadpool(_stat, path)
+    if stat_result is None:
+        raise HTTPException(status_code=404, detail="File not found")
+
+    # Serve a pre-compressed copy when there is one, except for byte ranges,
+    # which always refer to the uncompressed file
+    body_path, encoding = path, None
+    if "range" not in request.headers and _accepts_gzip(request):
+        gzip_path = path.with_name(path.name + GZIP_SUFFIX)
+        gzip_stat = await run_in_threadpool(_stat, gzip_path)
+        if gzip_stat is not None:
+            body_path, stat_result, encoding = gzip_path, gzip_stat, "gzip"
+
+    etag = _etag(path, stat_result, encoding)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": (
+            IMMUTABLE_CACHE_CONTROL if _is_blob(path) else REVALIDATE_CACHE_CONTROL
+        ),
+        "Vary": "Accept-Encoding",
+    }
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    if encoding:
+        headers["Content-Encoding"] = encoding
+
+    if UPLOAD_ACCEL_REDIRECT:
+        relative = body_path.relative_to(UPLOAD_ROOT).as_posix()
+        headers["X-Accel-Redirect"] = UPLOAD_ACCEL_REDIRECT.rstrip("/") + "/" + relative
+        return Response(headers=headers, media_type=media_type)
+
+    return FileResponse(
+        body_path,
+        stat_result=stat_result,
+        headers=headers,
+        media_type=media_type,
+    )
@@ -1,7 +1,7 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import AliasChoices, BaseModel, EmailStr, Field
 
 
 class LoginUserBase(BaseModel):
@@ -18,6 +18,8 @@ class LoginUserResponse(BaseModel):
     name: str
     email: str
     role: str
+    access_token: Optional[str] = None
+    token_type: Optional[str] = None
 
     class Config:
         from_attributes = True
@@ -57,11 +59,18 @@ class CandidateCreate(CandidateBase):
     pass
 
 
-class CandidateResponse(CandidateBase):
+class CandidateSummary(CandidateBase):
+    """
+    Candidate in list responses, without the free-text bio
+    """
+
     id: int
     resume: Optional[str] = None
-    profile_image: Optional[str] = "/images/user.jpg"
-    bio: Optional[str] = None
+    # The thumbnail (Candidate.list_image) when read from a candidate row
+    profile_image: Optional[str] = Field(
+        "/images/user.jpg",
+        validation_alias=AliasChoices("list_image", "profile_image"),
+    )
     education: Optional[str] = "Not Specified"
     years_of_experience: Optional[int] = 0
 
@@ -69,6 +78,24 @@ class CandidateResponse(CandidateBase):
         from_attributes = True
 
 
+class CandidateResponse(CandidateSummary):
+    # Profiles show the full-size image
+    profile_image: Optional[str] = "/images/user.jpg"
+    bio: Optional[str] = None
+
+
+class CandidateSearchResult(CandidateResponse):
+    rank: float
+
+
+class PaginatedCandidateSearch(BaseModel):
+    items: List[CandidateSearchResult]
+    total: int
+    page: int
+    size: int
+    pages: int
+
+
 class InterviewerBase(BaseModel):
     name: str
     email: str
@@ -106,6 +133,27 @@ class JobPostCreate(JobPostBase):
 class JobPostResponse(JobPostBase):
     id: int
     interviewer_email: str
+    interviewer_id: Optional[int] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class JobPostSummary(BaseModel):
+    """
+    Job post in list responses, without the free-text description
+    """
+
+    id: int
+    title: str
+    company: str
+    location: str
+    type: str
+    salary: str
+    skills: str
+    interviewer_email: str
+    interviewer_id: Optional[int] = None
     created_at: datetime
 
     class Config:
@@ -119,12 +167,40 @@ class SavedJobBase(BaseModel):
 
 class SavedJobResponse(SavedJobBase):
     id: int
+    candidate_id: Optional[int] = None
     created_at: datetime
 
     class Config:
         from_attributes = True
 
 
+class DashboardCounts(BaseModel):
+    applications: int
+    saved_jobs: int
+
+
+class DashboardJob(JobPostSummary):
+    # Number of applications by status
+    application_counts: Dict[str, int] = {}
+
+
+class UpcomingInterview(BaseModel):
+    application_id: int
+    job_id: int
+    job_title: str
+    candidate_email: str
+    candidate_name: Optional[str] = None
+    interview_schedule: datetime
+    interview_duration: Optional[int] = None
+    interview_title: Optional[str] = None
+    interview_form_url: Optional[str] = None
+
+
+class InterviewerDashboard(BaseModel):
+    jobs: List[DashboardJob]
+    upcoming_interviews: List[UpcomingInterview]
+
+
 class InterviewQuestionBase(BaseModel):
     form_url: str
     form_title: str
@@ -166,8 +242,27 @@ class JobApplicationUpdate(BaseModel):
         from_attributes = True
 
 
+class JobApplicationBulkUpdate(BaseModel):
+    application_ids: List[int] = Field(..., min_length=1, max_length=500)
+    status: str
+
+
+class JobApplicationBulkResult(BaseModel):
+    application_id: int
+    success: bool
+    detail: Optional[str] = None
+
+
+class JobApplicationBulkUpdateResponse(BaseModel):
+    status: str
+    updated: int
+    results: List[JobApplicationBulkResult]
+
+
 class JobApplicationResponse(JobApplicationBase):
     id: int
+    candidate_id: Optional[int] = None
+    interviewer_id: Optional[int] = None
     status: str
     interview_form_url: Optional[str] = None
     interview_schedule: Optional[datetime] = None  # Return datetime
@@ -228,6 +323,7 @@ class PaginatedJobApplications(BaseModel):
     page: int
     size: int
     pages: int
+    next_cursor: Optional[str] = None
 
 
 class CalendarInviteRequest(BaseModel):
@@ -246,17 +342,24 @@ class NoteBase(BaseModel):
     created_by: EmailStr
 
 
-class NoteCreate(NoteBase):
+class NoteCreate(BaseModel):
+    """
+    The author is the access token's user; created_by may be omitted, and
+    is rejected when it names anyone else.
+    """
+
+    content: str
+    created_by: Optional[EmailStr] = None
     application_id: int
 
 
 class NoteUpdate(BaseModel):
     content: str
-    created_by: EmailStr
+    created_by: Optional[EmailStr] = None
 
 
 class NoteDelete(BaseModel):
-    created_by: EmailStr
+    created_by: Optional[EmailStr] = None
 
 
 class NoteResponse(NoteBase):
@@ -0,0 +1,172 @@
+import asyncio
+import hmac
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import NamedTuple, Optional, Tuple
+
+from dotenv import load_dotenv
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from jose import JWTError, jwt
+from passlib.context import CryptContext
+
+load_dotenv()
+
+# bcrypt cost factor; each +1 doubles the time of a hash or verification.
+# Stored hashes with a different cost are rehashed on the next login.
+PASSWORD_HASH_ROUNDS = int(os.getenv("PASSWORD_HASH_ROUNDS", "12"))
+# Threads hashing and verifying passwords. bcrypt releases the GIL, so one
+# per core keeps logins from starving the default thread pool.
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS") or os.cpu_count() or 1)
+
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=PASSWORD_HASH_ROUNDS
+)
+
+_executor = ThreadPoolExecutor(
+    max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash"
+)
+
+SECRET_KEY = os.getenv("SECRET_KEY")
+if not SECRET_KEY:
+    # Every worker must sign and verify tokens with the same key
+    raise RuntimeError("SECRET_KEY is not set; it signs the access tokens")
+ALGORITHM = os.getenv("ALGORITHM", "HS256")
+ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+# Reject requests without a bearer token instead of falling back to the
+# identity given in the request body
+REQUIRE_ACCESS_TOKEN = os.getenv("REQUIRE_ACCESS_TOKEN", "").lower() == "true"
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+def hash_password_sync(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def verify_password_sync(
+    password: str, stored: Optional[str]
+) -> Tuple[bool, Optional[str]]:
+    """
+    Check a password against a stored hash. Returns whether it matches and,
+    if the stored value should be replaced, its new hash.
+    """
+    if stored is None:
+        # Spend the same time as a real check so unknown emails are not
+        # distinguishable by response time
+        pwd_context.dummy_verify()
+        return False, None
+
+    if pwd_context.identify(stored) is None:
+        # Plaintext password from before hashing was introduced
+        if hmac.compare_digest(password.encode(), stored.encode()):
+            return True, pwd_context.hash(password)
+        return False, None
+
+    return pwd_context.verify_and_update(password, stored)
+
+
+async def _run(fn, *args):
+    return await asyncio.get_running_loop().run_in_executor(_executor, fn, *args)
+
+
+async def hash_password(password: str) -> str:
+    """
+    Hash a password for storage, off the event loop
+    """
+    return await _run(hash_password_sync, password)
+
+
+async def verify_password(
+    password: str, stored: Optional[str]
+) -> Tuple[bool, Optional[str]]:
+    """
+    verify_password_sync() run off the event loop
+    """
+    return await _run(verify_password_sync, password, stored)
+
+
+class TokenUser(NamedTuple):
+    email: str
+    role: str
+    name: str
+
+
+def create_access_token(email: str, role: str, name: str) -> str:
+    """
+    Signed token carrying the user's identity and role
+    """
+    now = datetime.now(timezone.utc)
+    claims = {
+        "sub": email,
+        "role": role,
+        "name": name,
+        "iat": now,
+        "exp": now + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES),
+    }
+    return jwt.encode(claims, SECRET_KEY, algorithm=ALGORITHM)
+
+
+def decode_access_token(token: str) -> TokenUser:
+    try:
+        claims = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        return TokenUser(email=claims["sub"], role=claims["role"], name=claims["name"])
+    except (JWTError, KeyError):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired access token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+async def get_token_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+) -> Optional[TokenUser]:
+    """
+    Caller identified by the bearer token alone, without a database lookup.
+    None when no token is sent and REQUIRE_ACCESS_TOKEN is off.
+    """
+    if credentials is None:
+        if REQUIRE_ACCESS_TOKEN:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Not authenticated",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        return None
+    return decode_access_token(credentials.credentials)
+
+
+async def require_token_user(
+    user: Optional[TokenUser] = Depends(get_token_user),
+) -> TokenUser:
+    """
+    Caller identified by the bearer token, which is required whatever
+    REQUIRE_ACCESS_TOKEN says
+    """
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
+
+
+def authorize(
+    user: Optional[TokenUser],
+    email: Optional[str] = None,
+    role: Optional[str] = None,
+    detail: str = "Not allowed",
+) -> None:
+    """
+    Raise 403 unless the token user has the given email and role. Requests
+    without a token are left to the route's own checks.
+    """
+    if user is None:
+        return
+    if (email is not None and user.email != email) or (
+        role is not None and user.role != role
+    ):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
@@ -0,0 +1,152 @@
+import random
+from typing import List, Optional
+
+from models import Candidate, CandidateSkill, JobPost, JobSkill
+from sqlalchemy import Select, desc, distinct, exists, func, select
+from sqlalchemy.orm import Session, defer
+
+MAX_SKILL_LENGTH = 100
+
+# Recommendations are listed without the job descriptions
+WITHOUT_DESCRIPTION = defer(JobPost.description, raiseload=True)
+
+
+def normalize_skills(raw: Optional[str]) -> List[str]:
+    """
+    Split a comma-separated skills string into unique, lower-cased tokens
+    """
+    skills = []
+    for part in (raw or "").split(","):
+        skill = " ".join(part.lower().split())[:MAX_SKILL_LENGTH]
+        if skill and skill not in skills:
+            skills.append(skill)
+    return skills
+
+
+def sync_job_skills(db: Session, job: JobPost) -> None:
+    """
+    Replace the indexed skills of a job post. The job must already be flushed.
+    """
+    db.query(JobSkill).filter(JobSkill.job_id == job.id).delete(
+        synchronize_session=False
+    )
+    db.add_all(
+        JobSkill(job_id=job.id, skill=skill) for skill in normalize_skills(job.skills)
+    )
+
+
+def delete_job_skills(db: Session, job_id: int) -> None:
+    db.query(JobSkill).filter(JobSkill.job_id == job_id).delete(
+        synchronize_session=False
+    )
+
+
+def sync_candidate_skills(db: Session, candidate: Candidate) -> None:
+    """
+    Replace the indexed skills of a candidate. The candidate must already be
+    flushed.
+    """
+    db.query(CandidateSkill).filter(CandidateSkill.candidate_id == candidate.id).delete(
+        synchronize_session=False
+    )
+    db.add_all(
+        CandidateSkill(candidate_id=candidate.id, skill=skill)
+        for skill in normalize_skills(candidate.skills)
+    )
+
+
+def backfill_skill_index(db: Session) -> int:
+    """
+    Index job posts and candidates that have no skill rows yet, e.g. rows
+    inserted without the API. Migration 0002 indexes those created before
+    the index existed. Returns the number of rows indexed.
+    """
+    jobs = (
+        db.query(JobPost).filter(~exists().where(JobSkill.job_id == JobPost.id)).all()
+    )
+    for job in jobs:
+        sync_job_skills(db, job)
+
+    candidates = (
+        db.query(Candidate)
+        .filter(~exists().where(CandidateSkill.candidate_id == Candidate.id))
+        .all()
+    )
+    for candidate in candidates:
+        sync_candidate_skills(db, candidate)
+
+    db.commit()
+    return len(jobs) + len(candidates)
+
+
+def candidates_with_skills(skills: List[str], match_all: bool) -> Select:
+    """
+    Select candidates having any (or, with match_all, every) of the given
+    normalized skills, matched on the candidate_skills index
+    """
+    matching_ids = (
+        select(CandidateSkill.candidate_id)
+        .where(CandidateSkill.skill.in_(skills))
+        .group_by(CandidateSkill.candidate_id)
+    )
+    if match_all:
+        matching_ids = matching_ids.having(
+            func.count(distinct(CandidateSkill.skill)) == len(skills)
+        )
+    return select(Candidate).where(Candidate.id.in_(matching_ids))
+
+
+def recommend_jobs(db: Session, skills: List[str], limit: int) -> List[JobPost]:
+    """
+    Return up to `limit` job posts ranked by the number of skills they share
+    with `skills`, newest first among equal scores
+    """
+    if not skills:
+        return []
+
+    score = func.count(JobSkill.id).label("score")
+    ranked = (
+        db.query(JobSkill.job_id, score)
+        .filter(JobSkill.skill.in_(skills))
+        .group_by(JobSkill.job_id)
+        .order_by(desc(score), desc(JobSkill.job_id))
+        .limit(limit)
+        .all()
+    )
+    if not ranked:
+        return []
+
+    job_ids = [job_id for job_id, _ in ranked]
+    jobs = {
+        job.id: job
+        for job in db.query(JobPost)
+        .options(WITHOUT_DESCRIPTION)
+        .filter(JobPost.id.in_(job_ids))
+    }
+    return [jobs[job_id] for job_id in job_ids if job_id in jobs]
+
+
+def random_jobs(db: Session, limit: int) -> List[JobPost]:
+    """
+    Pick up to `limit` random job posts by probing random ids on the primary
+    key index rather than sorting the whole table
+    """
+    max_id = db.query(func.max(JobPost.id)).scalar()
+    if max_id is None:
+        return []
+
+    picked = {}
+    for _ in range(limit * 4):
+        if len(picked) >= limit:
+            break
+        job = (
+            db.query(JobPost)
+            .options(WITHOUT_DESCRIPTION)
+            .filter(JobPost.id >= random.randint(1, max_id))
+            .order_by(JobPost.id)
+            .first()
+        )
+        if job is not None:
+            picked[job.id] = job
+    return list(picked.values())
+
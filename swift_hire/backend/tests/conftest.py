@@ -0,0 +1,35 @@
+"""
+Tests run against a throwaway database: SQLite in a temporary directory,
+or the Postgres database named by TEST_DATABASE_URL. DATABASE_URL is
+replaced before the app is imported, so a configured database is never
+touched.
+"""
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WORK_DIR = tempfile.mkdtemp(prefix="swift_hire_tests_")
+
+sys.path.insert(0, BACKEND_DIR)
+os.chdir(WORK_DIR)  # Uploads are written relative to the working directory
+os.environ["DATABASE_URL"] = os.environ.get(
+    "TEST_DATABASE_URL", f"sqlite:///{WORK_DIR}/test.db"
+)
+os.environ["ASYNC_DATABASE_URL"] = ""
+os.environ.setdefault("PASSWORD_HASH_ROUNDS", "4")
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+# No outbox workers: tests drive delivery themselves and never reach a real server
+os.environ["EMAIL_WORKERS"] = "0"
+
+
+@pytest.fixture(scope="session")
+def client():
+    from fastapi.testclient import TestClient
+    from main import app
+
+    with TestClient(app) as client:
+        yield client
@@ -0,0 +1,116 @@
+"""
+Blob files follow their rows: removed when the last reference is released,
+kept when the same content is stored again, and not left behind by failed
+uploads.
+"""
+
+import os
+
+import pytest
+
+
+def _register(client, email, resume):
+    return client.post(
+        "/register/candidate",
+        data={"name": "Blob", "email": email, "password": "p", "skills": "Python"},
+        files={"resume": ("cv.pdf", resume, "application/pdf")},
+    )
+
+
+def _update_resume(client, email, resume):
+    return client.put(
+        f"/candidates/{email}",
+        data={"name": "Blob", "skills": "Python"},
+        files={"resume": ("cv.pdf", resume, "application/pdf")},
+    )
+
+
+def _blob(sha256):
+    from database import SessionLocal
+    from models import Blob
+
+    with SessionLocal() as db:
+        return db.query(Blob).filter(Blob.sha256 == sha256).first()
+
+
+def _sha256(content):
+    import hashlib
+
+    return hashlib.sha256(content).hexdigest()
+
+
+def test_released_blob_is_removed_after_commit(client):
+    old, new = b"%PDF released resume", b"%PDF replacement resume"
+    assert _register(client, "released@example.com", old).status_code == 200
+    path = _blob(_sha256(old)).path
+    assert os.path.exists(path)
+
+    assert _update_resume(client, "released@example.com", new).status_code == 200
+    assert _blob(_sha256(old)) is None
+    assert not os.path.exists(path)
+
+
+def test_blob_stored_again_before_removal_is_kept(client, monkeypatch):
+    import blobs
+
+    content = b"%PDF shared resume"
+    assert _register(client, "first@example.com", content).status_code == 200
+    path = _blob(_sha256(content)).path
+
+    # Hold back the removal that follows the release, as if the commit that
+    # released it and a new upload of the same content raced
+    pending = []
+    monkeypatch.setattr(blobs, "remove_unreferenced_blobs", pending.extend)
+    assert _update_resume(client, "first@example.com", b"%PDF other").status_code == 200
+    assert _blob(_sha256(content)).refcount == 0
+    assert _register(client, "second@example.com", content).status_code == 200
+    monkeypatch.undo()
+
+    blobs.remove_unreferenced_blobs(pending)
+    assert _blob(_sha256(content)).refcount == 1
+    assert os.path.exists(path)
+
+
+def test_failed_registration_removes_its_upload(client, monkeypatch):
+    import routers.candidates
+
+    async def failing_hash(password):
+        raise RuntimeError("hashing failed")
+
+    monkeypatch.setattr(routers.candidates, "hash_password", failing_hash)
+    content = b"%PDF orphaned resume"
+    response = _register(client, "failed@example.com", content)
+
+    assert response.status_code == 500
+    assert _blob(_sha256(content)) is None
+    blob_dir = os.path.join("uploads", "blobs", _sha256(content)[:2])
+    assert not any(
+        name.startswith(_sha256(content))
+        for _, _, files in os.walk(blob_dir)
+        for name in files
+    )
+
+
+@pytest.mark.parametrize("refcount", [0, 1])
+def test_remove_unreferenced_blobs_keeps_referenced_rows(client, refcount):
+    import blobs
+    from database import SessionLocal
+    from models import Blob
+
+    content = f"%PDF direct {refcount}".encode()
+    path = blobs.blob_path(_sha256(content), ".pdf")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as file:
+        file.write(content)
+    with SessionLocal() as db:
+        db.add(
+            Blob(
+                sha256=_sha256(content), path=path, size=len(content), refcount=refcount
+            )
+        )
+        db.commit()
+
+    blobs.remove_unreferenced_blobs([(_sha256(content), path, len(content))])
+
+    assert (_blob(_sha256(content)) is not None) == bool(refcount)
+    assert os.path.exists(path) == bool(refcount)
@@ -0,0 +1,35 @@
+"""
+The interviewer dashboard is only served to its interviewer, including
+from the cache.
+"""
+
+INTERVIEWER = "dashboard@example.com"
+
+
+def _headers(email):
+    from security import create_access_token
+
+    token = create_access_token(email, "Interviewer", "Dashboard")
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_dashboard_rejects_other_interviewers(client):
+    import models
+    from database import SessionLocal
+
+    with SessionLocal() as db:
+        db.add(
+            models.Interviewer(
+                name="Dashboard",
+                email=INTERVIEWER,
+                expertise="",
+                availability="",
+                department="",
+            )
+        )
+        db.commit()
+
+    path = f"/dashboard/interviewer/{INTERVIEWER}"
+    assert client.get(path, headers=_headers(INTERVIEWER)).status_code == 200
+    response = client.get(path, headers=_headers("other@example.com"))
+    assert response.status_code == 403
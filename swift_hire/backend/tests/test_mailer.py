@@ -0,0 +1,208 @@
+"""
+The pooled SMTP transport and the outbox against a local aiosmtpd server
+with STARTTLS and AUTH, like the production relay.
+"""
+
+import datetime
+import socket
+import ssl
+from email.message import EmailMessage
+
+import pytest
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+MESSAGE = "Subject: Interview\r\n\r\nSee you tomorrow.\r\n"
+
+
+class Relay:
+    """
+    Records delivered messages and logins. Every pooled session logs in
+    exactly once, so logins count connections.
+    """
+
+    def __init__(self):
+        self.messages = []
+        self.logins = 0
+        self.refused = set()
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address in self.refused:
+            return "550 Mailbox unavailable"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append((envelope.rcpt_tos, envelope.content))
+        return "250 Message accepted for delivery"
+
+    def authenticate(self, server, session, envelope, mechanism, auth_data):
+        self.logins += 1
+        return AuthResult(success=True)
+
+    def start(self, tls_context):
+        self.tls_context = tls_context
+        self.controller = Controller(
+            self,
+            hostname="127.0.0.1",
+            port=self.port,
+            tls_context=tls_context,
+            require_starttls=True,
+            authenticator=self.authenticate,
+        )
+        self.controller.start()
+
+    def stop(self):
+        self.controller.stop()
+
+    def restart(self):
+        """
+        Drop every open session, as a relay does on idle timeouts
+        """
+        self.stop()
+        self.start(self.tls_context)
+
+
+@pytest.fixture(scope="module")
+def tls_context(tmp_path_factory):
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    directory = tmp_path_factory.mktemp("tls")
+    (directory / "cert.pem").write_bytes(
+        certificate.public_bytes(serialization.Encoding.PEM)
+    )
+    (directory / "key.pem").write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(directory / "cert.pem", directory / "key.pem")
+    return context
+
+
+@pytest.fixture
+def relay(tls_context):
+    handler = Relay()
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        handler.port = probe.getsockname()[1]
+    handler.start(tls_context)
+    yield handler
+    handler.stop()
+
+
+@pytest.fixture
+def smtp_pool(relay):
+    from mailer import SMTPConnectionPool
+
+    pool = SMTPConnectionPool(
+        host="127.0.0.1",
+        port=relay.port,
+        username="noreply@example.com",
+        password="secret",
+        size=1,
+    )
+    yield pool
+    pool.close_all()
+
+
+def test_pool_reuses_one_session(relay, smtp_pool):
+    for index in range(5):
+        smtp_pool.send(f"candidate{index}@example.com", MESSAGE)
+
+    assert len(relay.messages) == 5
+    assert relay.logins == 1
+
+
+def test_pool_reconnects_after_the_server_drops_the_session(relay, smtp_pool):
+    smtp_pool.send("candidate@example.com", MESSAGE)
+    relay.restart()
+    smtp_pool.send("candidate@example.com", MESSAGE)
+
+    assert len(relay.messages) == 2
+    assert relay.logins == 2
+
+
+def test_retry_opens_a_new_session(relay):
+    from mailer import SMTPConnectionPool
+
+    pool = SMTPConnectionPool(
+        host="127.0.0.1",
+        port=relay.port,
+        username="noreply@example.com",
+        password="secret",
+        size=2,
+    )
+    # Two idle sessions, both dropped by the relay
+    with pool.connection(), pool.connection():
+        pass
+    relay.restart()
+    try:
+        pool.send("candidate@example.com", MESSAGE)
+    finally:
+        pool.close_all()
+
+    assert len(relay.messages) == 1
+    assert relay.logins == 3
+
+
+def test_refused_recipient_keeps_the_session(relay, smtp_pool):
+    import smtplib
+
+    relay.refused.add("gone@example.com")
+    with pytest.raises(smtplib.SMTPRecipientsRefused):
+        smtp_pool.send("gone@example.com", MESSAGE)
+    smtp_pool.send("candidate@example.com", MESSAGE)
+
+    assert len(relay.messages) == 1
+    assert relay.logins == 1
+
+
+def test_outbox_marks_rows_failed_after_retries(client, relay, smtp_pool, monkeypatch):
+    import outbox
+    from database import SessionLocal
+    from models import EmailOutbox
+
+    monkeypatch.setattr(outbox, "EMAIL_MAX_ATTEMPTS", 3)
+    monkeypatch.setattr(outbox, "retry_delay", lambda attempts: 0)
+    relay.refused.add("gone@example.com")
+
+    with SessionLocal() as db:
+        entries = []
+        for to_email in ("gone@example.com", "candidate@example.com"):
+            msg = EmailMessage()
+            msg["Subject"] = "Interview"
+            msg.set_content("See you tomorrow.")
+            entries.append(outbox.enqueue_email(db, to_email, msg))
+        db.commit()
+        ids = [entry.id for entry in entries]
+
+    workers = outbox.OutboxWorkerPool(SessionLocal, deliver=smtp_pool.send)
+    while workers.process_one():
+        pass
+
+    with SessionLocal() as db:
+        refused, delivered = [db.get(EmailOutbox, id) for id in ids]
+        assert (refused.status, refused.attempts) == ("Failed", 3)
+        assert "Mailbox unavailable" in refused.last_error
+        assert (delivered.status, delivered.attempts) == ("Sent", 1)
+
+    assert [rcpt_tos for rcpt_tos, _ in relay.messages] == [["candidate@example.com"]]
@@ -0,0 +1,92 @@
+"""
+Notes are written by the application's interviewer, identified by the
+access token alone.
+"""
+
+import pytest
+
+INTERVIEWER = "notes@example.com"
+
+
+def _headers(email):
+    from security import create_access_token
+
+    token = create_access_token(email, "Interviewer", "Notes")
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture(scope="module")
+def application_id(client):
+    import models
+    from database import SessionLocal
+
+    with SessionLocal() as db:
+        job = models.JobPost(
+            title="Notes",
+            company="Company",
+            location="Remote",
+            type="Full-time",
+            salary="1",
+            description="Description",
+            skills="Python",
+            interviewer_email=INTERVIEWER,
+        )
+        db.add(job)
+        db.flush()
+        application = models.JobApplication(
+            candidate_email="noted@example.com",
+            job_id=job.id,
+            interviewer_email=INTERVIEWER,
+        )
+        db.add(application)
+        db.commit()
+        return application.id
+
+
+def test_note_requires_a_token(client, application_id):
+    response = client.post(
+        f"/job-applications/{application_id}/notes",
+        json={
+            "content": "Strong",
+            "created_by": INTERVIEWER,
+            "application_id": application_id,
+        },
+    )
+    assert response.status_code == 401
+
+
+def test_note_rejects_another_author(client, application_id):
+    response = client.post(
+        f"/job-applications/{application_id}/notes",
+        json={
+            "content": "Strong",
+            "created_by": "someone@example.com",
+            "application_id": application_id,
+        },
+        headers=_headers(INTERVIEWER),
+    )
+    assert response.status_code == 403
+
+
+def test_note_is_written_by_the_token_user(client, application_id):
+    path = f"/job-applications/{application_id}/notes"
+    body = {"content": "Strong", "application_id": application_id}
+    assert (
+        client.post(path, json=body, headers=_headers("other@example.com")).status_code
+        == 403
+    )
+
+    response = client.post(path, json=body, headers=_headers(INTERVIEWER))
+    assert response.status_code == 200, response.text
+    assert response.json()["created_by"] == INTERVIEWER
+
+    note_id = response.json()["id"]
+    response = client.request("DELETE", f"/job-applications/notes/{note_id}", json={})
+    assert response.status_code == 401
+    response = client.request(
+        "DELETE",
+        f"/job-applications/notes/{note_id}",
+        json={},
+        headers=_headers(INTERVIEWER),
+    )
+    assert response.status_code == 204
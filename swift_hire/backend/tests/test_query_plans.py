@@ -0,0 +1,168 @@
+"""
+Guards the lookup indexes: every SELECT the lookup routes send is explained
+on the same connection, and a sequential scan of any table fails the test.
+Postgres plans are taken with enable_seqscan off, so a Seq Scan there means
+no index can serve the query at all.
+"""
+
+import re
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+INTERVIEWER = "interviewer@example.com"
+CANDIDATE = "candidate0@example.com"
+
+# A plain "SCAN <table>" reads every row; index scans say USING ... INDEX
+# and full-text lookups VIRTUAL TABLE INDEX
+SQLITE_TABLE_SCAN = re.compile(r"^SCAN (\w+)(?: AS \w+)?$")
+POSTGRES_TABLE_SCAN = re.compile(r"Seq Scan on (\w+)")
+
+LOOKUPS = [
+    f"/job-applications/interviewer/{INTERVIEWER}",
+    f"/job-applications/candidate/{CANDIDATE}",
+    f"/job-applications/count/{CANDIDATE}",
+    f"/job-applications/check/{CANDIDATE}/1",
+    "/job-applications/1",
+    f"/job-posts/interviewer/{INTERVIEWER}",
+    f"/interviewer/{INTERVIEWER}",
+    f"/saved-jobs/{CANDIDATE}",
+    f"/saved-jobs/count/{CANDIDATE}",
+    f"/candidates/{CANDIDATE}/recommended-jobs",
+    "/candidates/filter?skills=python&match_all=false",
+    "/candidates/search?q=kubernetes",
+    f"/dashboard/counts/{CANDIDATE}",
+    f"/dashboard/interviewer/{INTERVIEWER}",
+]
+
+
+@pytest.fixture(scope="module")
+def seeded(client):
+    import models
+    from database import SessionLocal
+    from skills import backfill_skill_index
+
+    with SessionLocal() as db:
+        interviewer = models.Interviewer(
+            name="Interviewer",
+            email=INTERVIEWER,
+            expertise="",
+            availability="",
+            department="",
+        )
+        db.add(interviewer)
+        db.flush()
+        jobs = [
+            models.JobPost(
+                title=f"Job {i}",
+                company="Company",
+                location="Remote",
+                type="Full-time",
+                salary="1",
+                description="Description",
+                skills="python, sql" if i % 2 else "go",
+                interviewer_email=INTERVIEWER,
+                interviewer_id=interviewer.id,
+            )
+            for i in range(20)
+        ]
+        db.add_all(jobs)
+        for c in range(40):
+            email = f"candidate{c}@example.com"
+            candidate = models.Candidate(
+                name=f"Candidate {c}", email=email, skills="Python", resume="cv.pdf"
+            )
+            db.add(candidate)
+            db.flush()
+            db.add(
+                models.ResumeDocument(
+                    candidate_id=candidate.id,
+                    source="cv.pdf",
+                    content="kubernetes" if c % 3 else "java",
+                )
+            )
+            for job in jobs[: c % 5 + 1]:
+                db.add(
+                    models.JobApplication(
+                        candidate_email=email,
+                        candidate_id=candidate.id,
+                        job_id=job.id,
+                        interviewer_email=INTERVIEWER,
+                        interviewer_id=interviewer.id,
+                    )
+                )
+            db.add(
+                models.SavedJob(
+                    candidate_email=email, candidate_id=candidate.id, job_id=jobs[0].id
+                )
+            )
+            db.add(
+                models.Feedback(
+                    user_email=email,
+                    user_name=candidate.name,
+                    user_role="Candidate",
+                    rating=5,
+                    message="Good",
+                )
+            )
+        db.flush()
+        db.add(models.Note(application_id=1, content="Strong", created_by=INTERVIEWER))
+        db.commit()
+        backfill_skill_index(db)
+
+
+@contextmanager
+def explained_selects():
+    """
+    Collect (statement, plan lines) for every SELECT sent on either engine
+    """
+    from database import async_engine, engine
+
+    plans = []
+
+    def explain(conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith("SELECT"):
+            return
+        if conn.dialect.name == "sqlite":
+            cursor.execute("EXPLAIN QUERY PLAN " + statement, parameters)
+            lines = [row[-1] for row in cursor.fetchall()]
+        else:
+            cursor.execute("SET enable_seqscan = off")
+            cursor.execute("EXPLAIN " + statement, parameters)
+            lines = [row[0] for row in cursor.fetchall()]
+        plans.append((statement, lines))
+
+    engines = [engine, async_engine.sync_engine]
+    for target in engines:
+        event.listen(target, "before_cursor_execute", explain)
+    try:
+        yield plans
+    finally:
+        for target in engines:
+            event.remove(target, "before_cursor_execute", explain)
+
+
+def _table_scans(lines):
+    scans = []
+    for line in lines:
+        match = SQLITE_TABLE_SCAN.match(line.strip()) or POSTGRES_TABLE_SCAN.search(
+            line
+        )
+        if match:
+            scans.append(match.group(1))
+    return scans
+
+
+@pytest.mark.parametrize("path", LOOKUPS)
+def test_lookup_uses_indexes(client, seeded, path):
+    with explained_selects() as plans:
+        response = client.get(path)
+    assert response.status_code == 200, response.text
+    assert plans, f"{path} sent no SELECT"
+
+    for statement, lines in plans:
+        scans = _table_scans(lines)
+        assert (
+            not scans
+        ), f"{path} scans {', '.join(scans)}:\n{statement}\n" + "\n".join(lines)
@@ -0,0 +1,92 @@
+"""
+Each RowSerializer list encodes its rows to the same JSON as the ORM
+objects validated against the route's response model.
+"""
+
+from typing import List
+
+import orjson
+import pytest
+from pydantic import TypeAdapter
+from sqlalchemy import select
+
+LISTS = [
+    ("routers.jobs", "JOB_POST_ROWS", "JobPostResponse"),
+    ("routers.candidates", "CANDIDATE_ROWS", "CandidateSummary"),
+    ("routers.feedback", "FEEDBACK_ROWS", "FeedbackResponse"),
+    ("routers.admin_routes", "USER_ROWS", "UserResponse"),
+]
+
+
+@pytest.fixture(scope="module")
+def seeded(client):
+    import models
+    from database import SessionLocal
+
+    with SessionLocal() as db:
+        db.add_all(
+            [
+                models.User(
+                    name="Serialized",
+                    email="serialized@example.com",
+                    password="x" * 60,
+                    role="Interviewer",
+                ),
+                models.Candidate(
+                    name="Serialized",
+                    email="serialized@example.com",
+                    skills="Python",
+                    resume="cv.pdf",
+                    profile_image="uploads/original.png",
+                    profile_thumbnail="uploads/original.png.thumb128.webp",
+                    years_of_experience=None,
+                ),
+                models.Candidate(
+                    name="Unserialized",
+                    email="unserialized@example.com",
+                    skills="",
+                    resume="cv.pdf",
+                    profile_image=None,
+                ),
+                models.JobPost(
+                    title="Serialized",
+                    company="Company",
+                    location="Remote",
+                    type="Full-time",
+                    salary="1",
+                    description="Description",
+                    skills="Python",
+                    interviewer_email="serialized@example.com",
+                ),
+                models.Feedback(
+                    user_email="serialized@example.com",
+                    user_name="Serialized",
+                    user_role="Interviewer",
+                    rating=4,
+                    message="Fine",
+                ),
+            ]
+        )
+        db.commit()
+
+
+@pytest.mark.parametrize("module, serializer, schema", LISTS)
+def test_rows_match_validated_objects(client, seeded, module, serializer, schema):
+    import importlib
+
+    import schemas
+    from database import SessionLocal
+
+    serializer = getattr(importlib.import_module(module), serializer)
+    adapter = TypeAdapter(List[getattr(schemas, schema)])
+    order = serializer.model.id
+
+    with SessionLocal() as db:
+        objects = db.scalars(select(serializer.model).order_by(order)).all()
+        rows = db.execute(serializer.select().order_by(order)).all()
+
+    assert objects
+    validated = adapter.dump_json(
+        adapter.validate_python(objects, from_attributes=True)
+    )
+    assert orjson.loads(serializer.dumps(rows)) == orjson.loads(validated)
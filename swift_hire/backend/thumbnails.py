@@ -0,0 +1,70 @@
+import os
+from pathlib import Path
+from uuid import uuid4
+
+from blobs import BLOB_TMP_DIR
+from database import SessionLocal
+from models import Blob, Candidate
+from PIL import Image, ImageOps, features
+from sqlalchemy.orm import sessionmaker
+
+THUMBNAIL_SIZE = int(os.getenv("THUMBNAIL_SIZE", "128"))
+THUMBNAIL_QUALITY = int(os.getenv("THUMBNAIL_QUALITY", "80"))
+# WebP when Pillow was built with it, JPEG otherwise
+THUMBNAIL_FORMAT = "WEBP" if features.check("webp") else "JPEG"
+
+
+def thumbnail_path(blob_path: str) -> str:
+    """
+    Thumbnails sit next to their blob, so they are shared by identical
+    images and removed together with the blob
+    """
+    return f"{blob_path}.thumb{THUMBNAIL_SIZE}.{THUMBNAIL_FORMAT.lower()}"
+
+
+def render_thumbnail(source: str, destination: str) -> None:
+    """
+    Write a square, EXIF-rotated RGB thumbnail of an image
+    """
+    with Image.open(source) as image:
+        # Let JPEG decoding downscale early instead of decoding full size
+        image.draft("RGB", (THUMBNAIL_SIZE * 2, THUMBNAIL_SIZE * 2))
+        image = ImageOps.exif_transpose(image).convert("RGB")
+        thumbnail = ImageOps.fit(
+            image, (THUMBNAIL_SIZE, THUMBNAIL_SIZE), Image.Resampling.LANCZOS
+        )
+
+    temp_path = BLOB_TMP_DIR / uuid4().hex
+    temp_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        thumbnail.save(temp_path, format=THUMBNAIL_FORMAT, quality=THUMBNAIL_QUALITY)
+        os.replace(temp_path, destination)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def generate_profile_thumbnail(
+    candidate_id: int, blob_id: int, session_factory: sessionmaker = SessionLocal
+) -> None:
+    """
+    Background task run after a profile image upload. Records the
+    thumbnail unless the candidate has switched images in the meantime.
+    """
+    with session_factory() as db:
+        blob = db.get(Blob, blob_id)
+        if blob is None:
+            return
+
+        destination = thumbnail_path(blob.path)
+        if not Path(destination).exists():
+            try:
+                render_thumbnail(blob.path, destination)
+            except Exception as e:
+                print(f"Error creating thumbnail for {blob.path}: {str(e)}")
+                return
+
+        db.query(Candidate).filter(
+            Candidate.id == candidate_id,
+            Candidate.profile_image_blob_id == blob_id,
+        ).update({Candidate.profile_thumbnail: destination}, synchronize_session=False)
+        db.commit()
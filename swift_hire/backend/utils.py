@@ -1,23 +1,65 @@
+import hashlib
+import os
 from pathlib import Path
+from typing import BinaryIO, NamedTuple
 
 from fastapi import HTTPException, UploadFile
+from starlette.concurrency import run_in_threadpool
 
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", 1024 * 1024))
+MAX_FILE_SIZE = int(os.getenv("MAX_FILE_SIZE", 10 * 1024 * 1024))
 
-async def save_upload_file(upload_file: UploadFile, destination: str) -> str:
+
+class StoredUpload(NamedTuple):
+    path: str
+    size: int
+    sha256: str
+
+
+def _write_chunk(buffer: BinaryIO, digest, chunk: bytes) -> None:
+    digest.update(chunk)
+    buffer.write(chunk)
+
+
+def _discard(buffer: BinaryIO, path: str) -> None:
+    buffer.close()
+    Path(path).unlink(missing_ok=True)
+
+
+async def save_upload_file(
+    upload_file: UploadFile, destination: str, max_size: int = MAX_FILE_SIZE
+) -> StoredUpload:
     """
-    Save an uploaded file to the specified destination
-    Returns the file path where the file was saved
+    Stream an uploaded file to the specified destination in fixed-size chunks.
+    File I/O and hashing run in the thread pool so the event loop is never
+    blocked, and the upload is rejected as soon as it exceeds max_size.
+    Returns the saved path, size and SHA-256 of the content.
     """
     try:
         # Create directory if it doesn't exist
         directory = Path(destination).parent
-        directory.mkdir(parents=True, exist_ok=True)
+        await run_in_threadpool(directory.mkdir, parents=True, exist_ok=True)
 
-        # Save the file
-        with open(destination, "wb") as buffer:
-            buffer.write(await upload_file.read())
+        digest = hashlib.sha256()
+        size = 0
+        buffer = await run_in_threadpool(open, destination, "wb")
+        try:
+            while chunk := await upload_file.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_size:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"File exceeds the maximum size of {max_size} bytes",
+                    )
+                await run_in_threadpool(_write_chunk, buffer, digest, chunk)
+        except BaseException:
+            await run_in_threadpool(_discard, buffer, destination)
+            raise
+        await run_in_threadpool(buffer.close)
 
-        return destination
+        return StoredUpload(path=destination, size=size, sha256=digest.hexdigest())
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error saving file: {str(e)}")
 
@@ -26,5 +68,7 @@ def generate_unique_filename(email: str, file_type: str, original_filename: str)
     """
     Generate a unique filename for uploaded files
     """
+    # Drop any client-supplied directory components
+    original_filename = Path(original_filename or "upload").name
     safe_filename = f"{email}_{file_type}_{original_filename}".replace(" ", "_")
     return f"uploads/{safe_filename}"
@@ -41,6 +41,12 @@ export const API_ENDPOINTS = {
     USERS: `${API_BASE_URL}/api/admin/users`,
   },
   
+  // Dashboards
+  DASHBOARD: {
+    COUNTS: (email) => `${API_BASE_URL}/dashboard/counts/${email}`,
+    INTERVIEWER: (email) => `${API_BASE_URL}/dashboard/interviewer/${email}`,
+  },
+  
   // Saved Jobs
   SAVED_JOBS: {
     BY_EMAIL: (email) => `${API_BASE_URL}/saved-jobs/${email}`,
@@ -58,4 +64,28 @@ export const API_ENDPOINTS = {
   },
 };
 
+// List endpoints return one page at a time and send the cursor of the next
+// page in X-Next-Cursor. fetchAllPages follows it and returns every item.
+export const NEXT_CURSOR_HEADER = 'X-Next-Cursor';
+export const MAX_PAGE_SIZE = 1000;
+
+export const fetchAllPages = async (url, options = {}) => {
+  const items = [];
+  let cursor = null;
+  do {
+    const pageUrl = new URL(url);
+    pageUrl.searchParams.set('limit', MAX_PAGE_SIZE);
+    if (cursor) {
+      pageUrl.searchParams.set('cursor', cursor);
+    }
+    const response = await fetch(pageUrl, options);
+    if (!response.ok) {
+      throw new Error(`HTTP error! Status: ${response.status}`);
+    }
+    items.push(...(await response.json()));
+    cursor = response.headers.get(NEXT_CURSOR_HEADER);
+  } while (cursor);
+  return items;
+};
+
 export default API_BASE_URL;
@@ -2,6 +2,7 @@ import React, { useState, useEffect } from "react";
 import { FaTrashAlt, FaPlus, FaChevronLeft, FaChevronRight, FaAngleDoubleLeft, FaAngleDoubleRight } from "react-icons/fa";
 import axios from "axios";
 import "./AdminPanel.css";
+import { fetchAllPages } from "../config/api";
 import { toast } from 'react-toastify';
 
 
@@ -27,8 +28,8 @@ const AdminPanel = () => {
   const fetchUsers = async () => {
     try {
       setLoading(true);
-      const response = await axios.get("http://localhost:8000/api/admin/users");
-      setUsers(response.data);
+      const data = await fetchAllPages("http://localhost:8000/api/admin/users");
+      setUsers(data);
       setError(null);
     } catch (err) {
       setError("Failed to fetch users. Please try again.");
@@ -1,6 +1,7 @@
 import React, { useState, useEffect } from "react";
 import { Link } from "react-router-dom";
 import "./ApplicationsPage.css";
+import { fetchAllPages } from "../config/api";
 
 function ApplicationsPage() {
   const [applications, setApplications] = useState([]);
@@ -28,12 +29,7 @@ function ApplicationsPage() {
 
   const fetchApplications = async (email) => {
     try {
-      const response = await fetch(`${process.env.REACT_APP_API_BASE_URL || 'http://localhost:8000'}/job-applications/candidate/${email}`);
-      if (!response.ok) {
-        throw new Error("Failed to fetch applications");
-      }
-      
-      const data = await response.json();
+      const data = await fetchAllPages(`${process.env.REACT_APP_API_BASE_URL || 'http://localhost:8000'}/job-applications/candidate/${email}`);
       setApplications(data);
       setLoading(false);
     } catch (error) {
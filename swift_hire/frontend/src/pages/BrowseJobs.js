@@ -1,6 +1,7 @@
 import React, { useState, useEffect } from "react";
 import { Search, MapPin, Clock, DollarSign, Briefcase } from "lucide-react";
 import "./BrowseJobs.css";
+import { fetchAllPages } from "../config/api";
 
 function BrowseJobs() {
   const [jobs, setJobs] = useState([]);
@@ -36,13 +37,7 @@ function BrowseJobs() {
     const fetchJobs = async () => {
       try {
         setLoading(true);
-        const response = await fetch(`${process.env.REACT_APP_API_BASE_URL || 'http://localhost:8000'}/job-posts`);
-        
-        if (!response.ok) {
-          throw new Error(`HTTP error! Status: ${response.status}`);
-        }
-        
-        const data = await response.json();
+        const data = await fetchAllPages(`${process.env.REACT_APP_API_BASE_URL || 'http://localhost:8000'}/job-posts`);
         setJobs(data);
         setError(null);
       } catch (err) {
@@ -72,13 +67,7 @@ function BrowseJobs() {
   // Fetch candidate's applications
   const fetchCandidateApplications = async (email) => {
     try {
-      const response = await fetch(`http://localhost:8000/job-applications/candidate/${email}`);
-      
-      if (!response.ok) {
-        throw new Error(`HTTP error! Status: ${response.status}`);
-      }
-      
-      const applications = await response.json();
+      const applications = await fetchAllPages(`http://localhost:8000/job-applications/candidate/${email}`);
       
       // Create a map of job_id -> status
       const jobStatusMap = {};
@@ -95,13 +84,7 @@ function BrowseJobs() {
   // Fetch saved jobs
   const fetchSavedJobs = async (email) => {
     try {
-      const response = await fetch(`http://localhost:8000/saved-jobs/${email}`);
-      
-      if (!response.ok) {
-        throw new Error(`HTTP error! Status: ${response.status}`);
-      }
-      
-      const savedJobsData = await response.json();
+      const savedJobsData = await fetchAllPages(`http://localhost:8000/saved-jobs/${email}`);
       setSavedJobs(savedJobsData);
     } catch (error) {
       console.error("Error fetching saved jobs:", error);
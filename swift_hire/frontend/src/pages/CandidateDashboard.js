@@ -1,6 +1,7 @@
 import React, { useState, useEffect } from "react";
 import { Link } from "react-router-dom";
 import "./CandidateDashboard.css";
+import { fetchAllPages } from "../config/api";
 
 function CandidateDashboard() {
   const [candidateData, setCandidateData] = useState({
@@ -48,21 +49,15 @@ function CandidateDashboard() {
       fetchCandidateData(userData.email);
       fetchRecommendedJobs(userData.email);
       fetchSavedJobs(userData.email);
-      fetchSavedJobCount(userData.email);
-      fetchApplicationAndInterviewCount(userData.email);
+      fetchBadgeCounts(userData.email);
+      fetchInterviewCount(userData.email);
     }
   // eslint-disable-next-line react-hooks/exhaustive-deps
   }, []);
 
-  const fetchApplicationAndInterviewCount = async (email) => {
+  const fetchInterviewCount = async (email) => {
     try {
-      const response = await fetch(`http://localhost:8000/job-applications/candidate/${email}`);
-      if (!response.ok) {
-        throw new Error("Failed to fetch application data");
-      }
-      
-      const applications = await response.json();
-      const applicationCount = applications.length;
+      const applications = await fetchAllPages(`http://localhost:8000/job-applications/candidate/${email}`);
       const interviewCount = applications.filter(app => 
         app.interview_form_url && app.status === "Shortlisted"
       ).length;
@@ -71,12 +66,11 @@ function CandidateDashboard() {
         ...prev,
         stats: {
           ...prev.stats,
-          applicationsSubmitted: applicationCount,
           interviewsScheduled: interviewCount
         }
       }));
     } catch (error) {
-      console.error("Error fetching application and interview count:", error);
+      console.error("Error fetching interview count:", error);
     }
   };
   
@@ -152,12 +146,7 @@ function CandidateDashboard() {
 
       const jobs = await response.json();
 
-      const appliedResponse = await fetch(`${process.env.REACT_APP_API_BASE_URL || 'http://localhost:8000'}/job-applications/candidate/${email}`);
-      if (!appliedResponse.ok) {
-        throw new Error("Failed to fetch applied jobs");
-      }
-      
-      const appliedJobs = await appliedResponse.json();
+      const appliedJobs = await fetchAllPages(`${process.env.REACT_APP_API_BASE_URL || 'http://localhost:8000'}/job-applications/candidate/${email}`);
       const appliedJobIds = appliedJobs.map(job => job.job_id);
       
       const filteredJobs = jobs.filter(job => !appliedJobIds.includes(job.id));
@@ -182,12 +171,7 @@ function CandidateDashboard() {
   
   const fetchApplicationStatus = async (email, jobIds) => {
     try {
-      const response = await fetch(`http://localhost:8000/job-applications/candidate/${email}`);
-      if (!response.ok) {
-        throw new Error("Failed to fetch application status");
-      }
-      
-      const applications = await response.json();
+      const applications = await fetchAllPages(`http://localhost:8000/job-applications/candidate/${email}`);
       
       const jobStatusMap = {};
       applications.forEach(app => {
@@ -238,7 +222,7 @@ function CandidateDashboard() {
         [jobId]: "Applied"
       }));
       
-      fetchApplicationAndInterviewCount(userData.email);
+      fetchBadgeCounts(userData.email);
       
       setTimeout(() => {
         setApplyStatus({ message: "", type: "" });
@@ -256,23 +240,18 @@ function CandidateDashboard() {
   
   const fetchSavedJobs = async (email) => {
     try {
-      const response = await fetch(`http://localhost:8000/saved-jobs/${email}`);
-      if (!response.ok) {
-        throw new Error("Failed to fetch saved jobs");
-      }
-      
-      const jobs = await response.json();
+      const jobs = await fetchAllPages(`http://localhost:8000/saved-jobs/${email}`);
       setSavedJobs(jobs);
     } catch (error) {
       console.error("Error fetching saved jobs:", error);
     }
   };
   
-  const fetchSavedJobCount = async (email) => {
+  const fetchBadgeCounts = async (email) => {
     try {
-      const response = await fetch(`http://localhost:8000/saved-jobs/count/${email}`);
+      const response = await fetch(`http://localhost:8000/dashboard/counts/${email}`);
       if (!response.ok) {
-        throw new Error("Failed to fetch saved job count");
+        throw new Error("Failed to fetch dashboard counts");
       }
       
       const data = await response.json();
@@ -280,11 +259,12 @@ function CandidateDashboard() {
         ...prev,
         stats: {
           ...prev.stats,
-          savedJobs: data.count
+          applicationsSubmitted: data.applications,
+          savedJobs: data.saved_jobs
         }
       }));
     } catch (error) {
-      console.error("Error fetching saved job count:", error);
+      console.error("Error fetching dashboard counts:", error);
     }
   };
   
@@ -383,7 +363,7 @@ function CandidateDashboard() {
           throw new Error(errorData.detail || "Failed to unsave job");
         }
         
-        fetchSavedJobCount(userData.email);
+        fetchBadgeCounts(userData.email);
         fetchSavedJobs(userData.email);        
       } else {
         const formData = new FormData();
@@ -400,7 +380,7 @@ function CandidateDashboard() {
           throw new Error(errorData.detail || "Failed to save job");
         }
         
-        fetchSavedJobCount(userData.email);
+        fetchBadgeCounts(userData.email);
         fetchSavedJobs(userData.email);        
       }
     } catch (error) {
@@ -4,6 +4,7 @@ import AOS from "aos";
 import "aos/dist/aos.css";
 import "./CandidateFiltering.css";
 import axios from "axios";
+import { fetchAllPages } from "../config/api";
 import { useNavigate } from "react-router-dom";
 import { FileText } from "lucide-react"; // Choose an icon
 
@@ -85,10 +86,10 @@ const CandidateFiltering = () => {
   // Fetch applications for this interviewer
   const fetchApplications = async (interviewerEmail) => {
     try {
-      const response = await axios.get(`http://localhost:8000/job-applications/interviewer/${interviewerEmail}`);
-      setApplications(response.data);
-      setFilteredApplications(response.data);
-      setTotalPages(Math.ceil(response.data.length / applicationsPerPage));
+      const data = await fetchAllPages(`http://localhost:8000/job-applications/interviewer/${interviewerEmail}`);
+      setApplications(data);
+      setFilteredApplications(data);
+      setTotalPages(Math.ceil(data.length / applicationsPerPage));
     } catch (error) {
       console.error("Error fetching applications:", error);
     } finally {
@@ -1,6 +1,12 @@
 import React, { useState, useEffect } from 'react';
 import './InterviewPage.css';
 
+// Bearer token from login, so the API can identify the interviewer
+const authHeaders = () => {
+    const { accessToken } = JSON.parse(localStorage.getItem("userData") || "{}");
+    return accessToken ? { Authorization: `Bearer ${accessToken}` } : {};
+};
+
 const InterviewPage = ({ applicationId, onBack, userEmail }) => {
     const [applicationData, setApplicationData] = useState(null);
     const [loading, setLoading] = useState(true);
@@ -108,6 +114,7 @@ const InterviewPage = ({ applicationId, onBack, userEmail }) => {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json',
+                    ...authHeaders(),
                 },
                 body: JSON.stringify({
                     application_id: Number(applicationId),
@@ -172,6 +179,7 @@ const InterviewPage = ({ applicationId, onBack, userEmail }) => {
                 method: 'PATCH',
                 headers: {
                     'Content-Type': 'application/json',
+                    ...authHeaders(),
                 },
                 body: JSON.stringify({
                     content: editContent.trim(),
@@ -224,6 +232,7 @@ const InterviewPage = ({ applicationId, onBack, userEmail }) => {
                 method: 'DELETE',
                 headers: {
                     'Content-Type': 'application/json',
+                    ...authHeaders(),
                 },
                 body: JSON.stringify({
                     created_by: effectiveEmail
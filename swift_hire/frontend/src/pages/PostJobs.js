@@ -4,6 +4,7 @@ import "./Registration.css";
 import AOS from "aos";
 import "aos/dist/aos.css";
 import { useNavigate } from "react-router-dom";
+import { fetchAllPages } from "../config/api";
 
 const JobBoard = () => {
   const [userData, setUserData] = useState({
@@ -85,11 +86,7 @@ const JobBoard = () => {
   const fetchJobs = async (email) => {
     setIsLoading(true);
     try {
-      const response = await fetch(`${process.env.REACT_APP_API_BASE_URL || 'http://localhost:8000'}/job-posts/interviewer/${email}`);
-      if (!response.ok) {
-        throw new Error("Failed to fetch job posts");
-      }
-      const data = await response.json();
+      const data = await fetchAllPages(`${process.env.REACT_APP_API_BASE_URL || 'http://localhost:8000'}/job-posts/interviewer/${email}`);
       setJobs(data);
     } catch (error) {
       console.error("Error fetching jobs:", error);
@@ -214,7 +214,8 @@ const Registration = () => {
       const userData = {
         name: result.name,
         email: result.email,
-        role: result.role
+        role: result.role,
+        accessToken: result.access_token
       };
       localStorage.setItem("userData", JSON.stringify(userData));
 